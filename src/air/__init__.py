@@ -1,12 +1,9 @@
 """A FastAPI-powered breath of fresh air in Python web development."""
 
-from importlib.metadata import version
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 from fastapi import Query as Query
-from staticware import (
-    HashedStatic as HashedStatic,
-    StaticRewriteMiddleware as StaticRewriteMiddleware,
-)
 
 from air.field import AirField as AirField
 from air.form import AirForm as AirForm
@@ -15,8 +12,10 @@ from air.model import (
     AirModel as AirModel,
     MultipleObjectsReturned as MultipleObjectsReturned,
 )
+from air.table import AirTable as AirTable
 
 from . import (
+    cache as cache,
     layouts as layouts,
     responses as responses,
 )
@@ -25,6 +24,11 @@ from .applications import (
     AirRoute as AirRoute,
 )
 from .background import BackgroundTasks as BackgroundTasks
+from .broadcast import (
+    Broadcast as Broadcast,
+    SSEHub as SSEHub,
+)
+from .coalescing import singleflight as singleflight
 from .dependencies import is_htmx_request as is_htmx_request
 from .exceptions import (
     HTTPException as HTTPException,
@@ -37,6 +41,7 @@ from .requests import (
 from .responses import (
     AirResponse as AirResponse,
     RedirectResponse as RedirectResponse,
+    SSEEvent as SSEEvent,
     SSEResponse as SSEResponse,
     TagResponse as TagResponse,
 )
@@ -167,9 +172,52 @@ from .tags import (
     Wbr as Wbr,
     svg as svg,
 )
-from .templating import (
-    JinjaRenderer as JinjaRenderer,
-    Renderer as Renderer,
+from .websockets import (
+    AirWebSocket as AirWebSocket,
+    WebSocket as WebSocket,
+    WebSocketDisconnect as WebSocketDisconnect,
 )
 
-__version__ = version("air")
+if TYPE_CHECKING:
+    from staticware import (
+        HashedStatic as HashedStatic,
+        StaticRewriteMiddleware as StaticRewriteMiddleware,
+    )
+
+    from .templating import (
+        JinjaRenderer as JinjaRenderer,
+        Renderer as Renderer,
+    )
+
+    __version__: str
+
+
+def __getattr__(name: str) -> Any:
+    """Import optional subsystems on first attribute access (PEP 562).
+
+    Keeps Jinja, staticware, and package metadata out of `import air`
+    for apps that never use them.
+
+    Returns:
+        The requested attribute, cached in the module namespace afterwards.
+
+    Raises:
+        AttributeError: If the name is not a lazily exported attribute.
+    """
+    lazy_attributes = {
+        "HashedStatic": "staticware",
+        "StaticRewriteMiddleware": "staticware",
+        "JinjaRenderer": "air.templating",
+        "Renderer": "air.templating",
+    }
+    if name == "__version__":
+        from importlib.metadata import version  # noqa: PLC0415
+
+        value = version("air")
+    elif name in lazy_attributes:
+        value = getattr(import_module(lazy_attributes[name]), name)
+    else:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    globals()[name] = value
+    return value
@@ -7,7 +7,7 @@ from collections.abc import AsyncIterator, Callable, Sequence
 from contextlib import asynccontextmanager
 from enum import Enum
 from pathlib import Path
-from typing import Annotated, Any, Literal
+from typing import TYPE_CHECKING, Annotated, Any, Literal
 from warnings import deprecated
 
 from fastapi import FastAPI, routing
@@ -23,6 +23,9 @@ from .exception_handlers import DEFAULT_EXCEPTION_HANDLERS, ExceptionHandlersTyp
 from .responses import AirResponse
 from .routing import AirRoute, AirRouter, RouterMixin
 
+if TYPE_CHECKING:
+    from .templating import JinjaRenderer
+
 
 class Air(RouterMixin):
     """Air web framework - HTML-first web apps powered by FastAPI.
@@ -329,12 +332,29 @@ class Air(RouterMixin):
             self.mount("/static", self.static, name="static")
             self.add_middleware(StaticRewriteMiddleware, static=self.static)
 
-        # Always create a JinjaRenderer pointing at templates/.
-        # If the directory doesn't exist, construction succeeds but
-        # rendering raises a clear TemplateNotFound error.
-        from .templating import JinjaRenderer  # noqa: PLC0415
+        # A JinjaRenderer pointing at templates/ is created on first access of app.jinja,
+        # so apps that never render Jinja don't import it.
+        self._jinja: JinjaRenderer | None = None
+
+    @property
+    def jinja(self) -> "JinjaRenderer":
+        """The app's JinjaRenderer for the templates/ directory.
+
+        Always available. If the directory doesn't exist, construction
+        succeeds but rendering raises a clear TemplateNotFound error.
+        Templates are compiled in every process. To let workers and reloads
+        reuse compiled templates, assign a renderer with a bytecode cache:
+        ``app.jinja = JinjaRenderer("templates", bytecode_cache=True)``.
+        """
+        if self._jinja is None:
+            from .templating import JinjaRenderer  # noqa: PLC0415
+
+            self._jinja = JinjaRenderer("templates")
+        return self._jinja
 
-        self.jinja = JinjaRenderer("templates")
+    @jinja.setter
+    def jinja(self, value: "JinjaRenderer") -> None:
+        self._jinja = value
 
     # =========================================================================
     # Database auto-discovery
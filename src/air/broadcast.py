@@ -0,0 +1,250 @@
+"""Fan out Server-Sent Events from one publisher to many subscribers."""
+
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal, Protocol
+
+import anyio
+
+from .responses import SSEEvent, SSEResponse
+
+if TYPE_CHECKING:
+    from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+
+type BroadcastOverflowPolicy = Literal["drop", "close"]
+"""What happens when a subscriber's buffer is full: discard the event for it, or disconnect it."""
+
+DEFAULT_CHANNEL = "default"
+
+
+class BroadcastBackend(Protocol):
+    """Transport that carries encoded frames from publishers to a `Broadcast` hub.
+
+    `attach` is called once by the hub with a `deliver` callback; the backend
+    calls `deliver(channel, frame)` for every frame it receives. A networked
+    backend (Redis pub/sub, Postgres LISTEN/NOTIFY) would publish remotely and
+    call `deliver` from its listener task.
+    """
+
+    def attach(self, deliver: Callable[[str, bytes], None]) -> None: ...
+
+    async def publish(self, channel: str, frame: bytes) -> None: ...
+
+
+class MemoryBackend:
+    """In-process backend: frames published are delivered to local subscribers immediately."""
+
+    def __init__(self) -> None:
+        self._deliver: Callable[[str, bytes], None] | None = None
+
+    def attach(self, deliver: Callable[[str, bytes], None]) -> None:
+        self._deliver = deliver
+
+    async def publish(self, channel: str, frame: bytes) -> None:
+        if self._deliver is not None:
+            self._deliver(channel, frame)
+
+
+class Subscriber:
+    """One subscriber's buffer of encoded frames on a channel."""
+
+    def __init__(self, channel: str, max_queue: int) -> None:
+        self.channel = channel
+        self.dropped = 0
+        self._send: MemoryObjectSendStream[bytes]
+        self._receive: MemoryObjectReceiveStream[bytes]
+        self._send, self._receive = anyio.create_memory_object_stream[bytes](max_queue)
+
+    @property
+    def lag(self) -> int:
+        """Number of frames buffered and not yet read."""
+        return self._send.statistics().current_buffer_used
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._receive.__aiter__()
+
+    def send_nowait(self, frame: bytes) -> None:
+        """Buffer a frame, raising `anyio.WouldBlock` when the buffer is full."""
+        self._send.send_nowait(frame)
+
+    def disconnect(self) -> None:
+        """Stop accepting frames; iteration ends once the buffer is drained."""
+        self._send.close()
+
+    def close(self) -> None:
+        self._send.close()
+        self._receive.close()
+
+
+@dataclass(frozen=True, slots=True)
+class BroadcastStats:
+    """Point-in-time metrics for a `Broadcast` hub."""
+
+    channels: int
+    subscribers: int
+    published: int
+    dropped: int
+    disconnected: int
+    max_lag: int
+
+
+class Broadcast:
+    """Publish an event once and fan it out, as shared bytes, to every subscriber.
+
+    Each published item is rendered and encoded into an SSE frame a single
+    time; every subscriber on the channel receives the same `bytes` object in
+    its own bounded buffer. A full buffer never blocks the publisher: the
+    event is dropped for that subscriber, or with `overflow="close"` the slow
+    subscriber is disconnected.
+
+    Example:
+
+        import air
+
+        app = air.Air()
+        hub = air.Broadcast()
+
+
+        @app.get("/scores")
+        async def scores() -> air.SSEResponse:
+            return hub.response("scores")
+
+
+        @app.post("/goal")
+        async def goal() -> air.P:
+            await hub.publish(air.Li("Goal!"), channel="scores")
+            return air.P("Published")
+
+    Args:
+        max_queue: Frames buffered per subscriber before the overflow policy applies.
+        overflow: `"drop"` discards the frame for a full subscriber, `"close"` disconnects it.
+        event: Event name used for published items that are not an `SSEEvent`.
+        backend: Transport for published frames, defaults to `MemoryBackend`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_queue: int = 64,
+        overflow: BroadcastOverflowPolicy = "drop",
+        event: str | None = "message",
+        backend: BroadcastBackend | None = None,
+    ) -> None:
+        if max_queue < 1:
+            msg = "max_queue must be at least 1"
+            raise ValueError(msg)
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self.event = event
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.backend.attach(self.deliver)
+        self._channels: dict[str, set[Subscriber]] = {}
+        self._published = 0
+        self._dropped = 0
+        self._disconnected = 0
+
+    def encode(self, data: Any) -> bytes:
+        """Encode a published item as an SSE frame.
+
+        Returns:
+            The frame, or `data` itself when it is already bytes.
+        """
+        if isinstance(data, bytes):
+            return data
+        if isinstance(data, SSEEvent):
+            return data.encode(default_event=self.event)
+        return SSEEvent(data).encode(default_event=self.event)
+
+    async def publish(self, data: Any, *, channel: str = DEFAULT_CHANNEL) -> None:
+        """Render and encode `data` once, then send it to every subscriber of `channel`."""
+        await self.backend.publish(channel, self.encode(data))
+
+    def deliver(self, channel: str, frame: bytes) -> None:
+        """Copy a frame into the buffer of each local subscriber; called by the backend."""
+        self._published += 1
+        for subscriber in tuple(self._channels.get(channel, ())):
+            try:
+                subscriber.send_nowait(frame)
+            except anyio.WouldBlock:
+                self._dropped += 1
+                subscriber.dropped += 1
+                if self.overflow == "close":
+                    self._disconnected += 1
+                    self._remove(subscriber)
+                    subscriber.disconnect()
+            except anyio.BrokenResourceError:
+                self._remove(subscriber)
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str = DEFAULT_CHANNEL) -> AsyncGenerator[Subscriber]:
+        """Register a subscriber on `channel` for the duration of the block.
+
+        Yields:
+            The subscriber; iterate it to receive encoded frames.
+        """
+        subscriber = Subscriber(channel, self.max_queue)
+        self._channels.setdefault(channel, set()).add(subscriber)
+        try:
+            yield subscriber
+        finally:
+            self._remove(subscriber)
+            subscriber.close()
+
+    async def listen(self, channel: str = DEFAULT_CHANNEL) -> AsyncIterator[bytes]:
+        """Yield encoded frames published on `channel` until the subscriber is closed.
+
+        Yields:
+            Encoded SSE frames.
+        """
+        async with self.subscribe(channel) as subscriber:
+            async for frame in subscriber:
+                yield frame
+
+    def response(self, channel: str = DEFAULT_CHANNEL, **kwargs: Any) -> SSEResponse:
+        """Return an `SSEResponse` streaming everything published on `channel`.
+
+        Keyword arguments are passed to `SSEResponse`, e.g. `ping=15`.
+
+        Returns:
+            A streaming response subscribed to the channel.
+        """
+        return SSEResponse(self.listen(channel), **kwargs)
+
+    def subscriber_count(self, channel: str | None = None) -> int:
+        """Return the number of subscribers on `channel`, or on all channels when omitted.
+
+        Returns:
+            The subscriber count.
+        """
+        if channel is not None:
+            return len(self._channels.get(channel, ()))
+        return sum(len(subscribers) for subscribers in self._channels.values())
+
+    def stats(self) -> BroadcastStats:
+        """Return subscriber counts, totals and the largest per-subscriber lag.
+
+        Returns:
+            A snapshot of the hub's metrics.
+        """
+        subscribers = [subscriber for channel in self._channels.values() for subscriber in channel]
+        return BroadcastStats(
+            channels=len(self._channels),
+            subscribers=len(subscribers),
+            published=self._published,
+            dropped=self._dropped,
+            disconnected=self._disconnected,
+            max_lag=max((subscriber.lag for subscriber in subscribers), default=0),
+        )
+
+    def _remove(self, subscriber: Subscriber) -> None:
+        subscribers = self._channels.get(subscriber.channel)
+        if subscribers is None:
+            return
+        subscribers.discard(subscriber)
+        if not subscribers:
+            del self._channels[subscriber.channel]
+
+
+SSEHub = Broadcast
+"""Alias for `Broadcast`; use it if it improves clarity."""
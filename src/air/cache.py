@@ -0,0 +1,478 @@
+"""Full-page response caching that understands HTMX.
+
+HTMX requests for the same URL can return different HTML: a boosted
+navigation gets a fragment where a normal request gets the whole layout
+(see `air.layouts.mvpcss(is_htmx=...)`). `PageCacheMiddleware` therefore
+keys cached pages on the path, the query string and the HTMX request
+headers, and adds those headers to the response's `Vary`.
+
+Example:
+
+    import air
+    from air.cache import PageCacheMiddleware
+
+    app = air.Air()
+    app.add_middleware(PageCacheMiddleware)
+
+
+    @app.page(cache_ttl=60, stale_while_revalidate=300)
+    def catalog(request: air.Request) -> air.Html | air.Children:
+        return air.layouts.mvpcss(air.H1("Catalog"), is_htmx=request.htmx.is_hx_request)
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final, Protocol
+
+import anyio
+import anyio.to_thread
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .requests import HX_BOOSTED, HX_HISTORY_RESTORE_REQUEST, HX_REQUEST, HX_TARGET
+
+HTMX_VARY_HEADERS: Final[tuple[str, ...]] = (HX_REQUEST, HX_BOOSTED, HX_TARGET, HX_HISTORY_RESTORE_REQUEST)
+"""Request headers that change what an Air page renders, and so are part of the cache key."""
+
+CACHE_STATUS_HEADER: Final = "x-cache"
+"""Response header reporting `HIT`, `STALE` or `MISS`."""
+
+_UNCACHEABLE_DIRECTIVES: Final = frozenset({"no-store", "private", "no-cache"})
+
+_EVICT_TO: Final = 0.9
+"""Fraction of its limits a full `DiskCacheBackend` evicts down to, so it rescans rarely."""
+
+
+@dataclass(frozen=True, slots=True)
+class PageCachePolicy:
+    """How long a route's pages are cached, attached to endpoints by the route decorators."""
+
+    ttl: float
+    stale_while_revalidate: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class CachedPage:
+    """A complete response stored by `PageCacheMiddleware`."""
+
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+    created: float
+    ttl: float
+    stale_while_revalidate: float = 0.0
+
+    def age(self, now: float) -> float:
+        return now - self.created
+
+    def is_fresh(self, now: float) -> bool:
+        return self.age(now) < self.ttl
+
+    def is_usable(self, now: float) -> bool:
+        """Fresh, or stale but still inside the stale-while-revalidate window."""
+        return self.age(now) < self.ttl + self.stale_while_revalidate
+
+
+class CacheBackend(Protocol):
+    """Storage for cached pages. Implementations must be safe to call from the event loop."""
+
+    async def get(self, key: str) -> CachedPage | None: ...
+
+    async def set(self, key: str, page: CachedPage) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+    async def clear(self) -> None: ...
+
+
+class MemoryCacheBackend:
+    """Per-process LRU cache of pages.
+
+    Args:
+        max_entries: Least recently used pages are evicted beyond this many.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._pages: OrderedDict[str, CachedPage] = OrderedDict()
+
+    async def get(self, key: str) -> CachedPage | None:
+        page = self._pages.get(key)
+        if page is not None:
+            self._pages.move_to_end(key)
+        return page
+
+    async def set(self, key: str, page: CachedPage) -> None:
+        self._pages[key] = page
+        self._pages.move_to_end(key)
+        while len(self._pages) > self.max_entries:
+            self._pages.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._pages.pop(key, None)
+
+    async def clear(self) -> None:
+        self._pages.clear()
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+
+class DiskCacheBackend:
+    """Cache pages as files, shared by every worker process on the machine.
+
+    Each page is one file named after a hash of its key: a JSON header line
+    followed by the raw body. Files are written atomically and read and
+    written in a worker thread. A page that is past its stale window is
+    deleted when it is read.
+
+    The backend keeps a running count of the files and bytes it has
+    written. When a write takes it past `max_entries` or `max_bytes`, it
+    rescans the directory and deletes the least recently used files
+    until the directory is at 90% of its limits; a read counts as a
+    use. Other workers' writes are only seen by the rescan, so a shared
+    directory can briefly run over its limits.
+
+    Args:
+        directory: Where cache files are stored; created if missing.
+        max_entries: Most pages kept on disk, or `None` for no limit.
+        max_bytes: Most bytes of cache files kept on disk, or `None` for no limit.
+    """
+
+    def __init__(
+        self, directory: str | os.PathLike[str], *, max_entries: int | None = 10_000, max_bytes: int | None = None
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Files and bytes on disk as last scanned plus this process's writes; None until the first scan
+        self._entries: int | None = None
+        self._bytes = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.page"
+
+    def _read(self, key: str) -> CachedPage | None:
+        path = self._path(key)
+        try:
+            meta, _, body = path.read_bytes().partition(b"\n")
+            data = json.loads(meta)
+        except (OSError, ValueError):
+            return None
+        if data.get("key") != key:
+            return None
+        page = CachedPage(
+            status=data["status"],
+            headers=[(name.encode("latin-1"), value.encode("latin-1")) for name, value in data["headers"]],
+            body=body,
+            created=data["created"],
+            ttl=data["ttl"],
+            stale_while_revalidate=data["stale_while_revalidate"],
+        )
+        if not page.is_usable(time.time()):
+            self._unlink(path)
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return page
+
+    def _write(self, key: str, page: CachedPage) -> None:
+        meta = {
+            "key": key,
+            "status": page.status,
+            "headers": [(name.decode("latin-1"), value.decode("latin-1")) for name, value in page.headers],
+            "created": page.created,
+            "ttl": page.ttl,
+            "stale_while_revalidate": page.stale_while_revalidate,
+        }
+        header = json.dumps(meta).encode() + b"\n"
+        path = self._path(key)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            file.write(header)
+            file.write(page.body)
+        try:
+            replaced = path.stat().st_size
+        except OSError:
+            replaced = None
+        Path(tmp).replace(path)
+        if self.max_entries is None and self.max_bytes is None:
+            return
+        with self._lock:
+            if self._entries is not None:
+                if replaced is None:
+                    self._entries += 1
+                self._bytes += len(header) + len(page.body) - (replaced or 0)
+                if not self._over(self._entries, self._bytes, 1.0):
+                    return
+            self._evict()
+
+    def _over(self, entries: int, size: int, fraction: float) -> bool:
+        return (self.max_entries is not None and entries > self.max_entries * fraction) or (
+            self.max_bytes is not None and size > self.max_bytes * fraction
+        )
+
+    def _evict(self) -> None:
+        """Rescan the directory and, if it is over its limits, delete the least recently used pages.
+
+        Called with `_lock` held.
+        """
+        files: list[tuple[int, int, str]] = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".page"):
+                    with contextlib.suppress(OSError):
+                        stat = entry.stat()
+                        files.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        count = len(files)
+        size = sum(file_size for _, file_size, _ in files)
+        if self._over(count, size, 1.0):
+            files.sort()
+            for _, file_size, path in files:
+                if not self._over(count, size, _EVICT_TO):
+                    break
+                Path(path).unlink(missing_ok=True)
+                count -= 1
+                size -= file_size
+        self._entries, self._bytes = count, size
+
+    def _unlink(self, path: Path) -> None:
+        """Delete a page file, keeping the running totals in step."""
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except OSError:
+            return
+        with self._lock:
+            if self._entries is not None:
+                self._entries -= 1
+                self._bytes -= size
+
+    async def get(self, key: str) -> CachedPage | None:
+        return await anyio.to_thread.run_sync(self._read, key)
+
+    async def set(self, key: str, page: CachedPage) -> None:
+        await anyio.to_thread.run_sync(self._write, key, page)
+
+    async def delete(self, key: str) -> None:
+        await anyio.to_thread.run_sync(self._unlink, self._path(key))
+
+    async def clear(self) -> None:
+        def _clear() -> None:
+            for path in self.directory.glob("*.page"):
+                self._unlink(path)
+
+        await anyio.to_thread.run_sync(_clear)
+
+
+def is_anonymous(scope: Scope) -> bool:
+    """Default cacheability check: the request carries no cookies or credentials.
+
+    Returns:
+        True if the request has neither a `Cookie` nor an `Authorization` header.
+    """
+    headers = Headers(scope=scope)
+    return "cookie" not in headers and "authorization" not in headers
+
+
+class PageCacheMiddleware:
+    """Cache full GET responses, keyed on scheme, host, path, query string and HTMX headers.
+
+    Routes opt in with `cache_ttl=` (and optionally `stale_while_revalidate=`)
+    on their decorator; `ttl` sets a default for every other route. Only
+    successful responses without `Set-Cookie` or a
+    `Cache-Control: private/no-store/no-cache` directive are stored.
+    Streamed responses, those without a `Content-Length`, are passed
+    through untouched unless `cache_streaming` is set; server-sent
+    events never are.
+
+    - A stale page inside its stale-while-revalidate window is served
+      immediately and refreshed once the response has been sent.
+    - Concurrent misses for the same key are coalesced: one request renders
+      while the others wait for its result.
+
+    Args:
+        app: The ASGI app to wrap.
+        backend: Page storage, defaults to `MemoryCacheBackend()`.
+        ttl: Default TTL in seconds for routes that do not set `cache_ttl`.
+            `None` caches only routes that opt in.
+        stale_while_revalidate: Default stale window in seconds.
+        vary: Request headers that are part of the cache key.
+        cacheable: Decides per request whether the cache applies, defaults
+            to anonymous requests only.
+        cache_streaming: Also cache streamed responses, buffering each
+            body in memory until it is complete.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        backend: CacheBackend | None = None,
+        ttl: float | None = None,
+        stale_while_revalidate: float = 0.0,
+        vary: Sequence[str] = HTMX_VARY_HEADERS,
+        cacheable: Callable[[Scope], bool] = is_anonymous,
+        cache_streaming: bool = False,
+    ) -> None:
+        self.app = app
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.default_policy = PageCachePolicy(ttl, stale_while_revalidate) if ttl is not None else None
+        self.vary = tuple(header.lower() for header in vary)
+        self.cacheable = cacheable
+        self.cache_streaming = cache_streaming
+        self._inflight: dict[str, anyio.Event] = {}
+        self._revalidating: set[str] = set()
+
+    def cache_key(self, scope: Scope) -> str:
+        """Build the cache key for a request.
+
+        Returns:
+            The key: scheme, host, path, query string and the values of
+            the `vary` headers.
+        """
+        headers = Headers(scope=scope)
+        query = scope.get("query_string", b"").decode("latin-1")
+        varying = "&".join(f"{name}={headers.get(name, '')}" for name in self.vary)
+        host = headers.get("host", "")
+        return f"{scope.get('scheme', 'http')}://{host}{scope.get('root_path', '')}{scope['path']}?{query}#{varying}"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET" or not self.cacheable(scope):
+            await self.app(scope, receive, send)
+            return
+
+        key = self.cache_key(scope)
+        page = await self.backend.get(key)
+        now = time.time()
+        if page is not None and page.is_fresh(now):
+            await self._send_page(page, send, "HIT", now)
+            return
+        if page is not None and page.is_usable(now):
+            await self._send_page(page, send, "STALE", now)
+            if key not in self._revalidating:
+                await self._revalidate(key, scope)
+            return
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            await inflight.wait()
+            page = await self.backend.get(key)
+            now = time.time()
+            if page is not None and page.is_usable(now):
+                await self._send_page(page, send, "HIT", now)
+                return
+            await self.app(scope, receive, send)
+            return
+
+        self._inflight[key] = anyio.Event()
+        try:
+            await self._render(key, scope, receive, send)
+        finally:
+            self._inflight.pop(key).set()
+
+    async def _render(self, key: str, scope: Scope, receive: Receive, send: Send) -> None:
+        """Call the app, forwarding its response while capturing it for the cache."""
+        start: Message = {}
+        body: list[bytes] = []
+        policy: PageCachePolicy | None = None
+
+        async def capture(message: Message) -> None:
+            nonlocal start, policy
+            if message["type"] == "http.response.start":
+                policy = self._policy_for(scope, message)
+                if policy is not None:
+                    headers = MutableHeaders(scope=message)
+                    self._add_vary(headers)
+                    headers[CACHE_STATUS_HEADER] = "MISS"
+                    start = message
+            elif message["type"] == "http.response.body" and policy is not None:
+                body.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    await self.backend.set(
+                        key,
+                        CachedPage(
+                            status=start["status"],
+                            headers=[
+                                (name, value)
+                                for name, value in start.get("headers", [])
+                                if name.lower() != CACHE_STATUS_HEADER.encode()
+                            ],
+                            body=b"".join(body),
+                            created=time.time(),
+                            ttl=policy.ttl,
+                            stale_while_revalidate=policy.stale_while_revalidate,
+                        ),
+                    )
+            await send(message)
+
+        await self.app(scope, receive, capture)
+
+    async def _revalidate(self, key: str, scope: Scope) -> None:
+        """Re-render a stale page after its response was sent, discarding the output."""
+        self._revalidating.add(key)
+        request_sent = False
+
+        async def receive() -> Message:
+            nonlocal request_sent
+            if request_sent:
+                await anyio.sleep_forever()
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def discard(message: Message) -> None:
+            pass
+
+        try:
+            await self._render(key, dict(scope), receive, discard)
+        finally:
+            self._revalidating.discard(key)
+
+    def _policy_for(self, scope: Scope, start: Message) -> PageCachePolicy | None:
+        """Decide whether a response can be cached, using the matched route's policy.
+
+        Returns:
+            The policy to store the page with, or None if it must not be cached.
+        """
+        policy = getattr(scope.get("endpoint"), "page_cache", None) or self.default_policy
+        if policy is None or policy.ttl <= 0 or start["status"] != 200:
+            return None
+        headers = Headers(raw=start.get("headers", []))
+        if "set-cookie" in headers or headers.get("content-type", "").startswith("text/event-stream"):
+            return None
+        if "content-length" not in headers and not self.cache_streaming:
+            return None
+        directives = {
+            directive.strip().split("=")[0].lower() for directive in headers.get("cache-control", "").split(",")
+        }
+        if directives & _UNCACHEABLE_DIRECTIVES:
+            return None
+        return policy
+
+    def _add_vary(self, headers: MutableHeaders) -> None:
+        present = {value.strip().lower() for value in headers.get("vary", "").split(",") if value.strip()}
+        if "*" in present:
+            return
+        for name in self.vary:
+            if name not in present:
+                headers.add_vary_header(name)
+
+    async def _send_page(self, page: CachedPage, send: Send, cache_status: str, now: float) -> None:
+        headers = [
+            *page.headers,
+            (CACHE_STATUS_HEADER.encode(), cache_status.encode()),
+            (b"age", str(int(page.age(now))).encode()),
+        ]
+        await send({"type": "http.response.start", "status": page.status, "headers": headers})
+        await send({"type": "http.response.body", "body": page.body, "more_body": False})
@@ -17,6 +17,8 @@ from rich.console import Console
 import air
 
 app = typer.Typer(add_completion=False, rich_markup_mode="rich")
+templates_app = typer.Typer(help="Work with Jinja templates.", no_args_is_help=True)
+app.add_typer(templates_app, name="templates")
 console = Console()
 
 # Suppress uvicorn's startup noise, keep request logs
@@ -194,6 +196,43 @@ def _print_check_result(result: CheckResult) -> None:
     console.print()
 
 
+@templates_app.command("compile")
+def compile_templates(
+    directory: Annotated[
+        Path,
+        typer.Argument(help="Template directory to compile"),
+    ] = Path("templates"),
+    *,
+    output: Annotated[
+        Path | None,
+        typer.Option(help="Zip file or directory to write [default: <directory>.zip, or <directory>_compiled]"),
+    ] = None,
+    zip: Annotated[  # noqa: A002 - CLI flag name
+        bool,
+        typer.Option(help="Write a zip file instead of a directory of modules"),
+    ] = True,
+) -> None:
+    """Precompile Jinja templates to Python code.
+
+    Load the output with [bold]air.JinjaRenderer(env=air.templating.compiled_environment(path))[/bold].
+    """  # noqa: DOC501
+    from air.templating import compile_templates as compile_template_tree  # noqa: PLC0415
+
+    if not directory.is_dir():
+        console.print(f"  [red]Template directory not found:[/red] {directory}")
+        raise typer.Exit(code=1)
+    if output is None:
+        output = directory.with_name(f"{directory.name}.zip" if zip else f"{directory.name}_compiled")
+
+    try:
+        names = compile_template_tree(directory, output, zip=zip)
+    except Exception as exc:  # noqa: BLE001
+        console.print(f"  [red]Could not compile templates:[/red] {exc}")
+        raise typer.Exit(code=1) from None
+
+    console.print(f"  [green]Compiled {len(names)} template{'s' if len(names) != 1 else ''}[/green] to {output}")
+
+
 def main() -> None:
     """Entry point for the Air CLI."""
     app()
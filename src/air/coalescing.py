@@ -0,0 +1,149 @@
+"""Deduplicate identical in-flight requests so concurrent callers share one render."""
+
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, overload
+
+import anyio
+from starlette.requests import Request
+from starlette.responses import Response
+
+from .cache import HTMX_VARY_HEADERS
+
+SINGLEFLIGHT_METHODS = frozenset({"GET", "HEAD"})
+
+SINGLEFLIGHT_VARY_HEADERS: tuple[str, ...] = (*HTMX_VARY_HEADERS, "cookie", "authorization")
+"""Default identity headers: the HTMX headers plus the credentials, so different users never share a render."""
+
+
+@dataclass(slots=True)
+class _Call:
+    done: anyio.Event = field(default_factory=anyio.Event)
+    response: Response | None = None
+
+
+@dataclass(slots=True)
+class SingleFlight:
+    """Per-route request coalescing, attached to endpoints by `singleflight` or the route decorators.
+
+    While a GET or HEAD request is being handled, identical requests (same
+    method, scheme, host, path, query string and `vary` header values) wait for it instead
+    of calling the handler again, then receive a copy of its response. The
+    default `vary` includes `Cookie` and `Authorization`, so only requests
+    made with the same credentials are coalesced. A
+    response that cannot be shared safely (streaming, or carrying
+    `Set-Cookie`) and a handler that raises make the waiters call the
+    handler themselves. Background tasks run only for the first request.
+    """
+
+    vary: tuple[str, ...] = SINGLEFLIGHT_VARY_HEADERS
+    _inflight: dict[tuple[str, ...], _Call] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.vary = tuple(header.lower() for header in self.vary)
+
+    def key(self, request: Request) -> tuple[str, ...]:
+        """Build the identity of a request.
+
+        Returns:
+            The method, scheme, host, path, query string and the values of
+            the `vary` headers.
+        """
+        headers = request.headers
+        return (
+            request.method,
+            request.url.scheme,
+            request.url.netloc,
+            request.url.path,
+            request.url.query,
+            *(headers.get(name, "") for name in self.vary),
+        )
+
+    async def __call__(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+        """Handle `request`, or wait for an identical one already in flight and share its response.
+
+        Returns:
+            The handler's response, or a copy of the in-flight request's response.
+        """
+        if request.method not in SINGLEFLIGHT_METHODS:
+            return await call_next(request)
+
+        key = self.key(request)
+        call = self._inflight.get(key)
+        if call is not None:
+            await call.done.wait()
+            if call.response is not None:
+                return _copy_response(call.response)
+            return await call_next(request)
+
+        call = self._inflight[key] = _Call()
+        try:
+            response = await call_next(request)
+            if isinstance(getattr(response, "body", None), bytes) and "set-cookie" not in response.headers:
+                call.response = response
+            return response
+        finally:
+            del self._inflight[key]
+            call.done.set()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct requests currently being handled."""
+        return len(self._inflight)
+
+
+def _copy_response(response: Response) -> Response:
+    """Return a response with the same status, headers and body bytes, without background tasks.
+
+    Returns:
+        A new response sharing `response.body`.
+    """
+    shared = Response(status_code=response.status_code)
+    shared.body = response.body
+    shared.raw_headers = list(response.raw_headers)
+    return shared
+
+
+@overload
+def singleflight[F: Callable[..., Any]](func: F, /) -> F: ...
+
+
+@overload
+def singleflight[F: Callable[..., Any]](*, vary: Sequence[str] = ...) -> Callable[[F], F]: ...
+
+
+def singleflight[F: Callable[..., Any]](
+    func: F | None = None, /, *, vary: Sequence[str] = SINGLEFLIGHT_VARY_HEADERS
+) -> F | Callable[[F], F]:
+    """Mark a route handler so identical concurrent requests share one render.
+
+    Apply it below the route decorator. `vary` lists the request headers
+    that change the handler's output; it defaults to the HTMX headers plus
+    `cookie` and `authorization`. Leave those two out only when the output
+    is the same for every user. Sync handlers, which run in the threadpool,
+    and async handlers are both supported.
+
+    Returns:
+        The handler, unchanged apart from its coalescing settings.
+
+    Example:
+
+        import air
+
+        app = air.Air()
+
+
+        @app.get("/leaderboard")
+        @air.singleflight(vary=[*air.coalescing.SINGLEFLIGHT_VARY_HEADERS, "accept-language"])
+        async def leaderboard(request: air.Request) -> air.Table:
+            return render_leaderboard(await load_scores())
+    """
+
+    def decorator(func: F) -> F:
+        endpoint: Any = func
+        endpoint.singleflight = SingleFlight(vary=tuple(vary))
+        return func
+
+    if func is None:
+        return decorator
+    return decorator(func)
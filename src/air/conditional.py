@@ -0,0 +1,163 @@
+"""Conditional GET support: ETag/Last-Modified validators and 304 Not Modified responses."""
+
+import hashlib
+import inspect
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from fastapi import status
+from starlette.requests import Request
+from starlette.responses import Response
+
+type ETagFunction = Callable[[Request], str | Awaitable[str]]
+"""Returns a version key for the resource; called before the handler runs."""
+
+type LastModifiedFunction = Callable[[Request], datetime | Awaitable[datetime]]
+"""Returns when the resource last changed; called before the handler runs."""
+
+SAFE_METHODS = frozenset({"GET", "HEAD"})
+
+
+def body_etag(body: bytes) -> str:
+    """Return a strong ETag derived from a hash of the response body.
+
+    Returns:
+        The quoted ETag, e.g. `"9a0364b9e99bb480dd25e1f0284c8555"`.
+    """
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def quote_etag(value: str) -> str:
+    """Quote a version key as an ETag, leaving already quoted or weak ETags untouched.
+
+    Returns:
+        The ETag header value.
+    """
+    if value.startswith(('"', 'W/"')):
+        return value
+    return f'"{value}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an `If-None-Match` header against an ETag using weak comparison.
+
+    Returns:
+        True if the header is `*` or lists an ETag equivalent to `etag`.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+def http_date(moment: datetime) -> str:
+    """Format a datetime as an HTTP date. Naive datetimes are treated as UTC.
+
+    Returns:
+        The date in IMF-fixdate form, e.g. `Sun, 06 Nov 1994 08:49:37 GMT`.
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return format_datetime(moment.astimezone(UTC), usegmt=True)
+
+
+def not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    """Check an `If-Modified-Since` header against a modification time, to the second.
+
+    Dates without a zone, such as asctime or `-0000` forms, and naive
+    modification times are treated as UTC. A header that cannot be
+    parsed or compared never matches.
+
+    Returns:
+        True if the resource has not changed since the date in the header.
+    """
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=UTC)
+        return last_modified.replace(microsecond=0) <= since
+    except (TypeError, ValueError, OverflowError):
+        return False
+
+
+async def _resolve(func: Callable[[Request], Any], request: Request) -> Any:
+    result = func(request)
+    if inspect.isawaitable(result):
+        return await result
+    return result
+
+
+@dataclass(frozen=True, slots=True)
+class ConditionalGet:
+    """Per-route conditional GET handling, attached to endpoints by the route decorators.
+
+    With `etag=True` the rendered body is hashed and a matching
+    `If-None-Match` turns the response into a bodiless 304. With an
+    `etag` or `last_modified` function the validator is computed before
+    the handler runs, so a matching request skips rendering entirely.
+    """
+
+    etag: bool | ETagFunction = False
+    last_modified: LastModifiedFunction | None = None
+
+    async def __call__(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+        """Answer `request` with a 304 when its validators match, otherwise call the handler.
+
+        Returns:
+            A 304 response, or the handler's response with validator headers added.
+        """
+        if request.method not in SAFE_METHODS:
+            return await call_next(request)
+
+        headers: dict[str, str] = {}
+        if not isinstance(self.etag, bool):
+            headers["etag"] = quote_etag(await _resolve(self.etag, request))
+        if self.last_modified is not None:
+            headers["last-modified"] = http_date(await _resolve(self.last_modified, request))
+        if headers and self._is_fresh(request, headers):
+            return self._not_modified(headers)
+
+        response = await call_next(request)
+        if response.status_code != status.HTTP_200_OK:
+            return response
+        body = getattr(response, "body", None)
+        if self.etag is True and "etag" not in response.headers and isinstance(body, bytes):
+            headers["etag"] = body_etag(body)
+        for name, value in headers.items():
+            response.headers.setdefault(name, value)
+        if self._is_fresh(request, response.headers):
+            return self._not_modified(response.headers)
+        return response
+
+    @staticmethod
+    def _is_fresh(request: Request, validators: Any) -> bool:
+        """Evaluate preconditions in RFC 9110 order: `If-None-Match` wins over `If-Modified-Since`.
+
+        Returns:
+            True if the client's cached copy is still valid.
+        """
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            etag = validators.get("etag")
+            return etag is not None and etag_matches(if_none_match, etag)
+        if_modified_since = request.headers.get("if-modified-since")
+        last_modified = validators.get("last-modified")
+        if if_modified_since is None or last_modified is None:
+            return False
+        try:
+            modified = parsedate_to_datetime(last_modified)
+        except (TypeError, ValueError):
+            return False
+        return not_modified_since(if_modified_since, modified)
+
+    @staticmethod
+    def _not_modified(validators: Any) -> Response:
+        headers = {
+            name: validators[name] for name in ("etag", "last-modified", "cache-control", "vary") if name in validators
+        }
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
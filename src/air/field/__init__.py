@@ -23,6 +23,7 @@ from air.field.types import (
     PrimaryKey as PrimaryKey,
     Priority as Priority,
     ReadOnly as ReadOnly,
+    RemoteChoices as RemoteChoices,
     Sortable as Sortable,
     Widget as Widget,
 )
@@ -46,6 +47,7 @@ __all__ = [
     "PrimaryKey",
     "Priority",
     "ReadOnly",
+    "RemoteChoices",
     "Sortable",
     "Widget",
 ]
@@ -19,6 +19,7 @@ from air.field.types import (
     Label,
     Placeholder,
     PrimaryKey,
+    RemoteChoices,
     Widget,
 )
 
@@ -35,6 +36,7 @@ def AirField(  # noqa: C901, N802
     label: str | None = None,
     widget: str | None = None,
     choices: list[tuple[Any, str]] | None = None,
+    choices_url: str | None = None,
     autofocus: bool = False,
     placeholder: str | None = None,
     help_text: str | None = None,
@@ -45,8 +47,8 @@ def AirField(  # noqa: C901, N802
     """Unified field descriptor for Pydantic models.
 
     Accepts presentation metadata (``primary_key``, ``type``, ``label``,
-    ``widget``, ``choices``, ``placeholder``, ``help_text``,
-    ``autofocus``) and all standard ``pydantic.Field`` parameters.
+    ``widget``, ``choices``, ``choices_url``, ``placeholder``,
+    ``help_text``, ``autofocus``) and all standard ``pydantic.Field`` parameters.
 
     All AirField-specific parameters become typed metadata objects in
     ``field_info.metadata``. Remaining ``**kwargs`` pass through to
@@ -77,9 +79,11 @@ def AirField(  # noqa: C901, N802
         field_info.metadata.append(HelpText(text=help_text))
     if choices:
         field_info.metadata.append(Choices(*choices))
-        # Choices implies a select widget unless explicitly overridden
-        if not type and not widget:
+        # Choices implies a select widget unless explicitly overridden or fetched remotely
+        if not type and not widget and not choices_url:
             field_info.metadata.append(Widget(kind="select"))
+    if choices_url:
+        field_info.metadata.append(RemoteChoices(url=choices_url))
     if autofocus:
         field_info.metadata.append(Autofocus())
 
@@ -151,6 +151,18 @@ class Choices(BasePresentation):
         object.__setattr__(self, "options", options)
 
 
+@dataclass(frozen=True, slots=True)
+class RemoteChoices(BasePresentation):
+    """Options are fetched from ``url`` as the user types, not sent with the page.
+
+    For choice sets too large to embed. In a form: a search input that
+    asks ``url`` for matching options, passing the typed text as the
+    field's name. In a CLI: an autocomplete backed by the same source.
+    """
+
+    url: str
+
+
 # ---------------------------------------------------------------------------
 # Table and list context
 # ---------------------------------------------------------------------------
@@ -1,78 +1,299 @@
 """Zero-config CSRF protection for AirForm.
 
-Tokens are HMAC-signed with a per-process secret that's auto-generated
-on import. No configuration needed for single-worker deployments. For
-multi-worker production, set the AIRFORM_SECRET environment variable
-so all workers share the same secret.
+Tokens are stateless: everything needed to check one is inside it,
+signed with a keyed BLAKE2b MAC. Nothing is stored server-side unless
+replay protection is switched on.
 
-Token format: timestamp:nonce:signature
+Token format: base64url of 33 packed bytes, 44 characters, no padding.
+
+    key id (1) | issued at, unix seconds (4) | nonce (12) | MAC (16)
+
+The MAC also covers an optional session id, which is not stored in the
+token: a token bound to one session fails verification in any other.
+
+Secrets, in order of precedence:
+
+1. ``AIRFORM_SECRET``: the signing secret, used as is. Previous
+   secrets go in ``AIRFORM_SECRET_FALLBACKS``, comma-separated, and
+   stay accepted for one grace window after startup, so keys can be
+   rotated without breaking open forms.
+2. ``AIRFORM_SECRET_FILE``: a private key file, created on first use.
+   Every worker on the host pointing at it shares one key, so
+   multi-worker deployments on one host need no shared secret.
+3. A per-process random secret. Fine for a single worker; tokens
+   fail across workers and restarts.
+
+For deployments across several hosts, set ``AIRFORM_SECRET``.
 """
 
 from __future__ import annotations
 
+import base64
+import binascii
 import hashlib
 import hmac
 import os
 import secrets
+import stat
+import struct
+import threading
 import time
+import warnings
+from collections import OrderedDict
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from pydantic_core import core_schema
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from pydantic import GetCoreSchemaHandler
     from pydantic_core import CoreSchema
 
-#: Secret key for signing CSRF tokens. Auto-generated per process,
-#: or read from AIRFORM_SECRET env var for multi-worker deployments.
-_SECRET: bytes = os.environ.get("AIRFORM_SECRET", "").encode() or secrets.token_bytes(32)
-
 #: How long a CSRF token stays valid (seconds). Default: 1 hour.
 CSRF_MAX_AGE: int = 3600
 
 #: Name of the hidden input field in the form.
 CSRF_FIELD_NAME: str = "csrf_token"
 
-
-def generate_csrf_token() -> str:
-    """Generate a signed CSRF token."""
-    timestamp = str(int(time.time()))
-    nonce = secrets.token_urlsafe(16)
-    payload = f"{timestamp}:{nonce}"
-    sig = hmac.new(_SECRET, payload.encode(), hashlib.sha256).hexdigest()
-    return f"{payload}:{sig}"
+_HEADER = struct.Struct(">BI")
+_NONCE_SIZE = 12
+_MAC_SIZE = 16
+_BODY_SIZE = _HEADER.size + _NONCE_SIZE
+_TOKEN_SIZE = _BODY_SIZE + _MAC_SIZE
+_TOKEN_LENGTH = _TOKEN_SIZE * 4 // 3
+_KEY_PERSON = b"airform-csrf"
+_KEY_FILE_SIZE = 32
 
 
-def _check_csrf_token(token: str, max_age: int = CSRF_MAX_AGE) -> str:
-    """Validate a CSRF token string. Returns the token if valid.
+def _derive_key(secret: str | bytes) -> bytes:
+    """Stretch or shrink any secret to a 32-byte BLAKE2b key.
 
     Raises:
-        ValueError: If the token is missing, tampered, or expired.
+        ValueError: If the secret is empty.
     """
-    parts = token.split(":")
-    if len(parts) != 3:
-        msg = "Invalid CSRF token."
+    if isinstance(secret, str):
+        secret = secret.encode()
+    if not secret:
+        msg = "CSRF secret must not be empty."
         raise ValueError(msg)
+    return hashlib.blake2b(secret, digest_size=32, person=_KEY_PERSON).digest()
 
-    timestamp_str, nonce, sig = parts
 
-    expected_payload = f"{timestamp_str}:{nonce}"
-    expected_sig = hmac.new(_SECRET, expected_payload.encode(), hashlib.sha256).hexdigest()
-    if not hmac.compare_digest(expected_sig, sig):
-        msg = "Invalid CSRF token."
-        raise ValueError(msg)
+def _key_id(key: bytes) -> int:
+    return hashlib.blake2b(key, digest_size=1).digest()[0]
+
+
+def _sign(key: bytes, body: bytes, session: bytes) -> bytes:
+    return hashlib.blake2b(body + session, key=key, digest_size=_MAC_SIZE).digest()
+
+
+class CsrfSigner:
+    """Issues and verifies CSRF tokens.
+
+    Verification needs no server-side state. Previous keys passed in
+    or retired by ``rotate()`` keep verifying for ``grace`` seconds,
+    long enough for forms rendered before the rotation to be submitted.
+
+    With ``replay_cache`` set, the nonces of accepted tokens are kept
+    in a bounded LRU and a second submission of the same token is
+    rejected. The cache is per process and forgets the oldest nonces
+    first, so size it above the number of forms submitted per
+    ``max_age`` on one worker.
+
+    Example:
+
+        import air
+        from air.form.csrf import CsrfSigner
+
+        air.AirForm.csrf_signer = CsrfSigner("s3cret", previous=["old-s3cret"], replay_cache=100_000)
+
+    Args:
+        secret: Signing secret. Defaults to a random per-instance secret.
+        previous: Retired secrets, accepted for verification only.
+        max_age: Seconds a token stays valid.
+        grace: Seconds retired secrets stay valid. Defaults to ``max_age``.
+        replay_cache: Number of used nonces to remember. 0 disables replay protection.
+    """
+
+    def __init__(
+        self,
+        secret: str | bytes | None = None,
+        *,
+        previous: Iterable[str | bytes] = (),
+        max_age: int = CSRF_MAX_AGE,
+        grace: int | None = None,
+        replay_cache: int = 0,
+    ) -> None:
+        if replay_cache < 0:
+            msg = "replay_cache must not be negative"
+            raise ValueError(msg)
+        self.max_age = max_age
+        self.grace = max_age if grace is None else grace
+        self.replay_cache = replay_cache
+        self._key = _derive_key(secrets.token_bytes(32) if secret is None else secret)
+        self._key_id = _key_id(self._key)
+        retire_at = time.time() + self.grace
+        self._previous: list[tuple[int, bytes, float]] = [
+            (_key_id(key), key, retire_at) for key in map(_derive_key, previous)
+        ]
+        self._seen: OrderedDict[bytes, None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls, **kwargs: Any) -> CsrfSigner:
+        """Create a signer from ``AIRFORM_SECRET`` or ``AIRFORM_SECRET_FILE``.
+
+        Keyword arguments are passed to the constructor.
 
+        Returns:
+            A signer with the configured secret, or with a per-process
+            random one when neither variable is set.
+        """
+        configured = os.environ.get("AIRFORM_SECRET")
+        if configured:
+            fallbacks = [secret for secret in os.environ.get("AIRFORM_SECRET_FALLBACKS", "").split(",") if secret]
+            return cls(configured, previous=fallbacks, **kwargs)
+        key_file = os.environ.get("AIRFORM_SECRET_FILE")
+        if not key_file:
+            return cls(**kwargs)
+        secret = _shared_key_file_secret(Path(key_file))
+        if secret is None:
+            warnings.warn(
+                "AIRFORM_SECRET_FILE is unusable; CSRF tokens are signed with a "
+                "per-process secret and will fail across workers.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+        return cls(secret, **kwargs)
+
+    def rotate(self, secret: str | bytes | None = None) -> None:
+        """Start signing with a new secret, accepting the current one for ``grace`` seconds."""
+        now = time.time()
+        self._previous = [entry for entry in self._previous if entry[2] > now]
+        self._previous.insert(0, (self._key_id, self._key, now + self.grace))
+        self._key = _derive_key(secrets.token_bytes(32) if secret is None else secret)
+        self._key_id = _key_id(self._key)
+
+    def generate(self, session_id: str | None = None) -> str:
+        """Issue a fresh token, bound to ``session_id`` when given.
+
+        Returns:
+            A 44-character base64url token, safe in HTML attributes.
+        """
+        body = _HEADER.pack(self._key_id, int(time.time())) + os.urandom(_NONCE_SIZE)
+        mac = _sign(self._key, body, session_id.encode() if session_id else b"")
+        return base64.urlsafe_b64encode(body + mac).decode()
+
+    def verify(self, token: str, session_id: str | None = None) -> str:
+        """Check a token's signature, age, session binding and, if enabled, that it is unused.
+
+        Returns:
+            The token, when valid.
+
+        Raises:
+            ValueError: If the token is malformed, tampered, expired, from
+                another session, or already used.
+        """
+        if len(token) != _TOKEN_LENGTH:
+            msg = "Invalid CSRF token."
+            raise ValueError(msg)
+        try:
+            # a2b_base64 skips the urlsafe_b64decode wrapper; stray characters shorten the result
+            raw = binascii.a2b_base64(token.replace("-", "+").replace("_", "/"))
+        except (binascii.Error, ValueError):
+            msg = "Invalid CSRF token."
+            raise ValueError(msg) from None
+        if len(raw) != _TOKEN_SIZE:
+            msg = "Invalid CSRF token."
+            raise ValueError(msg)
+
+        body, mac = raw[:_BODY_SIZE], raw[_BODY_SIZE:]
+        key_id, issued_at = _HEADER.unpack_from(body)
+        session = session_id.encode() if session_id else b""
+        now = time.time()
+        if not (key_id == self._key_id and hmac.compare_digest(mac, _sign(self._key, body, session))) and not any(
+            previous_id == key_id and retire_at > now and hmac.compare_digest(mac, _sign(key, body, session))
+            for previous_id, key, retire_at in self._previous
+        ):
+            msg = "Invalid CSRF token."
+            raise ValueError(msg)
+
+        if now - issued_at > self.max_age:
+            msg = "CSRF token has expired. Please resubmit the form."
+            raise ValueError(msg)
+
+        if self.replay_cache:
+            self._remember(body[_HEADER.size :])
+        return token
+
+    def _remember(self, nonce: bytes) -> None:
+        with self._lock:
+            if nonce in self._seen:
+                msg = "CSRF token has already been used. Please reload the form."
+                raise ValueError(msg)
+            self._seen[nonce] = None
+            if len(self._seen) > self.replay_cache:
+                self._seen.popitem(last=False)
+
+
+def _shared_key_file_secret(path: Path) -> bytes | None:
+    """Read the key file, creating it atomically on first use.
+
+    The file is only trusted when it is a regular file owned by this
+    user and unreadable by anyone else; otherwise another local user
+    could have planted a known key.
+
+    Returns:
+        The secret, or None when no safe key file is available.
+    """
+    getuid = getattr(os, "getuid", None)
+    nofollow = getattr(os, "O_NOFOLLOW", None)
+    if getuid is None or nofollow is None:
+        return None
     try:
-        token_time = int(timestamp_str)
-    except ValueError:
-        msg = "Invalid CSRF token."
-        raise
+        if not path.exists():
+            scratch = path.with_name(f"{path.name}.{os.getpid()}.{secrets.token_hex(4)}")
+            fd = os.open(scratch, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, "wb") as file:
+                file.write(secrets.token_bytes(_KEY_FILE_SIZE))
+            try:
+                # link() fails if a concurrent worker won the race; theirs is used
+                os.link(scratch, path)
+            except FileExistsError:
+                pass
+            finally:
+                scratch.unlink()
+        fd = os.open(path, os.O_RDONLY | nofollow)
+        with os.fdopen(fd, "rb") as file:
+            info = os.fstat(file.fileno())
+            if not stat.S_ISREG(info.st_mode) or info.st_uid != getuid() or info.st_mode & 0o077:
+                return None
+            secret = file.read()
+    except OSError:
+        return None
+    return secret if len(secret) == _KEY_FILE_SIZE else None
+
+
+_default_signer: CsrfSigner | None = None
+
+
+def get_csrf_signer() -> CsrfSigner:
+    """Return the process-wide signer, created from the environment on first use.
+
+    Returns:
+        The default signer used by AirForm and ValidCsrfToken.
+    """
+    global _default_signer
+    if _default_signer is None:
+        _default_signer = CsrfSigner.from_environment()
+    return _default_signer
 
-    if time.time() - token_time > max_age:
-        msg = "CSRF token has expired. Please resubmit the form."
-        raise ValueError(msg)
 
-    return token
+def generate_csrf_token(session_id: str | None = None) -> str:
+    """Generate a signed CSRF token with the default signer."""
+    return get_csrf_signer().generate(session_id)
 
 
 class ValidCsrfToken(str):  # noqa: FURB189
@@ -92,16 +313,16 @@ class ValidCsrfToken(str):  # noqa: FURB189
         if not isinstance(value, str):
             msg = "CSRF token must be a string."
             raise TypeError(msg)
-        return _check_csrf_token(value)
+        return get_csrf_signer().verify(value)
 
 
-def csrf_hidden_input() -> tuple[str, str]:
+def csrf_hidden_input(signer: CsrfSigner | None = None, session_id: str | None = None) -> tuple[str, str]:
     """Render a hidden input with a fresh CSRF token.
 
     Returns:
         A (html, token) tuple. The html is the hidden input element,
         the token is the raw value for storing on the form instance.
     """
-    token = generate_csrf_token()
+    token = (signer or get_csrf_signer()).generate(session_id)
     html = f'<input type="hidden" name="{CSRF_FIELD_NAME}" value="{token}">'
     return html, token
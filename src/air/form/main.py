@@ -10,13 +10,16 @@ AirField metadata vocabulary.
 
 from __future__ import annotations
 
+import math
+from dataclasses import dataclass
 from enum import Enum
 from html import escape
 from types import UnionType
-from typing import TYPE_CHECKING, Any, ClassVar, Literal, Self, Union, get_args, get_origin
+from typing import TYPE_CHECKING, Annotated, Any, ClassVar, Literal, Self, Union, get_args, get_origin
+from weakref import WeakKeyDictionary
 
 import annotated_types
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from air.field import Autofocus, Label, Widget
 from air.field.types import (
@@ -27,13 +30,18 @@ from air.field.types import (
     Placeholder,
     PrimaryKey,
     ReadOnly,
+    RemoteChoices,
 )
 from air.requests import Request  # noqa: TC001 (FastAPI needs this at runtime for DI)
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Mapping, Sequence
+    from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Mapping, Sequence
 
     from pydantic_core import ErrorDetails
+    from starlette.responses import StreamingResponse
+
+    from air.form.csrf import CsrfSigner
+    from air.form.streaming import FormEvent, UploadSink, UploadSinkFactory
 
 # ---------------------------------------------------------------------------
 # Safe HTML output
@@ -83,6 +91,13 @@ def _is_optional(annotation: Any) -> bool:
     return False
 
 
+def _is_multi_value(annotation: Any) -> bool:
+    """Return True if annotation is a list, set or tuple, optionally ``| None``."""
+    if _is_optional(annotation):
+        return any(_is_multi_value(arg) for arg in get_args(annotation))
+    return get_origin(annotation) in {list, set, frozenset, tuple}
+
+
 def _is_bool(annotation: Any) -> bool:
     """Return True if annotation is ``bool`` or ``bool | None``."""
     if annotation is bool:
@@ -112,7 +127,7 @@ _WIDGET_TO_HTML_TYPE: dict[str, str] = {
 def pydantic_type_to_html_type(field_info: Any) -> str:
     """Return HTML input type from a Pydantic field's type and metadata.
 
-    Checks AirField metadata first (Widget, Choices), then infers
+    Checks AirField metadata first (Widget, RemoteChoices, Choices), then infers
     from the Python type annotation. Semantic widget names (toggle,
     slider, etc.) are mapped to valid HTML input types.
     """
@@ -121,6 +136,8 @@ def pydantic_type_to_html_type(field_info: Any) -> str:
     widget = _get_meta(meta, Widget)
     if widget:
         return _WIDGET_TO_HTML_TYPE.get(widget.kind, widget.kind)
+    if RemoteChoices in meta:
+        return "search"
     if Choices in meta:
         return "select"
 
@@ -213,7 +230,253 @@ def _attr_str(attrs: dict[str, str]) -> str:
     return "".join(parts)
 
 
-def default_form_widget(  # noqa: C901
+@dataclass(frozen=True, slots=True)
+class _SelectOptions:
+    """A field's options as one pre-escaped HTML block.
+
+    ``selected_at`` maps each option value to the offsets where its
+    `` selected`` attribute goes, so marking the current value is a
+    dict lookup and a splice, not a pass over every option.
+    """
+
+    tags: tuple[str, ...]
+    search_keys: tuple[str, ...]
+    html: str
+    selected_at: dict[str, tuple[int, ...]]
+
+    @classmethod
+    def build(cls, options: Sequence[tuple[str, str]]) -> _SelectOptions:
+        tags: list[str] = []
+        selected_at: dict[str, tuple[int, ...]] = {}
+        offset = 0
+        for opt_val, opt_label in options:
+            opening = f'<option value="{escape(opt_val)}"'
+            tags.append(f"{opening}>{escape(opt_label)}</option>")
+            selected_at[opt_val] = (*selected_at.get(opt_val, ()), offset + len(_OPTION_INDENT) + len(opening))
+            offset += len(_OPTION_INDENT) + len(tags[-1]) + 1
+        return cls(
+            tags=tuple(tags),
+            search_keys=tuple(f"{opt_val}\n{opt_label}".casefold() for opt_val, opt_label in options),
+            html="\n".join(_OPTION_INDENT + tag for tag in tags),
+            selected_at=selected_at,
+        )
+
+    def render(self, value: Any) -> str:
+        """Return the options HTML with the option matching ``value`` selected."""
+        offsets = self.selected_at.get(str(value), ()) if value is not None else ()
+        if not offsets:
+            return self.html
+        pieces: list[str] = []
+        start = 0
+        for offset in offsets:
+            pieces.extend((self.html[start:offset], " selected"))
+            start = offset
+        pieces.append(self.html[start:])
+        return "".join(pieces)
+
+    def matching(self, query: str, limit: int) -> Iterator[str]:
+        """Yield ``<option>`` tags whose value or label contains ``query``, ignoring case."""
+        needle = query.casefold()
+        found = 0
+        for tag, key in zip(self.tags, self.search_keys, strict=True):
+            if found >= limit:
+                return
+            if needle in key:
+                found += 1
+                yield tag
+
+
+_OPTION_INDENT = "    "
+
+
+@dataclass(frozen=True, slots=True)
+class _FieldPlan:
+    """The parts of one field's HTML that depend only on the model, pre-escaped.
+
+    Rendering fills the holes between them: the error state, the value
+    and the error message.
+    """
+
+    name: str
+    input_type: str
+    label_html: str
+    attrs: str
+    error_attrs: str
+    options: _SelectOptions
+    datalist_html: str | None
+    help_html: str | None
+    error_open: str
+
+    def render(self, value: Any, error: dict | None) -> str:
+        """Render the field with its current value and error."""
+        has_error = error is not None
+        parts: list[str] = ['<div class="air-field air-field-error">' if has_error else '<div class="air-field">']
+        if self.input_type != "checkbox":
+            parts.append(self.label_html)
+        attrs = self.error_attrs if has_error else self.attrs
+
+        if self.input_type == "textarea":
+            val = escape(str(value)) if value is not None else ""
+            parts.append(f"  <textarea{attrs}>{val}</textarea>")
+        elif self.input_type == "select":
+            parts.extend((f"  <select{attrs}>", '    <option value="" disabled selected hidden>Select...</option>'))
+            if self.options.html:
+                parts.append(self.options.render(value))
+            parts.append("  </select>")
+        elif self.input_type == "checkbox":
+            checked = " checked" if value else ""
+            parts.extend((f"  <input{attrs}{checked}>", self.label_html))
+        else:
+            val_attr = f' value="{escape(str(value))}"' if value is not None else ""
+            parts.append(f"  <input{attrs}{val_attr}>")
+            if self.datalist_html is not None:
+                parts.append(self.datalist_html)
+
+        if self.help_html is not None:
+            parts.append(self.help_html)
+        if error:
+            parts.append(f"{self.error_open}{escape(get_user_error_message(error))}</div>")
+        parts.append("</div>")
+        return "\n".join(parts)
+
+
+def _constraint_attrs(field_info: Any) -> dict[str, str]:
+    """Map Pydantic length constraints to HTML5 validation attributes."""
+    attrs: dict[str, str] = {}
+    for m in field_info.metadata:
+        if isinstance(m, annotated_types.MinLen):
+            attrs["minlength"] = str(m.min_length)
+        elif isinstance(m, annotated_types.MaxLen):
+            attrs["maxlength"] = str(m.max_length)
+        elif hasattr(annotated_types, "Len") and isinstance(m, annotated_types.Len):
+            if getattr(m, "min_length", None) is not None:
+                attrs.setdefault("minlength", str(m.min_length))
+            if getattr(m, "max_length", None) is not None:
+                attrs.setdefault("maxlength", str(m.max_length))
+
+    # Fallback to field_info attributes
+    if hasattr(field_info, "min_length") and field_info.min_length is not None:
+        attrs.setdefault("minlength", str(field_info.min_length))
+    if hasattr(field_info, "max_length") and field_info.max_length is not None:
+        attrs.setdefault("maxlength", str(field_info.max_length))
+    return attrs
+
+
+def _compile_field(field_name: str, field_info: Any) -> _FieldPlan | None:
+    """Compile a field's render plan, or None if the field is hidden in forms."""
+    meta = _meta_dict(field_info)
+    annotation = field_info.annotation
+
+    # Skip fields hidden in form context
+    hidden = _get_meta(meta, Hidden)
+    if hidden and hidden.in_context("form"):
+        return None
+    readonly = _get_meta(meta, ReadOnly)
+    if readonly and readonly.in_context("form"):
+        return None
+
+    input_type = pydantic_type_to_html_type(field_info)
+    input_attrs: dict[str, str] = {"name": field_name, "id": field_name}
+    if input_type not in ("textarea", "select"):
+        input_attrs["type"] = input_type
+    # Required: non-optional required fields
+    if field_info.is_required() and not _is_optional(annotation):
+        input_attrs["required"] = ""
+    if Autofocus in meta:
+        input_attrs["autofocus"] = ""
+    placeholder = _get_meta(meta, Placeholder)
+    if placeholder:
+        input_attrs["placeholder"] = placeholder.text
+    remote = _get_meta(meta, RemoteChoices)
+    if remote:
+        input_attrs |= {
+            "list": f"{field_name}-options",
+            "autocomplete": "off",
+            "hx-get": remote.url,
+            "hx-trigger": "input changed delay:250ms, focus once",
+            "hx-target": f"#{field_name}-options",
+        }
+
+    attrs = _attr_str(input_attrs)
+    error_attrs = _attr_str({"aria-invalid": "true", "aria-describedby": f"{field_name}-error"})
+    constraint_attrs = _attr_str(_constraint_attrs(field_info))
+    options = _SelectOptions.build(_get_options(annotation, meta) if input_type == "select" or remote else ())
+    help_text = _get_meta(meta, HelpText)
+    escaped_name = escape(field_name)
+    return _FieldPlan(
+        name=field_name,
+        input_type=input_type,
+        label_html=f'  <label for="{escaped_name}">{escape(label_for_field(field_name, field_info))}</label>',
+        attrs=f"{attrs}{constraint_attrs}",
+        error_attrs=f"{attrs}{error_attrs}{constraint_attrs}",
+        options=options,
+        datalist_html=f'  <datalist id="{escaped_name}-options"></datalist>' if remote else None,
+        help_html=(
+            f'  <div class="air-field-help" id="{escaped_name}-help">{escape(help_text.text)}</div>'
+            if help_text
+            else None
+        ),
+        error_open=f'  <div class="air-field-message" id="{escaped_name}-error" role="alert">',
+    )
+
+
+_form_plans: WeakKeyDictionary[type[BaseModel], tuple[dict[str, Any], tuple[_FieldPlan, ...]]] = WeakKeyDictionary()
+
+
+def _form_plan(model: type[BaseModel]) -> tuple[_FieldPlan, ...]:
+    """Return the model's compiled field plans, compiling them on first use or after a model rebuild."""
+    fields = model.model_fields
+    cached = _form_plans.get(model)
+    if cached is not None and cached[0] is fields:
+        return cached[1]
+    plans = tuple(plan for name, info in fields.items() if (plan := _compile_field(name, info)) is not None)
+    _form_plans[model] = (fields, plans)
+    return plans
+
+
+_field_adapters: WeakKeyDictionary[type[BaseModel], tuple[dict[str, Any], dict[str, TypeAdapter]]] = WeakKeyDictionary()
+
+
+def _field_errors(model: type[BaseModel], name: str, value: Any) -> list[ErrorDetails]:
+    """Check one submitted value against its field's type and constraints.
+
+    Model and field validators need the whole submission and are left
+    to the final ``model_validate``. Unknown names are not errors.
+    """
+    fields = model.model_fields
+    field_info = fields.get(name)
+    if field_info is None:
+        return []
+    cached = _field_adapters.get(model)
+    if cached is None or cached[0] is not fields:
+        cached = _field_adapters[model] = (fields, {})
+    adapter = cached[1].get(name)
+    if adapter is None:
+        adapter = cached[1][name] = TypeAdapter(Annotated[field_info.annotation, field_info])
+    try:
+        adapter.validate_python(value)
+    except ValidationError as e:
+        errors = e.errors()
+        for error in errors:
+            error["loc"] = (name, *error["loc"])
+        return errors
+    return []
+
+
+def _stream_error(name: str, msg: str, value: Any = None, *, type_: str = "value_error") -> ErrorDetails:
+    return {"type": type_, "loc": (name,), "msg": msg, "input": value}
+
+
+async def _abort_sinks(sinks: Iterable[UploadSink]) -> None:
+    """Abort every sink, shielded so a cancelled request still cleans up."""
+    import anyio  # noqa: PLC0415
+
+    with anyio.CancelScope(shield=True):
+        for sink in sinks:
+            await sink.abort()
+
+
+def default_form_widget(
     *,
     model: type[BaseModel],
     data: dict | None = None,
@@ -226,6 +489,9 @@ def default_form_widget(  # noqa: C901
     Placeholder, HelpText, Choices, Autofocus, PrimaryKey, Hidden,
     ReadOnly.
 
+    The metadata is read once per model into a render plan of
+    pre-escaped HTML, so rendering only fills in values and errors.
+
     This is the default widget for AirForm.render(). Swap it by
     setting ``widget`` on your AirForm subclass.
 
@@ -236,120 +502,11 @@ def default_form_widget(  # noqa: C901
         excludes: Field names to skip when rendering.
     """
     error_dict = errors_to_dict(errors)
-    field_parts: list[str] = []
-
-    for field_name, field_info in model.model_fields.items():
-        if excludes is not None and field_name in excludes:
-            continue
-
-        meta = _meta_dict(field_info)
-        annotation = field_info.annotation
-
-        # Skip fields hidden in form context
-        hidden = _get_meta(meta, Hidden)
-        if hidden and hidden.in_context("form"):
-            continue
-        readonly = _get_meta(meta, ReadOnly)
-        if readonly and readonly.in_context("form"):
-            continue
-
-        input_type = pydantic_type_to_html_type(field_info)
-        label_text = label_for_field(field_name, field_info)
-        error = error_dict.get(field_name)
-        value = data.get(field_name) if data is not None else None
-        has_error = error is not None
-
-        # Build wrapper
-        wrapper_cls = "air-field" + (" air-field-error" if has_error else "")
-        parts: list[str] = [f'<div class="{wrapper_cls}">']
-
-        # Label (after input for checkboxes)
-        label_html = f'  <label for="{escape(field_name)}">{escape(label_text)}</label>'
-        if input_type != "checkbox":
-            parts.append(label_html)
-
-        # Build input attributes
-        input_attrs: dict[str, str] = {"name": field_name, "id": field_name}
-
-        if input_type not in ("textarea", "select"):
-            input_attrs["type"] = input_type
-
-        # Required: non-optional required fields
-        if field_info.is_required() and not _is_optional(annotation):
-            input_attrs["required"] = ""
-
-        if Autofocus in meta:
-            input_attrs["autofocus"] = ""
-
-        placeholder = _get_meta(meta, Placeholder)
-        if placeholder:
-            input_attrs["placeholder"] = placeholder.text
-
-        if has_error:
-            input_attrs["aria-invalid"] = "true"
-            input_attrs["aria-describedby"] = f"{field_name}-error"
-
-        # Pydantic constraints -> HTML5 validation attributes
-        for m in field_info.metadata:
-            if isinstance(m, annotated_types.MinLen):
-                input_attrs["minlength"] = str(m.min_length)
-            elif isinstance(m, annotated_types.MaxLen):
-                input_attrs["maxlength"] = str(m.max_length)
-            elif hasattr(annotated_types, "Len") and isinstance(m, annotated_types.Len):
-                if getattr(m, "min_length", None) is not None:
-                    input_attrs.setdefault("minlength", str(m.min_length))
-                if getattr(m, "max_length", None) is not None:
-                    input_attrs.setdefault("maxlength", str(m.max_length))
-
-        # Fallback to field_info attributes
-        if hasattr(field_info, "min_length") and field_info.min_length is not None:
-            input_attrs.setdefault("minlength", str(field_info.min_length))
-        if hasattr(field_info, "max_length") and field_info.max_length is not None:
-            input_attrs.setdefault("maxlength", str(field_info.max_length))
-
-        # Render the input element
-        if input_type == "textarea":
-            val = escape(str(value)) if value is not None else ""
-            parts.append(f"  <textarea{_attr_str(input_attrs)}>{val}</textarea>")
-
-        elif input_type == "select":
-            options = _get_options(annotation, meta)
-            parts.extend((
-                f"  <select{_attr_str(input_attrs)}>",
-                '    <option value="" disabled selected hidden>Select...</option>',
-            ))
-            for opt_val, opt_label in options:
-                sel = " selected" if value is not None and str(value) == opt_val else ""
-                parts.append(f'    <option value="{escape(opt_val)}"{sel}>{escape(opt_label)}</option>')
-            parts.append("  </select>")
-
-        elif input_type == "checkbox":
-            checked = " checked" if value else ""
-            parts.append(f"  <input{_attr_str(input_attrs)}{checked}>")
-
-        else:
-            val_attr = f' value="{escape(str(value))}"' if value is not None else ""
-            parts.append(f"  <input{_attr_str(input_attrs)}{val_attr}>")
-
-        if input_type == "checkbox":
-            parts.append(label_html)
-
-        # Help text
-        help_text = _get_meta(meta, HelpText)
-        if help_text:
-            parts.append(f'  <div class="air-field-help" id="{escape(field_name)}-help">{escape(help_text.text)}</div>')
-
-        # Error message
-        if error:
-            parts.append(
-                f'  <div class="air-field-message" id="{escape(field_name)}-error" role="alert">'
-                f"{escape(get_user_error_message(error))}</div>"
-            )
-
-        parts.append("</div>")
-        field_parts.append("\n".join(parts))
-
-    return "\n".join(field_parts)
+    return "\n".join(
+        plan.render(data.get(plan.name) if data is not None else None, error_dict.get(plan.name))
+        for plan in _form_plan(model)
+        if excludes is None or plan.name not in excludes
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -409,6 +566,8 @@ class AirForm[M: BaseModel]:
     as a hidden input. validate() pops and checks the token before
     Pydantic sees the data. If validate() is called directly
     without render() (programmatic use, tests), CSRF is skipped.
+    Set ``csrf_signer`` to rotate keys or reject replayed tokens, and
+    pass ``csrf_session_id`` to bind tokens to the user's session.
 
     Example::
 
@@ -445,8 +604,11 @@ class AirForm[M: BaseModel]:
     errors: list[ErrorDetails] | None = None
     is_valid: bool = False
     excludes: Sequence[str | tuple[str, ...]] | None = None
+    csrf_signer: ClassVar[CsrfSigner | None] = None
     _display_excludes: ClassVar[set[str]] = set()
     _save_excludes: ClassVar[set[str]] = set()
+    _bool_fields: ClassVar[frozenset[str]] = frozenset()
+    _multi_fields: ClassVar[frozenset[str]] = frozenset()
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
@@ -461,13 +623,21 @@ class AirForm[M: BaseModel]:
         # Build effective exclude sets from metadata defaults + user tuple
         if cls.model is not None:
             cls._display_excludes, cls._save_excludes = _build_excludes(cls.model, cls.excludes)
+            cls._bool_fields = frozenset(
+                name for name, field_info in cls.model.model_fields.items() if _is_bool(field_info.annotation)
+            )
+            cls._multi_fields = frozenset(
+                name for name, field_info in cls.model.model_fields.items() if _is_multi_value(field_info.annotation)
+            )
+            _form_plan(cls.model)
 
-    def __init__(self, initial_data: dict | None = None) -> None:
+    def __init__(self, initial_data: dict | None = None, *, csrf_session_id: str | None = None) -> None:
         if self.model is None:
             msg = "model"
             raise NotImplementedError(msg)
         self.initial_data = initial_data
         self.submitted_data: dict | None = None
+        self.csrf_session_id = csrf_session_id
         self._csrf_token: str | None = None
 
     @property
@@ -487,21 +657,164 @@ class AirForm[M: BaseModel]:
         return self
 
     @classmethod
-    async def from_request(cls, request: Request) -> Self:
+    async def from_request(cls, request: Request, *, csrf_session_id: str | None = None) -> Self:
         """Create and validate an AirForm instance from a request.
 
         CSRF is always enforced for browser submissions.
 
         Args:
             request: An object with an async ``form()`` method.
+            csrf_session_id: The session the form was rendered for, if tokens are session-bound.
         """
         form_data = await request.form()
-        self = cls()
+        self = cls(csrf_session_id=csrf_session_id)
         # A browser submission came from a rendered form, enforce CSRF
         self._csrf_token = "from_request"
         self.validate(dict(form_data))
         return self
 
+    @classmethod
+    async def from_stream(
+        cls,
+        request: Request,
+        *,
+        uploads: Mapping[str, UploadSinkFactory] | None = None,
+        max_file_size: int | None = None,
+        csrf_session_id: str | None = None,
+    ) -> Self:
+        """Create and validate an AirForm instance while the request body streams in.
+
+        Unlike ``from_request()``, uploads are never spooled to temporary
+        files: each file goes chunk by chunk to the sink its field name
+        maps to in ``uploads``, and the field receives whatever the sink's
+        ``close()`` returns. Each field is checked against its type and
+        constraints as soon as it is complete; the first bad field, an
+        oversized or unexpected file, or a bad CSRF token stops reading
+        the body. The whole model is validated once the body is done.
+
+        CSRF is enforced, and the token must arrive before any file, so
+        nothing is written for a forged submission. ``render()`` puts it
+        first. Repeated names are collected into a list for list, set
+        and tuple fields. If the form ends up invalid, or reading stops
+        for any other reason (a client disconnect, a failing sink), every
+        sink is aborted.
+
+        Example::
+
+            @app.post("/glazes")
+            async def upload_glaze(request: air.Request) -> air.Html:
+                form = await GlazeForm.from_stream(
+                    request,
+                    uploads={"photo": lambda upload: FileSink(MEDIA / secrets.token_hex(8))},
+                    max_file_size=50 * 1024 * 1024,
+                )
+
+        Args:
+            request: The incoming request; its body must not have been read yet.
+            uploads: A sink factory for each file field. Files for other names are rejected.
+            max_file_size: Largest accepted file, in bytes. Enforced mid-stream.
+            csrf_session_id: The session the form was rendered for, if tokens are session-bound.
+
+        Raises:
+            HTTPException: 400 if the body is malformed or exceeds the parser's limits.
+        """
+        from fastapi import HTTPException, status  # noqa: PLC0415
+
+        from air.form.streaming import FormStreamError, stream_form  # noqa: PLC0415
+
+        self = cls(csrf_session_id=csrf_session_id)
+        # Cleared once the token has been verified mid-stream, so validate() doesn't look for it again
+        self._csrf_token = "from_request"
+        data: dict[str, Any] = {}
+        sinks: list[UploadSink] = []
+        try:
+            try:
+                errors = await self._read_stream(stream_form(request), uploads or {}, max_file_size, data, sinks)
+            except FormStreamError as e:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+            if errors:
+                self.submitted_data = data
+                self.errors = errors
+            else:
+                self.validate(data)
+        except BaseException:
+            # A disconnect, a failing sink or cancellation must not leave partial uploads behind
+            await _abort_sinks(sinks)
+            raise
+        if not self.is_valid:
+            await _abort_sinks(sinks)
+        return self
+
+    async def _read_stream(
+        self,
+        events: AsyncIterator[FormEvent],
+        uploads: Mapping[str, UploadSinkFactory],
+        max_file_size: int | None,
+        data: dict[str, Any],
+        sinks: list[UploadSink],
+    ) -> list[ErrorDetails]:
+        """Consume form events into ``data``, stopping at the first error.
+
+        Every sink created is appended to ``sinks``, including one that
+        was abandoned part way.
+
+        Returns:
+            The errors that stopped the stream, or an empty list.
+        """
+        from air.form.csrf import CSRF_FIELD_NAME  # noqa: PLC0415
+        from air.form.streaming import FormField, UploadChunk, UploadEnd, UploadStart  # noqa: PLC0415
+
+        sink: UploadSink | None = None
+        size = 0
+        size_limit = math.inf if max_file_size is None else max_file_size
+        async for event in events:
+            match event:
+                case FormField(name=name, value=value):
+                    if errors := self._take_field(name, value, data):
+                        return errors
+                case UploadStart(name=name, filename=filename):
+                    if self._csrf_token is not None:
+                        return [_stream_error(CSRF_FIELD_NAME, "CSRF token is missing.")]
+                    factory = uploads.get(name)
+                    if factory is None:
+                        return [_stream_error(name, "Unexpected file.", filename)]
+                    sink, size = factory(event), 0
+                    sinks.append(sink)
+                case UploadChunk(name=name, data=chunk):
+                    assert sink is not None
+                    size += len(chunk)
+                    if size > size_limit:
+                        return [_stream_error(name, f"File is larger than {max_file_size} bytes.", type_="too_long")]
+                    await sink.write(chunk)
+                case UploadEnd(name=name):
+                    assert sink is not None
+                    data[name] = await sink.close()
+                    sink = None
+        # A token that never arrived is reported by validate()
+        return []
+
+    def _take_field(self, name: str, value: str, data: dict[str, Any]) -> list[ErrorDetails]:
+        """Verify the CSRF token, or store a streamed field and check it on its own.
+
+        Returns:
+            The field's errors, or an empty list.
+        """
+        from air.form.csrf import CSRF_FIELD_NAME, get_csrf_signer  # noqa: PLC0415
+
+        assert self.model is not None
+        if name == CSRF_FIELD_NAME:
+            try:
+                (self.csrf_signer or get_csrf_signer()).verify(value, self.csrf_session_id)
+            except ValueError as e:
+                return [_stream_error(CSRF_FIELD_NAME, str(e), value)]
+            self._csrf_token = None
+            return []
+        if name in self._multi_fields:
+            data.setdefault(name, []).append(value)
+            return []
+        data[name] = value
+        return _field_errors(self.model, name, value)
+
     def validate(self, form_data: Mapping[str, Any]) -> bool:
         """Validate form data against the model.
 
@@ -513,9 +826,9 @@ class AirForm[M: BaseModel]:
             form_data: Mapping containing the form fields to validate.
 
         Raises:
-            ValueError: If the CSRF token is missing, tampered, or expired.
+            ValueError: If the CSRF token is missing, tampered, expired, or replayed.
         """
-        from air.form.csrf import CSRF_FIELD_NAME, _check_csrf_token  # noqa: PLC0415
+        from air.form.csrf import CSRF_FIELD_NAME, get_csrf_signer  # noqa: PLC0415
 
         self._data = None
         self.is_valid = False
@@ -529,26 +842,61 @@ class AirForm[M: BaseModel]:
                 if raw_token is None:
                     msg = "CSRF token is missing."
                     raise ValueError(msg)  # noqa: TRY301
-                _check_csrf_token(raw_token)
+                (self.csrf_signer or get_csrf_signer()).verify(raw_token, self.csrf_session_id)
             except ValueError as e:
                 self.errors = [{"type": "value_error", "loc": (CSRF_FIELD_NAME,), "msg": str(e), "input": raw_token}]
                 return self.is_valid
 
-        # Coerce bool fields for HTML checkbox behavior:
-        # checked -> "on", unchecked -> key missing entirely
-        assert self.model is not None
-        for field_name, field_info in self.model.model_fields.items():
-            if _is_bool(field_info.annotation) and field_name not in self.submitted_data:
-                self.submitted_data[field_name] = False
-
         # Validate against the user's model
+        assert self.model is not None
         try:
-            self._data = self.model(**self.submitted_data)
+            self._data = self.model.model_validate(self._fill_unchecked(self.submitted_data))
             self.is_valid = True
         except ValidationError as e:
             self.errors = e.errors()
         return self.is_valid
 
+    @classmethod
+    def _fill_unchecked(cls, data: dict[str, Any]) -> dict[str, Any]:
+        """Coerce bool fields for HTML checkbox behavior.
+
+        Checked boxes submit "on"; unchecked boxes are missing entirely.
+        """
+        for field_name in cls._bool_fields:
+            if field_name not in data:
+                data[field_name] = False
+        return data
+
+    @classmethod
+    def validate_many(cls, rows: Iterable[Mapping[str, Any]]) -> list[Self]:
+        """Validate many submissions at once, e.g. the rows of a CSV import.
+
+        Each row is checked straight against the model's validator,
+        without the per-call setup of ``validate()``. CSRF is not checked.
+
+        Example::
+
+            forms = WatercolorForm.validate_many(csv.DictReader(upload))
+            imported = [form.data for form in forms if form.is_valid]
+
+        Returns:
+            One validated form per row, in order, with ``is_valid``,
+            ``data`` and ``errors`` set as ``validate()`` would.
+        """
+        assert cls.model is not None
+        model_validate = cls.model.model_validate
+        forms: list[Self] = []
+        for row in rows:
+            form = cls()
+            form.submitted_data = data = cls._fill_unchecked(dict(row))
+            try:
+                form._data = model_validate(data)
+                form.is_valid = True
+            except ValidationError as e:
+                form.errors = e.errors()
+            forms.append(form)
+        return forms
+
     def save_data(self) -> dict[str, Any]:
         """Return validated data as a dict, excluding save-excluded fields.
 
@@ -564,6 +912,39 @@ class AirForm[M: BaseModel]:
             raise AttributeError(msg)
         return self._data.model_dump(exclude=self._save_excludes or None)
 
+    @classmethod
+    def options_response(cls, field_name: str, query: str = "", *, limit: int = 50) -> StreamingResponse:
+        """Stream the ``<option>`` tags of a field that match ``query``.
+
+        Serves fields declared with ``AirField(choices=..., choices_url=...)``:
+        the form renders a search input whose datalist is filled from
+        ``choices_url`` as the user types, so thousands of options are
+        never sent with the page::
+
+            class ShippingModel(BaseModel):
+                country: str = AirField(choices=COUNTRIES, choices_url="/options/country")
+
+
+            @app.get("/options/country")
+            def country_options(country: str = ""):
+                return ShippingForm.options_response("country", country)
+
+        Args:
+            field_name: The field whose options are searched.
+            query: Text to look for in option values and labels, ignoring case.
+            limit: Maximum number of options to return.
+
+        Raises:
+            KeyError: If the form does not render a field with that name.
+        """
+        from starlette.responses import StreamingResponse  # noqa: PLC0415
+
+        assert cls.model is not None
+        for plan in _form_plan(cls.model):
+            if plan.name == field_name:
+                return StreamingResponse(plan.options.matching(query, limit), media_type="text/html")
+        raise KeyError(field_name)
+
     #: Widget for rendering the form as HTML. A callable with signature
     #: ``(*, model, data, errors, excludes) -> str``.
     #: Override on your subclass to swap in a custom renderer::
@@ -581,7 +962,7 @@ class AirForm[M: BaseModel]:
         """
         from air.form.csrf import csrf_hidden_input  # noqa: PLC0415
 
-        csrf_html, self._csrf_token = csrf_hidden_input()
+        csrf_html, self._csrf_token = csrf_hidden_input(self.csrf_signer, self.csrf_session_id)
         render_data = self.submitted_data or self.initial_data
         fields_html = self.widget(
             model=self.model,
@@ -0,0 +1,280 @@
+"""Stream form submissions without spooling uploads to temporary files.
+
+``request.form()`` buffers every uploaded file before the handler sees
+any of it. ``stream_form()`` yields fields and file chunks as they come
+off the wire instead. A consumer can send each file straight to its
+destination, stop reading once a limit is hit, and reject bad fields
+before the rest of the body has arrived.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+import anyio
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+from starlette.datastructures import Headers
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+    from os import PathLike
+
+    from anyio import AsyncFile
+    from starlette.requests import Request
+
+#: Largest accepted non-file field, in bytes.
+MAX_FIELD_SIZE: int = 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class FormField:
+    """A complete non-file field."""
+
+    name: str
+    value: str
+
+
+@dataclass(frozen=True, slots=True)
+class UploadStart:
+    """The headers of a file part have arrived; its chunks follow."""
+
+    name: str
+    filename: str
+    content_type: str | None
+    headers: Headers
+
+
+@dataclass(frozen=True, slots=True)
+class UploadChunk:
+    """A piece of the file that was last started."""
+
+    name: str
+    data: bytes
+
+
+@dataclass(frozen=True, slots=True)
+class UploadEnd:
+    """The file that was last started is complete."""
+
+    name: str
+    size: int
+
+
+type FormEvent = FormField | UploadStart | UploadChunk | UploadEnd
+"""One item yielded by `stream_form`."""
+
+
+class FormStreamError(ValueError):
+    """The submission is malformed or exceeds a limit."""
+
+
+class UploadSink(Protocol):
+    """Destination for one uploaded file.
+
+    ``close()`` returns the value the form field receives, e.g. a path or a digest.
+    ``abort()`` is called instead when the upload is rejected part way.
+    """
+
+    async def write(self, data: bytes) -> None: ...
+
+    async def close(self) -> Any: ...
+
+    async def abort(self) -> None: ...
+
+
+type UploadSinkFactory = Callable[[UploadStart], UploadSink]
+"""Creates the sink for an upload from its headers."""
+
+
+class FileSink:
+    """Write an upload to a path on disk; the field receives the `Path`.
+
+    Writes run in a worker thread so the event loop is never blocked.
+    An aborted upload leaves no partial file behind.
+    """
+
+    def __init__(self, path: str | PathLike[str]) -> None:
+        self.path = Path(path)
+        self._file: AsyncFile[bytes] | None = None
+
+    async def write(self, data: bytes) -> None:
+        if self._file is None:
+            self._file = await anyio.open_file(self.path, "wb")
+        await self._file.write(data)
+
+    async def close(self) -> Path:
+        if self._file is None:
+            self._file = await anyio.open_file(self.path, "wb")
+        await self._file.aclose()
+        return self.path
+
+    async def abort(self) -> None:
+        if self._file is not None:
+            await self._file.aclose()
+        await anyio.Path(self.path).unlink(missing_ok=True)
+
+
+class HashSink:
+    """Hash an upload without storing it; the field receives the hex digest."""
+
+    def __init__(self, algorithm: str = "sha256") -> None:
+        self._hash = hashlib.new(algorithm)
+
+    async def write(self, data: bytes) -> None:
+        self._hash.update(data)
+
+    async def close(self) -> str:
+        return self._hash.hexdigest()
+
+    async def abort(self) -> None:
+        pass
+
+
+def _decode(value: bytes | bytearray, charset: str) -> str:
+    try:
+        return value.decode(charset)
+    except (UnicodeDecodeError, LookupError):
+        return value.decode("latin-1")
+
+
+class _MultipartEvents:
+    """Parser callbacks that turn python-multipart's byte ranges into form events."""
+
+    def __init__(self, charset: str, *, max_fields: int, max_files: int, max_field_size: int) -> None:
+        self.charset = charset
+        self.max_fields = max_fields
+        self.max_files = max_files
+        self.max_field_size = max_field_size
+        self.events: list[FormEvent] = []
+        self.fields = 0
+        self.files = 0
+        self._header_name = b""
+        self._header_value = b""
+        self._headers: list[tuple[bytes, bytes]] = []
+        self._name = ""
+        self._upload = False
+        self._size = 0
+        self._data = bytearray()
+
+    def callbacks(self) -> dict[str, Callable[..., None]]:
+        return {
+            "on_part_begin": self.on_part_begin,
+            "on_part_data": self.on_part_data,
+            "on_part_end": self.on_part_end,
+            "on_header_field": self.on_header_field,
+            "on_header_value": self.on_header_value,
+            "on_header_end": self.on_header_end,
+            "on_headers_finished": self.on_headers_finished,
+        }
+
+    def on_part_begin(self) -> None:
+        self._headers = []
+        self._size = 0
+        self._data.clear()
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        self._headers.append((self._header_name.lower(), self._header_value))
+        self._header_name = self._header_value = b""
+
+    def on_headers_finished(self) -> None:
+        headers = Headers(raw=self._headers)
+        _, options = parse_options_header(headers.get("content-disposition"))
+        if b"name" not in options:
+            msg = 'The Content-Disposition header field "name" must be provided.'
+            raise FormStreamError(msg)
+        self._name = _decode(options[b"name"], self.charset)
+        self._upload = b"filename" in options
+        if self._upload:
+            self.files += 1
+            if self.files > self.max_files:
+                msg = f"Too many files. Maximum number of files is {self.max_files}."
+                raise FormStreamError(msg)
+            filename = _decode(options[b"filename"], self.charset)
+            self.events.append(UploadStart(self._name, filename, headers.get("content-type"), headers))
+        else:
+            self.fields += 1
+            if self.fields > self.max_fields:
+                msg = f"Too many fields. Maximum number of fields is {self.max_fields}."
+                raise FormStreamError(msg)
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        self._size += end - start
+        if self._upload:
+            self.events.append(UploadChunk(self._name, data[start:end]))
+            return
+        if self._size > self.max_field_size:
+            msg = f"Field {self._name!r} exceeds {self.max_field_size} bytes."
+            raise FormStreamError(msg)
+        self._data += data[start:end]
+
+    def on_part_end(self) -> None:
+        if self._upload:
+            self.events.append(UploadEnd(self._name, self._size))
+        else:
+            self.events.append(FormField(self._name, _decode(self._data, self.charset)))
+
+
+async def stream_form(
+    request: Request,
+    *,
+    max_fields: int = 1000,
+    max_files: int = 1000,
+    max_field_size: int = MAX_FIELD_SIZE,
+) -> AsyncIterator[FormEvent]:
+    """Yield the fields and file chunks of a submission as they arrive.
+
+    For ``multipart/form-data`` the body is parsed incrementally: each
+    field is yielded once complete, and each file as an `UploadStart`,
+    its `UploadChunk`s and an `UploadEnd`. Nothing is buffered beyond the
+    current network chunk, so the next chunk is only read once the
+    consumer asks for more. URL-encoded bodies are small and are yielded
+    field by field after a normal ``request.form()``. Repeated names are
+    yielded once per occurrence.
+
+    Example::
+
+        async for event in stream_form(request):
+            match event:
+                case UploadChunk(data=data):
+                    digest.update(data)
+
+    Raises:
+        FormStreamError: If the body is malformed or exceeds a limit.
+
+    Yields:
+        `FormField`, `UploadStart`, `UploadChunk` and `UploadEnd` events, in body order.
+    """
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data":
+        form = await request.form(max_fields=max_fields, max_files=max_files)
+        for name, value in form.multi_items():
+            if isinstance(value, str):
+                yield FormField(name, value)
+        return
+
+    if b"boundary" not in params:
+        msg = "Missing boundary in multipart."
+        raise FormStreamError(msg)
+    charset = params.get(b"charset", b"utf-8").decode("latin-1")
+    events = _MultipartEvents(charset, max_fields=max_fields, max_files=max_files, max_field_size=max_field_size)
+    parser = MultipartParser(params[b"boundary"], events.callbacks())  # ty: ignore[invalid-argument-type]
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+            if events.events:
+                pending, events.events = events.events, []
+                for event in pending:
+                    yield event
+        parser.finalize()
+    except MultipartParseError as exc:
+        raise FormStreamError(str(exc)) from exc
@@ -3,7 +3,9 @@
 from air.model.main import (
     AirDB as AirDB,
     AirModel as AirModel,
+    InvalidCursor as InvalidCursor,
     MultipleObjectsReturned as MultipleObjectsReturned,
+    Page as Page,
 )
 
-__all__ = ["AirDB", "AirModel", "MultipleObjectsReturned"]
+__all__ = ["AirDB", "AirModel", "InvalidCursor", "MultipleObjectsReturned", "Page"]
@@ -25,31 +25,39 @@ Example::
     one = await UnicornSighting.get(id=1)
     all_rows = await UnicornSighting.all()
     count = await UnicornSighting.count()
+    async for sighting in UnicornSighting.stream(order_by="id"):
+        ...
     await db.create_tables()
 """
 
 from __future__ import annotations
 
+import base64
+import binascii
 import re
 import tomllib
+from collections.abc import Callable, Hashable
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import datetime
 from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from types import UnionType
-from typing import TYPE_CHECKING, Any, Self, get_args, get_origin
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, Self, get_args, get_origin, overload
 from uuid import UUID
 
 from pydantic import (
     BaseModel,
     ConfigDict,
+    TypeAdapter,
 )
 
 from air.field import PrimaryKey
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Sequence
 
     from pydantic.fields import FieldInfo
 
@@ -232,6 +240,168 @@ def _parse_kwargs(kwargs: dict[str, Any], *, start_idx: int = 1) -> tuple[list[s
     return conditions, values
 
 
+def _lookup_shape(kwargs: dict[str, Any]) -> tuple[Hashable, ...]:
+    """Return the part of *kwargs* that decides the SQL ``_parse_kwargs`` builds.
+
+    Only the keys matter, except for ``isnull`` whose value picks
+    ``IS NULL`` or ``IS NOT NULL``.
+    """
+    return tuple((key, bool(value)) if key.endswith("__isnull") else key for key, value in kwargs.items())
+
+
+def _lookup_values(kwargs: dict[str, Any]) -> list[Any]:
+    """Return the bind parameters ``_parse_kwargs`` would produce for *kwargs*."""
+    return [value for key, value in kwargs.items() if not key.endswith("__isnull")]
+
+
+def _where(kwargs: dict[str, Any], *, start_idx: int = 1) -> str:
+    return " AND ".join(_parse_kwargs(kwargs, start_idx=start_idx)[0])
+
+
+def _order_by_sql(order_by: str | None) -> str:
+    if order_by is None:
+        return ""
+    if order_by.startswith("-"):
+        return f' ORDER BY "{order_by[1:]}" DESC'
+    return f' ORDER BY "{order_by}" ASC'
+
+
+# ---------------------------------------------------------------------------
+# Per-model metadata and statement cache
+# ---------------------------------------------------------------------------
+
+_CAMEL_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+
+#: Distinct statements remembered per model before the cache starts over.
+SQL_CACHE_SIZE = 512
+
+#: Rows fetched per round trip by `AirModel.stream`.
+STREAM_PREFETCH = 500
+
+#: Most rows `AirModel.bulk_create` puts in one INSERT statement.
+BULK_CREATE_BATCH_SIZE = 1000
+
+#: PostgreSQL's limit on bind parameters in a single statement.
+MAX_BIND_PARAMS = 32767
+
+
+@dataclass(frozen=True, slots=True)
+class _ModelMeta:
+    """What every query needs to know about a model, computed once per class."""
+
+    table: str
+    pk: str | None
+    fields: tuple[str, ...]
+    non_pk: tuple[str, ...]
+    statements: dict[Hashable, str] = field(default_factory=dict)
+    row_factories: dict[tuple[str, ...], Callable[[Any], Any]] = field(default_factory=dict)
+    cursor_adapters: dict[tuple[tuple[str, bool], ...], TypeAdapter[tuple[Any, ...]]] = field(default_factory=dict)
+
+    def sql(self, key: Hashable, build: Callable[[], str]) -> str:
+        """Return the statement cached under *key*, building it on first use.
+
+        Reusing the exact same text for every call of the same shape is
+        what lets asyncpg's per-connection prepared statement cache hit, so
+        each statement is parsed and planned once per connection.
+        """
+        try:
+            return self.statements[key]
+        except KeyError:
+            if len(self.statements) >= SQL_CACHE_SIZE:
+                self.statements.clear()
+            sql = self.statements[key] = build()
+            return sql
+
+
+def _keyset_sql(order: tuple[tuple[str, bool], ...], start_idx: int) -> str:
+    """Return the condition selecting rows that sort after ``($start_idx, ...)`` in *order*.
+
+    When every column sorts the same way this is a single row-value
+    comparison, which PostgreSQL answers with one index seek. Mixed
+    directions need the expanded form: ``a > $1 OR (a = $1 AND b < $2) ...``.
+    """
+    params = [f"${start_idx + i}" for i in range(len(order))]
+    directions = {descending for _, descending in order}
+    if len(directions) == 1:
+        columns = ", ".join(f'"{name}"' for name, _ in order)
+        return f"({columns}) {'<' if order[0][1] else '>'} ({', '.join(params)})"
+    alternatives = []
+    for k, (name, descending) in enumerate(order):
+        terms = [f'"{prev}" = {params[i]}' for i, (prev, _) in enumerate(order[:k])]
+        terms.append(f'"{name}" {"<" if descending else ">"} {params[k]}')
+        alternatives.append(f"({' AND '.join(terms)})")
+    return f"({' OR '.join(alternatives)})"
+
+
+@dataclass(frozen=True, slots=True)
+class Page[M]:
+    """One page of a keyset-paginated query, returned by `AirModel.paginate`."""
+
+    items: list[M]
+    #: Opaque, URL-safe token for the next page, or None on the last page.
+    next_cursor: str | None = None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+def _row_factory(cls: type[AirModel], columns: tuple[str, ...]) -> Callable[[Any], Any]:
+    """Compile a function that builds *cls* instances from rows with these columns.
+
+    Does what ``model_construct`` does, minus the per-row alias and
+    default resolution: which columns map to fields, and which fields
+    need a default, is worked out once per column layout. Models that
+    need more (aliases, extra fields, ``model_post_init``) use
+    ``model_construct`` itself.
+    """
+    fields = cls.model_fields
+    if (
+        cls.__pydantic_post_init__
+        or cls.model_config.get("extra") == "allow"
+        or any(info.alias or info.validation_alias for info in fields.values())
+    ):
+        return lambda row: cls.model_construct(**dict(row))
+
+    names = tuple(column for column in columns if column in fields)
+    exact = names == columns
+    fields_set = frozenset(names)
+    defaults = [(name, info) for name, info in fields.items() if name not in fields_set and not info.is_required()]
+    new = object.__new__
+    # BaseModel's slot descriptors, called directly: object.__setattr__ would
+    # look each one up by name on every row.
+    slots = BaseModel.__dict__
+    set_dict = slots["__dict__"].__set__
+    set_fields_set = slots["__pydantic_fields_set__"].__set__
+    set_extra = slots["__pydantic_extra__"].__set__
+    set_private = slots["__pydantic_private__"].__set__
+
+    def build(row: Any) -> AirModel:
+        values = dict(row) if exact else {name: row[name] for name in names}
+        for name, info in defaults:
+            values[name] = info.get_default(call_default_factory=True, validated_data=values)
+        instance = new(cls)
+        set_dict(instance, values)
+        set_fields_set(instance, set(fields_set))
+        set_extra(instance, None)
+        set_private(instance, None)
+        return instance
+
+    return build
+
+
+def _model_meta(cls: type[AirModel]) -> _ModelMeta:
+    snake = _CAMEL_BOUNDARY.sub("_", cls.__name__).lower()
+    pk = next((name for name, info in cls.model_fields.items() if _is_primary_key(info)), None)
+    fields = tuple(cls.model_fields)
+    return _ModelMeta(
+        table=f"{_table_prefix(cls.__module__)}_{snake}",
+        pk=pk,
+        fields=fields,
+        non_pk=tuple(name for name in fields if name != pk),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Exceptions
 # ---------------------------------------------------------------------------
@@ -241,6 +411,10 @@ class MultipleObjectsReturned(Exception):  # noqa: N818
     """Raised by :meth:`AirModel.get` when the query matches more than one row."""
 
 
+class InvalidCursor(ValueError):  # noqa: N818
+    """Raised by :meth:`AirModel.paginate` when *after* is not a cursor for the requested ordering."""
+
+
 # ---------------------------------------------------------------------------
 # Module-level current-db reference (set during lifespan)
 # ---------------------------------------------------------------------------
@@ -270,6 +444,64 @@ def _get_pool() -> Any:
     return _current_db.pool
 
 
+@asynccontextmanager
+async def _atomic() -> AsyncGenerator[Any]:
+    """Yield a connection on which several statements run as one transaction.
+
+    Inside :meth:`AirDB.transaction` that is the current connection;
+    otherwise one is taken from the pool and its own transaction wraps the block.
+    """
+    conn = _current_connection.get()
+    if conn is not None:
+        yield conn
+        return
+    async with _get_pool().acquire() as conn:
+        txn = conn.transaction()
+        await txn.start()
+        try:
+            yield conn
+            await txn.commit()
+        except BaseException:
+            await txn.rollback()
+            raise
+
+
+def _column_runs(items: Sequence[dict[str, Any]], fields: tuple[str, ...]) -> list[tuple[tuple[str, ...], range]]:
+    """Split *items* into consecutive runs setting the same model *fields*, in field order.
+
+    Only neighbours are grouped, so rows go in, and take their serial ids, in input order.
+
+    Raises:
+        ValueError: If an item sets none of *fields*.
+    """
+    columns_for: dict[tuple[str, ...], tuple[str, ...]] = {}
+    runs: list[tuple[tuple[str, ...], range]] = []
+    start = 0
+    previous: tuple[str, ...] = ()
+    for index, item in enumerate(items):
+        keys = tuple(item)
+        columns = columns_for.get(keys)
+        if columns is None:
+            columns = columns_for[keys] = tuple(f for f in fields if f in item)
+            if not columns:
+                msg = f"bulk_create item {index} sets no columns."
+                raise ValueError(msg)
+        if columns != previous:
+            if index:
+                runs.append((previous, range(start, index)))
+            start, previous = index, columns
+    runs.append((previous, range(start, len(items))))
+    return runs
+
+
+def _insert_sql(table: str, columns: tuple[str, ...], rows: int) -> str:
+    width = len(columns)
+    values = ", ".join(
+        "(" + ", ".join(f"${start + j}" for j in range(1, width + 1)) + ")" for start in range(0, rows * width, width)
+    )
+    return f'INSERT INTO "{table}" ({", ".join(f'"{c}"' for c in columns)}) VALUES {values} RETURNING *'
+
+
 # ---------------------------------------------------------------------------
 # ORM base class
 # ---------------------------------------------------------------------------
@@ -295,25 +527,35 @@ class AirModel(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+    #: Table name, primary key and columns, filled in when the subclass is defined.
+    _air_meta: ClassVar[_ModelMeta]
+
+    #: Set to True to make trusted hydration this model's default: query
+    #: results are then built into instances without validation. Rows come
+    #: from this model's own typed columns, so validating them again only
+    #: costs time. Off by default; override per query with ``trusted=``.
+    trusted_rows: ClassVar[bool] = False
+
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
         _table_registry.append(cls)
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        # model_fields is only complete once Pydantic has built the class.
+        cls._air_meta = _model_meta(cls)
+
     # -- SQL generation helpers ----------------------------------------------
 
     @classmethod
     def _table_name(cls) -> str:
-        prefix = _table_prefix(cls.__module__)
-        snake = re.sub(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])", "_", cls.__name__).lower()
-        return f"{prefix}_{snake}"
+        return cls._air_meta.table
 
     @classmethod
     def _pk_field(cls) -> str | None:
         """Return the name of the primary-key field, or None."""
-        for name, info in cls.model_fields.items():
-            if _is_primary_key(info):
-                return name
-        return None
+        return cls._air_meta.pk
 
     @classmethod
     def _column_defs(cls) -> list[str]:
@@ -367,8 +609,62 @@ class AirModel(BaseModel):
     @classmethod
     def _non_pk_fields(cls) -> list[str]:
         """Return field names excluding the primary key."""
-        pk = cls._pk_field()
-        return [n for n in cls.model_fields if n != pk]
+        return list(cls._air_meta.non_pk)
+
+    @classmethod
+    def _select_sql(
+        cls, kwargs: dict[str, Any], order_by: str | None, limit: int | None, offset: int | None
+    ) -> tuple[str, list[Any]]:
+        """Build (or reuse) a ``SELECT *`` with LIMIT and OFFSET bound as parameters."""
+        values = _lookup_values(kwargs)
+        key = ("select", _lookup_shape(kwargs), order_by, limit is None, offset is None)
+
+        def build() -> str:
+            sql = f'SELECT * FROM "{cls._air_meta.table}"'
+            if kwargs:
+                sql += f" WHERE {_where(kwargs)}"
+            sql += _order_by_sql(order_by)
+            idx = len(values)
+            if limit is not None:
+                idx += 1
+                sql += f" LIMIT ${idx}"
+            if offset is not None:
+                sql += f" OFFSET ${idx + 1}"
+            return sql
+
+        sql = cls._air_meta.sql(key, build)
+        if limit is not None:
+            values.append(limit)
+        if offset is not None:
+            values.append(offset)
+        return sql, values
+
+    @classmethod
+    def _row_builder(cls, columns: tuple[str, ...], *, trusted: bool | None) -> Callable[[Any], Self]:
+        """Return the function that turns one fetched record with these columns into an instance.
+
+        Untrusted rows go through ``model_validate``. Trusted rows skip
+        validation and are built by a factory compiled for the column layout.
+        """
+        if not (cls.trusted_rows if trusted is None else trusted):
+            return lambda row: cls.model_validate(dict(row))
+        factories = cls._air_meta.row_factories
+        build = factories.get(columns)
+        if build is None:
+            if len(factories) >= SQL_CACHE_SIZE:
+                factories.clear()
+            build = factories[columns] = _row_factory(cls, columns)
+        return build
+
+    @classmethod
+    def _from_rows(cls, rows: Sequence[Any], *, trusted: bool | None) -> list[Self]:
+        """Turn fetched records into instances."""
+        if not rows:
+            return []
+        if not (cls.trusted_rows if trusted is None else trusted):
+            return [cls.model_validate(dict(r)) for r in rows]
+        build = cls._row_builder(tuple(rows[0].keys()), trusted=True)
+        return [build(r) for r in rows]
 
     # -- CRUD class methods --------------------------------------------------
 
@@ -384,23 +680,31 @@ class AirModel(BaseModel):
             A new instance of this Table subclass with all fields set.
         """
         pool = _get_pool()
-        fields = cls._non_pk_fields()
-        insert_fields = [f for f in fields if f in kwargs]
-        columns = ", ".join(f'"{f}"' for f in insert_fields)
-        placeholders = ", ".join(f"${i + 1}" for i in range(len(insert_fields)))
-        values = [kwargs[f] for f in insert_fields]
-
-        sql = f'INSERT INTO "{cls._table_name()}" ({columns}) VALUES ({placeholders}) RETURNING *'
-        row = await pool.fetchrow(sql, *values)
+        meta = cls._air_meta
+        insert_fields = tuple(f for f in meta.non_pk if f in kwargs)
+
+        def build() -> str:
+            columns = ", ".join(f'"{f}"' for f in insert_fields)
+            placeholders = ", ".join(f"${i + 1}" for i in range(len(insert_fields)))
+            return f'INSERT INTO "{meta.table}" ({columns}) VALUES ({placeholders}) RETURNING *'
+
+        sql = meta.sql(("insert", insert_fields), build)
+        row = await pool.fetchrow(sql, *[kwargs[f] for f in insert_fields])
         return cls.model_validate(dict(row))
 
     @classmethod
-    async def get(cls, **kwargs: Any) -> Self | None:
+    async def get(cls, *, trusted: bool | None = None, **kwargs: Any) -> Self | None:
         """Fetch exactly one row matching the given keyword filters.
 
         Supports Django-style ``__`` lookups (gt, gte, lt, lte, contains,
         icontains, in, isnull) in addition to plain equality.
 
+        Args:
+            trusted: Skip validation of the fetched row. Defaults to
+                :attr:`trusted_rows`.
+            **kwargs: Column name/value pairs to filter by, with optional
+                ``__lookup`` suffixes.
+
         Returns:
             An instance of this Model subclass, or ``None`` if no row matches.
 
@@ -408,16 +712,18 @@ class AirModel(BaseModel):
             MultipleObjectsReturned: If more than one row matches the filters.
         """
         pool = _get_pool()
-        conditions, values = _parse_kwargs(kwargs)
-        where = " AND ".join(conditions)
-        sql = f'SELECT * FROM "{cls._table_name()}" WHERE {where} LIMIT 2'
-        rows = await pool.fetch(sql, *values)
+        meta = cls._air_meta
+        sql = meta.sql(
+            ("get", _lookup_shape(kwargs)),
+            lambda: f'SELECT * FROM "{meta.table}" WHERE {_where(kwargs)} LIMIT 2',
+        )
+        rows = await pool.fetch(sql, *_lookup_values(kwargs))
         if not rows:
             return None
         if len(rows) > 1:
             msg = f"{cls.__name__}.get() matched more than one row. Use filter() to retrieve multiple results."
             raise MultipleObjectsReturned(msg)
-        return cls.model_validate(dict(rows[0]))
+        return cls._from_rows(rows, trusted=trusted)[0]
 
     @classmethod
     async def filter(
@@ -426,6 +732,7 @@ class AirModel(BaseModel):
         order_by: str | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        trusted: bool | None = None,
         **kwargs: Any,
     ) -> list[Self]:
         """Fetch all rows matching the given keyword filters.
@@ -438,6 +745,8 @@ class AirModel(BaseModel):
                 descending order (e.g. ``"-name"``).
             limit: Maximum number of rows to return.
             offset: Number of rows to skip before returning results.
+            trusted: Skip validation of the fetched rows. Defaults to
+                :attr:`trusted_rows`.
             **kwargs: Column name/value pairs to filter by, with optional
                 ``__lookup`` suffixes.
 
@@ -445,22 +754,9 @@ class AirModel(BaseModel):
             A list of model instances (possibly empty).
         """
         pool = _get_pool()
-        if not kwargs:
-            return await cls.all(order_by=order_by, limit=limit, offset=offset)
-        conditions, values = _parse_kwargs(kwargs)
-        where = " AND ".join(conditions)
-        sql = f'SELECT * FROM "{cls._table_name()}" WHERE {where}'
-        if order_by is not None:
-            if order_by.startswith("-"):
-                sql += f' ORDER BY "{order_by[1:]}" DESC'
-            else:
-                sql += f' ORDER BY "{order_by}" ASC'
-        if limit is not None:
-            sql += f" LIMIT {limit}"
-        if offset is not None:
-            sql += f" OFFSET {offset}"
+        sql, values = cls._select_sql(kwargs, order_by, limit, offset)
         rows = await pool.fetch(sql, *values)
-        return [cls.model_validate(dict(r)) for r in rows]
+        return cls._from_rows(rows, trusted=trusted)
 
     @classmethod
     async def all(
@@ -469,6 +765,7 @@ class AirModel(BaseModel):
         order_by: str | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        trusted: bool | None = None,
     ) -> list[Self]:
         """Fetch every row from the table.
 
@@ -477,23 +774,178 @@ class AirModel(BaseModel):
                 descending order (e.g. ``"-name"``).
             limit: Maximum number of rows to return.
             offset: Number of rows to skip before returning results.
+            trusted: Skip validation of the fetched rows. Defaults to
+                :attr:`trusted_rows`.
 
         Returns:
             A list of all model instances.
         """
         pool = _get_pool()
-        sql = f'SELECT * FROM "{cls._table_name()}"'
-        if order_by is not None:
-            if order_by.startswith("-"):
-                sql += f' ORDER BY "{order_by[1:]}" DESC'
-            else:
-                sql += f' ORDER BY "{order_by}" ASC'
-        if limit is not None:
-            sql += f" LIMIT {limit}"
-        if offset is not None:
-            sql += f" OFFSET {offset}"
-        rows = await pool.fetch(sql)
-        return [cls.model_validate(dict(r)) for r in rows]
+        sql, values = cls._select_sql({}, order_by, limit, offset)
+        rows = await pool.fetch(sql, *values)
+        return cls._from_rows(rows, trusted=trusted)
+
+    @classmethod
+    async def paginate(
+        cls,
+        *,
+        after: str | None = None,
+        order_by: str | Sequence[str] | None = None,
+        page_size: int = 25,
+        trusted: bool | None = None,
+        **kwargs: Any,
+    ) -> Page[Self]:
+        """Fetch one page of matching rows using keyset (seek) pagination.
+
+        Rather than skipping rows with ``OFFSET``, which the database must
+        walk through on every request, each page starts right after the
+        last row of the previous one. With an index on the ordering
+        columns page 2,000 costs the same as page 1. The primary key is
+        appended to the ordering so rows that tie still page reliably.
+
+        Example::
+
+            page = await Glaze.paginate(order_by="-created", after=request.query_params.get("after"))
+            if page.has_next:
+                more_url = f"/glazes?after={page.next_cursor}"
+
+        Args:
+            after: ``next_cursor`` of the previous page; omit for the first page.
+            order_by: Field name, or names, to sort by. Prefix with ``-`` for
+                descending order. Ordering columns should be ``NOT NULL``.
+                Defaults to the primary key.
+            page_size: Maximum number of rows on the page.
+            trusted: Skip validation of the fetched rows. Defaults to
+                :attr:`trusted_rows`.
+            **kwargs: Column name/value pairs to filter by, with optional
+                ``__lookup`` suffixes.
+
+        Returns:
+            The page's rows and the cursor for the next page.
+
+        Raises:
+            InvalidCursor: If *after* is not a cursor for this ordering.
+            ValueError: If *page_size* is less than 1, the model has no
+                primary key, *order_by* names an unknown field, or an
+                ordering column of the page's last row is NULL.
+        """
+        if page_size < 1:
+            msg = f"page_size must be at least 1, got {page_size}."
+            raise ValueError(msg)
+        order = cls._keyset_order(order_by)
+        pool = _get_pool()
+        meta = cls._air_meta
+        names = tuple(name for name, _ in order)
+        # The cursor leads with the ordering, directions included, so one can't be replayed under another
+        signature = ",".join(f"-{name}" if descending else name for name, descending in order)
+        adapter = meta.cursor_adapters.get(order)
+        if adapter is None:
+            annotations = tuple(cls.model_fields[name].annotation for name in names)
+            adapter = meta.cursor_adapters[order] = TypeAdapter(
+                tuple[Literal[signature], *annotations]  # ty: ignore[invalid-type-form]
+            )
+
+        values = _lookup_values(kwargs)
+        if after is not None:
+            try:
+                values.extend(adapter.validate_json(base64.urlsafe_b64decode(after + "=" * (-len(after) % 4)))[1:])
+            except (binascii.Error, ValueError):
+                msg = "Invalid pagination cursor."
+                raise InvalidCursor(msg) from None
+
+        def build() -> str:
+            conditions = _parse_kwargs(kwargs)[0]
+            if after is not None:
+                conditions.append(_keyset_sql(order, len(values) - len(order) + 1))
+            sql = f'SELECT * FROM "{meta.table}"'
+            if conditions:
+                sql += f" WHERE {' AND '.join(conditions)}"
+            ordering = ", ".join(f'"{name}" {"DESC" if descending else "ASC"}' for name, descending in order)
+            return f"{sql} ORDER BY {ordering} LIMIT ${len(values) + 1}"
+
+        sql = meta.sql(("paginate", _lookup_shape(kwargs), order, after is None), build)
+        rows = await pool.fetch(sql, *values, page_size + 1)
+        items = cls._from_rows(rows[:page_size], trusted=trusted)
+        if len(rows) <= page_size:
+            return Page(items)
+        last = tuple(getattr(items[-1], name) for name in names)
+        if None in last:
+            msg = f"Cannot paginate past a NULL {names[last.index(None)]!r}; ordering columns must be NOT NULL."
+            raise ValueError(msg)
+        cursor = base64.urlsafe_b64encode(adapter.dump_json((signature, *last))).rstrip(b"=").decode("ascii")
+        return Page(items, cursor)
+
+    @classmethod
+    def _keyset_order(cls, order_by: str | Sequence[str] | None) -> tuple[tuple[str, bool], ...]:
+        """Return ``(field, descending)`` pairs for *order_by*, ending with the primary key.
+
+        Raises:
+            ValueError: If the model has no primary key or *order_by* names an unknown field.
+        """
+        pk = cls._air_meta.pk
+        if pk is None:
+            msg = f"{cls.__name__} has no primary_key field"
+            raise ValueError(msg)
+        keys = [order_by] if isinstance(order_by, str) else list(order_by or ())
+        order = [(key.removeprefix("-"), key.startswith("-")) for key in keys]
+        for name, _ in order:
+            if name not in cls.model_fields:
+                msg = f"{cls.__name__} has no field {name!r} to order by."
+                raise ValueError(msg)
+        if pk not in {name for name, _ in order}:
+            order.append((pk, order[-1][1] if order else False))
+        return tuple(order)
+
+    @classmethod
+    async def stream(
+        cls,
+        *,
+        order_by: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        prefetch: int = STREAM_PREFETCH,
+        trusted: bool | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Self]:
+        """Yield matching rows one at a time from a server-side cursor.
+
+        Unlike :meth:`filter`, the result set is never held in memory:
+        rows are fetched *prefetch* at a time as the loop asks for them.
+        That makes it the source for exports of any size, e.g. a CSV
+        ``StreamingResponse`` or ``JinjaRenderer.stream(..., rows=Model.stream())``.
+
+        asyncpg cursors only live inside a transaction. Within
+        :meth:`AirDB.transaction` the current one is used; otherwise a
+        connection is taken from the pool for the whole iteration. Wrap
+        the loop in ``contextlib.aclosing`` when it may stop early, so that
+        connection is returned straight away.
+
+        Args:
+            order_by: Optional field name to sort by. Prefix with ``-`` for
+                descending order (e.g. ``"-name"``).
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip before returning results.
+            prefetch: Rows fetched per round trip.
+            trusted: Skip validation of the fetched rows. Defaults to
+                :attr:`trusted_rows`.
+            **kwargs: Column name/value pairs to filter by, with optional
+                ``__lookup`` suffixes.
+
+        Yields:
+            Model instances, in query order.
+        """
+        sql, values = cls._select_sql(kwargs, order_by, limit, offset)
+        async with _atomic() as conn:
+            async for instance in cls._hydrate_cursor(conn.cursor(sql, *values, prefetch=prefetch), trusted=trusted):
+                yield instance
+
+    @classmethod
+    async def _hydrate_cursor(cls, cursor: AsyncIterable[Any], *, trusted: bool | None) -> AsyncIterator[Self]:
+        build = None
+        async for record in cursor:
+            if build is None:
+                build = cls._row_builder(tuple(record.keys()), trusted=trusted)
+            yield build(record)
 
     @classmethod
     async def count(cls, **kwargs: Any) -> int:
@@ -506,51 +958,128 @@ class AirModel(BaseModel):
             Integer row count.
         """
         pool = _get_pool()
-        if kwargs:
-            conditions, values = _parse_kwargs(kwargs)
-            where = " AND ".join(conditions)
-            sql = f'SELECT COUNT(*) FROM "{cls._table_name()}" WHERE {where}'
-            return await pool.fetchval(sql, *values)
-        sql = f'SELECT COUNT(*) FROM "{cls._table_name()}"'
-        return await pool.fetchval(sql)
+        meta = cls._air_meta
+
+        def build() -> str:
+            sql = f'SELECT COUNT(*) FROM "{meta.table}"'
+            return f"{sql} WHERE {_where(kwargs)}" if kwargs else sql
+
+        sql = meta.sql(("count", _lookup_shape(kwargs)), build)
+        return await pool.fetchval(sql, *_lookup_values(kwargs))
 
     # -- Bulk class methods ---------------------------------------------------
 
+    @overload
     @classmethod
-    async def bulk_create(cls, items: list[dict[str, Any]]) -> list[Self]:
-        """Insert multiple rows in a single query and return the new instances.
+    async def bulk_create(
+        cls,
+        items: Sequence[dict[str, Any]],
+        *,
+        returning: Literal[True] = True,
+        batch_size: int = BULK_CREATE_BATCH_SIZE,
+        trusted: bool | None = None,
+    ) -> list[Self]: ...
 
-        Builds a multi-row INSERT with ``RETURNING *`` so only one round-trip
-        is needed regardless of list length.
+    @overload
+    @classmethod
+    async def bulk_create(
+        cls,
+        items: Sequence[dict[str, Any]],
+        *,
+        returning: Literal[False],
+        batch_size: int = BULK_CREATE_BATCH_SIZE,
+        trusted: bool | None = None,
+    ) -> int: ...
+
+    @classmethod
+    async def bulk_create(
+        cls,
+        items: Sequence[dict[str, Any]],
+        *,
+        returning: bool = True,
+        batch_size: int = BULK_CREATE_BATCH_SIZE,
+        trusted: bool | None = None,
+    ) -> list[Self] | int:
+        """Insert multiple rows and return the new instances.
+
+        Rows are sent as multi-row ``INSERT ... RETURNING *`` statements of
+        at most *batch_size* rows, fewer if that many would pass
+        PostgreSQL's 32,767 bind-parameter limit. Items may set different
+        columns, and columns an item leaves out take their database
+        default. Each run of neighbouring items setting the same columns
+        gets its own statements, so rows are inserted, and take their
+        serial ids, in the order of *items*. Keys that are not model
+        fields are ignored.
+
+        With ``returning=False`` the rows are loaded with ``COPY`` instead
+        (asyncpg's ``copy_records_to_table``), the fastest way into
+        PostgreSQL for large loads, and only the count comes back.
+
+        When more than one statement is needed they run in one transaction,
+        so either every row is inserted or none is.
 
         Args:
-            items: A list of dicts, each mapping column names to values.
+            items: Dicts mapping column names to values.
+            returning: Return the inserted instances. Pass ``False`` to load
+                with ``COPY`` and get the number of rows instead.
+            batch_size: Most rows per INSERT statement. Not used by ``COPY``.
+            trusted: Skip validation of the returned rows. Defaults to
+                :attr:`trusted_rows`.
 
         Returns:
-            A list of model instances, one per inserted row.
-        """
+            The model instances in the order of *items*, or the number of
+            rows inserted when *returning* is ``False``.
+
+        Raises:
+            ValueError: If an item sets none of the model's columns.
+        """  # noqa: DOC502
         if not items:
-            return []
+            return [] if returning else 0
+
+        runs = _column_runs(items, cls._air_meta.non_pk)
+        if not returning:
+            if len(runs) == 1:
+                return await cls._copy_rows(_get_pool(), items, *runs[0])
+            async with _atomic() as conn:
+                return sum([await cls._copy_rows(conn, items, *run) for run in runs])
+
+        chunks: list[tuple[tuple[str, ...], range, int]] = []
+        for columns, indexes in runs:
+            size = max(1, min(batch_size, MAX_BIND_PARAMS // len(columns)))
+            chunks.extend((columns, indexes[i : i + size], size) for i in range(0, len(indexes), size))
+        if len(chunks) == 1:
+            rows = await cls._insert_rows(_get_pool(), items, *chunks[0])
+            return cls._from_rows(rows, trusted=trusted)
+
+        results: list[Self] = []
+        async with _atomic() as conn:
+            for chunk in chunks:
+                results.extend(cls._from_rows(await cls._insert_rows(conn, items, *chunk), trusted=trusted))
+        return results
 
-        pool = _get_pool()
-        fields = cls._non_pk_fields()
-        # Use the columns present in the first item (all items must have the same keys)
-        insert_fields = [f for f in fields if f in items[0]]
-        columns = ", ".join(f'"{f}"' for f in insert_fields)
-
-        # Build ($1, $2), ($3, $4), ... with flattened parameter list
-        value_groups: list[str] = []
-        all_values: list[Any] = []
-        for i, item in enumerate(items):
-            offset = i * len(insert_fields)
-            placeholders = ", ".join(f"${offset + j + 1}" for j in range(len(insert_fields)))
-            value_groups.append(f"({placeholders})")
-            all_values.extend(item[f] for f in insert_fields)
-
-        values_sql = ", ".join(value_groups)
-        sql = f'INSERT INTO "{cls._table_name()}" ({columns}) VALUES {values_sql} RETURNING *'
-        rows = await pool.fetch(sql, *all_values)
-        return [cls.model_validate(dict(r)) for r in rows]
+    @classmethod
+    async def _insert_rows(
+        cls, conn: Any, items: Sequence[dict[str, Any]], columns: tuple[str, ...], indexes: range, size: int
+    ) -> list[Any]:
+        meta = cls._air_meta
+
+        def build() -> str:
+            return _insert_sql(meta.table, columns, len(indexes))
+
+        # Full chunks repeat from call to call; the length of a remainder rarely does.
+        sql = meta.sql(("bulk_insert", columns, size), build) if len(indexes) == size else build()
+        return await conn.fetch(sql, *[items[i][c] for i in indexes for c in columns])
+
+    @classmethod
+    async def _copy_rows(
+        cls, conn: Any, items: Sequence[dict[str, Any]], columns: tuple[str, ...], indexes: range
+    ) -> int:
+        record = itemgetter(*columns) if len(columns) > 1 else lambda item: (item[columns[0]],)
+        status = await conn.copy_records_to_table(
+            cls._air_meta.table, records=(record(items[i]) for i in indexes), columns=list(columns)
+        )
+        # asyncpg returns e.g. "COPY 1000"
+        return int(status.split()[-1])
 
     @classmethod
     async def bulk_update(cls, set_values: dict[str, Any], **filter_kwargs: Any) -> int:
@@ -565,15 +1094,15 @@ class AirModel(BaseModel):
             The number of rows updated.
         """
         pool = _get_pool()
-        set_clauses = [f'"{col}" = ${i + 1}' for i, col in enumerate(set_values)]
-        set_sql = ", ".join(set_clauses)
-        set_params = list(set_values.values())
+        meta = cls._air_meta
 
-        conditions, where_params = _parse_kwargs(filter_kwargs, start_idx=len(set_values) + 1)
-        where_sql = " AND ".join(conditions)
+        def build() -> str:
+            set_sql = ", ".join(f'"{col}" = ${i + 1}' for i, col in enumerate(set_values))
+            where_sql = _where(filter_kwargs, start_idx=len(set_values) + 1)
+            return f'UPDATE "{meta.table}" SET {set_sql} WHERE {where_sql}'
 
-        sql = f'UPDATE "{cls._table_name()}" SET {set_sql} WHERE {where_sql}'
-        status = await pool.execute(sql, *set_params, *where_params)
+        sql = meta.sql(("update", tuple(set_values), _lookup_shape(filter_kwargs)), build)
+        status = await pool.execute(sql, *set_values.values(), *_lookup_values(filter_kwargs))
         # asyncpg returns e.g. "UPDATE 3"
         return int(status.split()[-1])
 
@@ -589,11 +1118,12 @@ class AirModel(BaseModel):
             The number of rows deleted.
         """
         pool = _get_pool()
-        conditions, values = _parse_kwargs(filter_kwargs)
-        where_sql = " AND ".join(conditions)
-
-        sql = f'DELETE FROM "{cls._table_name()}" WHERE {where_sql}'
-        status = await pool.execute(sql, *values)
+        meta = cls._air_meta
+        sql = meta.sql(
+            ("delete", _lookup_shape(filter_kwargs)),
+            lambda: f'DELETE FROM "{meta.table}" WHERE {_where(filter_kwargs)}',
+        )
+        status = await pool.execute(sql, *_lookup_values(filter_kwargs))
         # asyncpg returns e.g. "DELETE 5"
         return int(status.split()[-1])
 
@@ -609,7 +1139,8 @@ class AirModel(BaseModel):
                 value is ``None``, or *update_fields* is an empty list.
         """
         pool = _get_pool()
-        pk = self._pk_field()
+        meta = self._air_meta
+        pk = meta.pk
         if pk is None:
             msg = f"{type(self).__name__} has no primary_key field"
             raise ValueError(msg)
@@ -622,14 +1153,15 @@ class AirModel(BaseModel):
             msg = "update_fields cannot be empty. Omit the argument to update all fields."
             raise ValueError(msg)
 
-        fields = update_fields if update_fields is not None else self._non_pk_fields()
-        set_clauses = [f'"{f}" = ${i + 1}' for i, f in enumerate(fields)]
-        values = [getattr(self, f) for f in fields]
-        pk_placeholder = f"${len(fields) + 1}"
+        fields = tuple(update_fields) if update_fields is not None else meta.non_pk
+
+        def build() -> str:
+            set_clauses = ", ".join(f'"{f}" = ${i + 1}' for i, f in enumerate(fields))
+            return f'UPDATE "{meta.table}" SET {set_clauses} WHERE "{pk}" = ${len(fields) + 1} RETURNING *'
 
-        sql = f'UPDATE "{self._table_name()}" SET {", ".join(set_clauses)} WHERE "{pk}" = {pk_placeholder} RETURNING *'
-        row = await pool.fetchrow(sql, *values, pk_value)
-        for field_name in type(self).model_fields:
+        sql = meta.sql(("save", fields), build)
+        row = await pool.fetchrow(sql, *[getattr(self, f) for f in fields], pk_value)
+        for field_name in meta.fields:
             if field_name in row:
                 object.__setattr__(self, field_name, row[field_name])  # noqa: PLC2801
 
@@ -641,7 +1173,8 @@ class AirModel(BaseModel):
                 the PK value is ``None``.
         """
         pool = _get_pool()
-        pk = self._pk_field()
+        meta = self._air_meta
+        pk = meta.pk
         if pk is None:
             msg = f"{type(self).__name__} has no primary_key field"
             raise ValueError(msg)
@@ -650,7 +1183,7 @@ class AirModel(BaseModel):
             msg = "Cannot delete a row without a primary key value."
             raise ValueError(msg)
 
-        sql = f'DELETE FROM "{self._table_name()}" WHERE "{pk}" = $1'
+        sql = meta.sql(("delete_pk",), lambda: f'DELETE FROM "{meta.table}" WHERE "{pk}" = $1')
         await pool.execute(sql, pk_value)
         object.__setattr__(self, pk, None)  # noqa: PLC2801
 
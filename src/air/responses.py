@@ -1,8 +1,11 @@
 """Air uses custom response classes to improve the developer experience."""
 
-from collections.abc import Mapping
-from typing import override
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Final, Literal, override
 
+import anyio
+from anyio.streams.memory import MemoryObjectSendStream
 from fastapi import status
 from starlette.background import BackgroundTask
 from starlette.datastructures import URL
@@ -19,6 +22,61 @@ from starlette.types import Send
 
 from .tags import BaseTag
 
+type SSEOverflowPolicy = Literal["block", "drop", "close"]
+"""What `SSEResponse` does when its queue is full: wait, discard the event, or end the stream."""
+
+SSE_PING: Final = b": ping\n\n"
+"""Comment frame sent as a keep-alive; EventSource clients ignore it."""
+
+
+async def relay_batches[T](
+    produce: Callable[[MemoryObjectSendStream[T]], Awaitable[None]],
+    send_batch: Callable[[list[T]], Awaitable[None]],
+    *,
+    max_queue: int,
+    max_batch: int,
+    helpers: Sequence[Callable[[MemoryObjectSendStream[T]], Awaitable[None]]] = (),
+) -> None:
+    """Run `produce` in a task that fills a bounded queue, and send whatever it has queued in batches.
+
+    Each `send_batch` call gets the next item plus anything else already
+    waiting, up to `max_batch` items: a fast producer is coalesced and a
+    slow one is never delayed. The queue is closed when `produce` returns.
+    `helpers`, such as a heartbeat, run alongside it on the same queue and
+    are cancelled once the queue is drained. An error from either side
+    stops both and is re-raised here.
+    """
+    send_stream, receive_stream = anyio.create_memory_object_stream[T](max_queue)
+    errors: list[Exception] = []
+
+    async def producer() -> None:
+        async with send_stream:
+            try:
+                await produce(send_stream)
+            except anyio.BrokenResourceError:
+                pass
+            except Exception as exc:  # noqa: BLE001 - re-raised below, outside the task group
+                errors.append(exc)
+
+    async with anyio.create_task_group() as task_group, receive_stream:
+        task_group.start_soon(producer)
+        for helper in helpers:
+            task_group.start_soon(helper, send_stream)
+        try:
+            async for item in receive_stream:
+                batch = [item]
+                while len(batch) < max_batch:
+                    try:
+                        batch.append(receive_stream.receive_nowait())
+                    except (anyio.WouldBlock, anyio.EndOfStream):
+                        break
+                await send_batch(batch)
+        except Exception as exc:  # noqa: BLE001 - re-raised below, outside the task group
+            errors.append(exc)
+        task_group.cancel_scope.cancel()
+    if errors:
+        raise errors[0]
+
 
 class AirResponse(HTMLResponse):
     """Response class to handle air.tags.Tags or HTML (from Jinja2)."""
@@ -37,6 +95,71 @@ TagResponse = AirResponse
 """Alias for the `AirResponse` Response class; use it if it improves clarity."""
 
 
+def format_sse(
+    data: Any,
+    *,
+    event: str | None = "message",
+    id: str | None = None,  # noqa: A002 - SSE field name
+    retry: int | None = None,
+    charset: str = "utf-8",
+) -> bytes:
+    """Encode data as a single Server-Sent Events frame.
+
+    Each line of `str(data)` becomes its own `data:` field.
+
+    Returns:
+        The encoded frame, terminated by a blank line.
+    """
+    fields = []
+    if event is not None:
+        fields.append(f"event: {event}\n")
+    if id is not None:
+        fields.append(f"id: {id}\n")
+    if retry is not None:
+        fields.append(f"retry: {retry}\n")
+    fields.extend(f"data: {line}\n" for line in str(data).splitlines())
+    fields.append("\n")
+    return "".join(fields).encode(charset)
+
+
+@dataclass(frozen=True, slots=True)
+class SSEEvent:
+    """A Server-Sent Event with optional `event`, `id` and `retry` fields.
+
+    Example:
+
+        async def notifications():
+            async for note in feed():
+                yield air.SSEEvent(air.Li(note.text), event="note", id=str(note.id))
+    """
+
+    data: Any
+    event: str | None = None
+    id: str | None = None
+    retry: int | None = None
+
+    def __post_init__(self) -> None:
+        for name in ("event", "id"):
+            value = getattr(self, name)
+            if value is not None and ("\n" in value or "\r" in value):
+                msg = f"SSE {name} must not contain line breaks: {value!r}"
+                raise ValueError(msg)
+
+    def encode(self, charset: str = "utf-8", default_event: str | None = "message") -> bytes:
+        """Encode the event, falling back to `default_event` when no name is set.
+
+        Returns:
+            The encoded frame.
+        """
+        return format_sse(
+            self.data,
+            event=self.event if self.event is not None else default_event,
+            id=self.id,
+            retry=self.retry,
+            charset=charset,
+        )
+
+
 class SSEResponse(StreamingResponse):
     """Response class for Server Sent Events
 
@@ -82,10 +205,76 @@ class SSEResponse(StreamingResponse):
         @app.get("/lottery-numbers")
         async def get():
             return air.SSEResponse(lottery_generator())
+
+    Items are rendered and queued by a producer task while the response
+    drains the queue, so events that pile up while the client is slow are
+    coalesced into a single send. Yield `SSEEvent` to set a per-event
+    `event`, `id` or `retry`; `bytes` are sent as-is.
+
+    Args:
+        content: Async or sync iterable of tags, strings, `SSEEvent` or bytes.
+        status_code: HTTP status code of the response.
+        headers: Optional additional headers.
+        media_type: Media type, defaults to `text/event-stream`.
+        background: Optional background task to run after the stream ends.
+        event: Event name used for items that are not an `SSEEvent`.
+        retry: Reconnection time in milliseconds, sent once at the start.
+        ping: Seconds of inactivity before a keep-alive comment is sent.
+            `None` disables heartbeats.
+        max_queue: Maximum number of encoded events buffered for the client.
+        overflow: Slow-consumer policy when the queue is full: `"block"`
+            pauses the generator, `"drop"` discards the event and
+            `"close"` ends the stream.
+        max_batch: Maximum number of queued events coalesced into one send.
     """
 
     media_type = "text/event-stream"
 
+    def __init__(
+        self,
+        content: AsyncIterable[Any] | Iterable[Any],
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        background: BackgroundTask | None = None,
+        *,
+        event: str | None = "message",
+        retry: int | None = None,
+        ping: float | None = None,
+        max_queue: int = 64,
+        overflow: SSEOverflowPolicy = "block",
+        max_batch: int = 64,
+    ) -> None:
+        if max_queue < 1 or max_batch < 1:
+            msg = "max_queue and max_batch must be at least 1"
+            raise ValueError(msg)
+        super().__init__(
+            content, status_code=status_code, headers=headers, media_type=media_type, background=background
+        )
+        self.event = event
+        self.retry = retry
+        self.ping = ping
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self.max_batch = max_batch
+        self.dropped = 0
+        """Number of events discarded by the `"drop"` overflow policy."""
+        self._last_write = 0.0
+
+    def encode(self, chunk: Any) -> bytes:
+        """Encode one item yielded by the content iterator as an SSE frame.
+
+        Returns:
+            The encoded frame, or the chunk itself when it is already bytes.
+        """
+        if isinstance(chunk, bytes):
+            return chunk
+        if isinstance(chunk, memoryview):
+            return chunk.tobytes()
+        if isinstance(chunk, SSEEvent):
+            return chunk.encode(self.charset, default_event=self.event)
+        return format_sse(chunk, event=self.event, charset=self.charset)
+
     async def stream_response(self, send: Send) -> None:
         await send(
             {
@@ -94,17 +283,51 @@ class SSEResponse(StreamingResponse):
                 "headers": self.raw_headers,
             },
         )
-        async for chunk in self.body_iterator:
-            if not isinstance(chunk, bytes | memoryview):
-                lines = list(str(chunk).splitlines())
-                formatted = [f"data: {t}" for t in lines]
-                data = "\n".join(formatted)
-                chunk = f"event: message\n{data}\n\n"
-                chunk = chunk.encode(self.charset)
-            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        if self.retry is not None:
+            await send({"type": "http.response.body", "body": f"retry: {self.retry}\n\n".encode(), "more_body": True})
+        self._last_write = anyio.current_time()
 
+        async def send_batch(frames: list[bytes]) -> None:
+            await send({"type": "http.response.body", "body": b"".join(frames), "more_body": True})
+            self._last_write = anyio.current_time()
+
+        helpers = [self._heartbeat] if self.ping is not None else []
+        await relay_batches(
+            self._produce, send_batch, max_queue=self.max_queue, max_batch=self.max_batch, helpers=helpers
+        )
         await send({"type": "http.response.body", "body": b"", "more_body": False})
 
+    async def _produce(self, send_stream: MemoryObjectSendStream[bytes]) -> None:
+        """Encode items from the body iterator into the queue, applying the overflow policy."""
+        async for chunk in self.body_iterator:
+            frame = self.encode(chunk)
+            if self.overflow == "block":
+                await send_stream.send(frame)
+                continue
+            try:
+                send_stream.send_nowait(frame)
+            except anyio.WouldBlock:
+                if self.overflow == "close":
+                    break
+                self.dropped += 1
+
+    async def _heartbeat(self, send_stream: MemoryObjectSendStream[bytes]) -> None:
+        """Queue a keep-alive comment whenever nothing was written for `ping` seconds."""
+        ping = self.ping
+        if ping is None:
+            return
+        while True:
+            await anyio.sleep_until(self._last_write + ping)
+            if anyio.current_time() - self._last_write < ping:
+                continue
+            try:
+                send_stream.send_nowait(SSE_PING)
+            except anyio.WouldBlock:
+                pass
+            except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+                return
+            self._last_write = anyio.current_time()
+
 
 class RedirectResponse(StarletteRedirectResponse):
     """Response class for HTTP redirects.
@@ -12,7 +12,7 @@ from typing import (
     Protocol,
     TypedDict,
     Unpack,
-    get_type_hints,
+    overload,
     override,
 )
 from urllib.parse import urlencode
@@ -27,13 +27,18 @@ from starlette.routing import (
     BaseRoute,
 )
 from starlette.types import ASGIApp, Lifespan
+from starlette.websockets import WebSocket
 from typing_extensions import Doc
 
+from .cache import PageCachePolicy
+from .coalescing import SingleFlight
+from .conditional import ConditionalGet, ETagFunction, LastModifiedFunction
 from .exception_handlers import default_404_router_handler
 from .requests import AirRequest
 from .responses import AirResponse
 from .tags.models.base import BaseTag
-from .utils import cached_signature, cached_unwrap, compute_page_path, default_generate_unique_id
+from .utils import compute_page_path, default_generate_unique_id, resolved_signature
+from .websockets import AirWebSocket
 
 # Register BaseTag in FastAPI's encoder so jsonable_encoder calls str(tag)
 # instead of vars(tag). This eliminates the need for endpoint wrappers.
@@ -93,6 +98,18 @@ class RouteKwargs(TypedDict, total=False):
     callbacks: list[BaseRoute] | None
     openapi_extra: dict[str, Any] | None
     generate_unique_id_function: Callable[[APIRoute], str]
+    etag: bool | ETagFunction
+    """Answer `If-None-Match` with 304: `True` hashes the rendered body, a function
+    returns a version key before the handler runs so matching requests skip rendering."""
+    last_modified: LastModifiedFunction
+    """Return when the resource last changed; answers `If-Modified-Since` with 304."""
+    cache_ttl: float
+    """Seconds `air.cache.PageCacheMiddleware` may serve this route's pages from its cache."""
+    stale_while_revalidate: float
+    """Seconds past `cache_ttl` a stale page is still served while it is refreshed."""
+    singleflight: bool | Sequence[str]
+    """Coalesce identical concurrent GET requests into one handler call; see `air.singleflight`.
+    A list of header names replaces the default `vary` headers that identify a request."""
 
 
 class AirRoute(APIRoute):
@@ -104,16 +121,7 @@ class AirRoute(APIRoute):
         endpoint = kwargs.get("endpoint") or (args[1] if len(args) > 1 else None)
 
         if endpoint is not None:
-            original = cached_unwrap(endpoint)
-            resolved_hints = get_type_hints(original, include_extras=True)
-            sig = cached_signature(endpoint)
-            endpoint.__signature__ = sig.replace(
-                parameters=[
-                    param.replace(annotation=resolved_hints.get(name, param.annotation))
-                    for name, param in sig.parameters.items()
-                ],
-                return_annotation=resolved_hints.get("return", sig.return_annotation),
-            )
+            endpoint.__signature__ = resolved_signature(endpoint)
 
         super().__init__(*args, **kwargs)
 
@@ -126,10 +134,19 @@ class AirRoute(APIRoute):
     @override
     def get_route_handler(self) -> Callable:
         original_route_handler = super().get_route_handler()
+        conditional_get: ConditionalGet | None = getattr(self.endpoint, "conditional_get", None)
+        single_flight: SingleFlight | None = getattr(self.endpoint, "singleflight", None)
+
+        async def handle(request: Any) -> Response:
+            if single_flight is not None:
+                return await single_flight(request, original_route_handler)
+            return await original_route_handler(request)
 
         async def custom_route_handler(request: Any) -> Response:
             request = AirRequest(request.scope, request.receive)
-            return await original_route_handler(request)
+            if conditional_get is not None:
+                return await conditional_get(request, handle)
+            return await handle(request)
 
         return custom_route_handler
 
@@ -295,6 +312,57 @@ class RouterMixin:
         """
         return self._route("delete", path, **kwargs)
 
+    def websocket(
+        self,
+        path: str,
+        *,
+        name: str | None = None,
+        dependencies: Sequence[Depends] | None = None,
+    ) -> Callable[[Callable[..., Any]], RouteCallable]:
+        """Register a WebSocket route. The handler must be async and receives
+        an ``air.WebSocket`` that can send Air tags directly, for use with the
+        htmx ws extension (``hx_ext="ws"``, ``ws_connect=handler.url()``).
+
+        The decorated function gains a ``.url()`` method for reverse URL
+        generation.
+
+        Example::
+
+            @app.websocket("/ticker")
+            async def ticker(websocket: air.WebSocket) -> None:
+                await websocket.accept()
+                async for message in websocket.iter_json():
+                    await websocket.send_tag(air.Div(message["text"], id="ticker"))
+        """
+
+        def decorator(func: Callable[..., Any]) -> RouteCallable:
+            endpoint = self._wrap_websocket_endpoint(func)
+            decorated = self._target.websocket(path, name=name, dependencies=dependencies)(endpoint)
+            decorated.url = self._url_helper(name or getattr(func, "__name__", "unknown"))
+            return decorated
+
+        return decorator
+
+    @staticmethod
+    def _wrap_websocket_endpoint(func: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap func so the WebSocket FastAPI injects arrives as an AirWebSocket.
+
+        The injected object is adopted rather than copied, so dependencies
+        that accepted or used the connection share its state with func.
+
+        Returns:
+            An async endpoint with the same signature as func.
+        """
+
+        @wraps(func)
+        async def endpoint(*args: Any, **kw: Any) -> Any:
+            for key, value in kw.items():
+                if isinstance(value, WebSocket):
+                    kw[key] = AirWebSocket.adopt(value)
+            return await func(*args, **kw)
+
+        return endpoint
+
     def _route(self, method: str, path: str, **kwargs: Any) -> Callable[[Callable[..., Any]], RouteCallable]:
         """Shared implementation for all HTTP method decorators.
 
@@ -304,9 +372,21 @@ class RouterMixin:
         name = kwargs.get("name")
         response_class = kwargs.pop("response_class", AirResponse)
         status_code = kwargs.pop("status_code", None)
+        etag = kwargs.pop("etag", False)
+        last_modified = kwargs.pop("last_modified", None)
+        cache_ttl = kwargs.pop("cache_ttl", None)
+        stale_while_revalidate = kwargs.pop("stale_while_revalidate", 0.0)
+        single_flight = kwargs.pop("singleflight", False)
 
         def decorator(func: Callable[..., Any]) -> RouteCallable:
             endpoint = self._wrap_endpoint(func, response_class, status_code)
+            if etag or last_modified is not None:
+                endpoint.conditional_get = ConditionalGet(etag=etag, last_modified=last_modified)  # ty: ignore[unresolved-attribute]
+            if cache_ttl is not None:
+                endpoint.page_cache = PageCachePolicy(cache_ttl, stale_while_revalidate)  # ty: ignore[unresolved-attribute]
+            if single_flight and getattr(endpoint, "singleflight", None) is None:
+                flight = SingleFlight() if single_flight is True else SingleFlight(vary=tuple(single_flight))
+                endpoint.singleflight = flight  # ty: ignore[unresolved-attribute]
             register = getattr(self._target, method)
             decorated = register(
                 path, response_model=None, response_class=response_class, status_code=status_code, **kwargs
@@ -316,12 +396,23 @@ class RouterMixin:
 
         return decorator
 
-    def page(self, func: FunctionType) -> RouteCallable:
+    @overload
+    def page(self, func: FunctionType, /) -> RouteCallable: ...
+
+    @overload
+    def page(self, func: None = None, /, **kwargs: Unpack[RouteKwargs]) -> Callable[[FunctionType], RouteCallable]: ...
+
+    def page(
+        self, func: FunctionType | None = None, /, **kwargs: Unpack[RouteKwargs]
+    ) -> RouteCallable | Callable[[FunctionType], RouteCallable]:
         """Decorator that creates a GET route using the function name as the path.
 
         Underscores in the function name are converted to dashes in the URL.
         If the name of the function is "index", then the route is "/".
 
+        Called with keyword arguments, e.g. ``@app.page(etag=True)``, it
+        accepts the same options as ``get``.
+
         Returns:
             The decorated function registered as a page route.
 
@@ -349,11 +440,21 @@ class RouterMixin:
 
 
             app.include_router(router)
+
+
+            @app.page(etag=lambda request: catalog.version)
+            def catalog_page() -> air.Main:  # 304 without rendering when unchanged
+                return render_catalog(catalog)
         """
-        page_path = compute_page_path(func.__name__, separator=self.path_separator)
 
-        # Pin the route's response_class for belt-and-suspenders robustness
-        return self.get(page_path)(func)
+        def decorator(func: FunctionType) -> RouteCallable:
+            page_path = compute_page_path(func.__name__, separator=self.path_separator)
+            # Pin the route's response_class for belt-and-suspenders robustness
+            return self.get(page_path, **kwargs)(func)
+
+        if func is None:
+            return decorator
+        return decorator(func)
 
     def _url_helper(self, name: str) -> Callable[..., str]:
         """Helper function to generate URLs for route operations.
@@ -0,0 +1,629 @@
+"""AirTable: server-side data tables driven by AirField table metadata.
+
+Reads ``Sortable``, ``Filterable``, ``ColumnAlign``, ``ColumnWidth``,
+``DisplayFormat``, ``Grouped``, ``Priority``, ``Compact``, ``Choices``
+and ``Hidden("table")`` from the model's fields. Sorting, filtering and
+paging are pushed down to ``AirModel.paginate()``, so only the visible
+page is ever fetched, validated or rendered.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from html import escape
+from itertools import groupby
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, ClassVar, Self, get_args, get_origin
+from urllib.parse import urlencode
+from weakref import WeakKeyDictionary
+
+from pydantic import TypeAdapter, ValidationError
+
+from air.field.types import (
+    BasePresentation,
+    Choices,
+    ColumnAlign,
+    ColumnWidth,
+    Compact,
+    DisplayFormat,
+    Filterable,
+    Grouped,
+    Hidden,
+    Label,
+    PrimaryKey,
+    Priority,
+    Sortable,
+)
+from air.model import AirModel, InvalidCursor
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from pydantic.fields import FieldInfo
+
+    from air.requests import Request
+
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+_RELATIVE_UNITS = (("year", 31_536_000), ("month", 2_592_000), ("day", 86_400), ("hour", 3_600), ("minute", 60))
+
+
+def _human_bytes(value: float) -> str:
+    exponent = min(int(math.log(value, 1024)), len(_BYTE_UNITS) - 1) if value >= 1 else 0
+    size = value / 1024**exponent
+    return (
+        f"{size:.0f} {_BYTE_UNITS[exponent]}" if exponent == 0 or size >= 10 else f"{size:.1f} {_BYTE_UNITS[exponent]}"
+    )
+
+
+def _relative_time(value: datetime) -> str:
+    now = datetime.now(UTC) if value.tzinfo else datetime.now()
+    seconds = (now - value).total_seconds()
+    suffix = "ago" if seconds >= 0 else "from now"
+    seconds = abs(seconds)
+    for unit, length in _RELATIVE_UNITS:
+        if seconds >= length:
+            count = int(seconds // length)
+            return f"{count} {unit}{'s' if count != 1 else ''} {suffix}"
+    return "just now"
+
+
+def _display_format(display: DisplayFormat) -> Callable[[Any], str]:
+    """Return a function formatting values for display, per the ``DisplayFormat`` pattern.
+
+    ``locale`` is not applied; currency is shown with a dollar sign.
+    """
+    pattern = display.pattern
+    if pattern == "percent":
+        return lambda value: f"{value:.0%}"
+    if pattern == "currency":
+        return lambda value: f"${value:,.2f}"
+    if pattern == "bytes":
+        return _human_bytes
+    if pattern == "relative_time":
+        return _relative_time
+    if "%" in pattern:
+        return lambda value: value.strftime(pattern)
+    return lambda value: format(value, pattern)
+
+
+def _cell_formatter(field_info: FieldInfo, meta: dict[type, BasePresentation]) -> Callable[[Any], str]:
+    """Compile a function turning a field value into escaped cell HTML."""
+    display = meta.get(DisplayFormat)
+    to_text: Callable[[Any], str] = _display_format(display) if isinstance(display, DisplayFormat) else str
+    choices = meta.get(Choices)
+    labels = dict(choices.options) if isinstance(choices, Choices) else None
+    compact = meta.get(Compact)
+    max_length = compact.max_length if isinstance(compact, Compact) else None
+
+    def format_cell(value: Any) -> str:
+        if value is None:
+            return ""
+        if labels is not None and value in labels:
+            text = labels[value]
+        else:
+            try:
+                text = to_text(value)
+            except (TypeError, ValueError, AttributeError):
+                text = str(value)
+        if max_length is not None and len(text) > max_length:
+            return f'<span title="{escape(text)}">{escape(text[: max_length - 1])}…</span>'
+        return escape(text)
+
+    return format_cell
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    args = [arg for arg in get_args(annotation) if arg is not type(None)]
+    if len(args) == 1 and type(None) in get_args(annotation):
+        return args[0]
+    return annotation
+
+
+def _filter_input_type(annotation: Any) -> str:
+    if annotation in {int, float}:
+        return "number"
+    if annotation is datetime:
+        return "datetime-local"
+    if annotation is date:
+        return "date"
+    return "search"
+
+
+@dataclass(frozen=True, slots=True)
+class _Column:
+    """Everything needed to render one column, compiled once per model."""
+
+    name: str
+    label: str
+    style: str
+    cell_open: str
+    format: Callable[[Any], str]
+    sortable: Sortable | None
+    filterable: Filterable | None
+    group: str | None
+    width: ColumnWidth | None
+    choices: tuple[tuple[Any, str], ...]
+    input_type: str
+    coerce: TypeAdapter
+
+
+@dataclass(frozen=True, slots=True)
+class _TablePlan:
+    """A model's compiled columns and its bulk row renderer."""
+
+    columns: tuple[_Column, ...]
+    primary_key: str | None
+    default_sort: str | None
+
+    def render_rows(self, rows: Iterable[Any], row_id_prefix: str) -> str:
+        """Render rows as one string of ``<tr>`` elements.
+
+        Values are fetched with a single ``attrgetter`` per row and each
+        cell is a precompiled opening tag plus a formatter call, so no
+        tag objects are built.
+        """
+        names = [column.name for column in self.columns]
+        if self.primary_key is not None:
+            names.append(self.primary_key)
+        getter = attrgetter(*names)
+        cells = [(column.cell_open, column.format) for column in self.columns]
+        has_key = self.primary_key is not None
+        parts: list[str] = []
+        for row in rows:
+            values = getter(row)
+            if not isinstance(values, tuple):
+                values = (values,)
+            if has_key:
+                parts.append(f'<tr id="{row_id_prefix}{escape(str(values[-1]))}">')
+            else:
+                parts.append("<tr>")
+            for (cell_open, format_cell), value in zip(cells, values, strict=False):
+                parts.extend((cell_open, format_cell(value), "</td>"))
+            parts.append("</tr>\n")
+        return "".join(parts)
+
+
+def _compile_column(name: str, field_info: FieldInfo) -> _Column | None:
+    meta: dict[type, BasePresentation] = {type(m): m for m in field_info.metadata if isinstance(m, BasePresentation)}
+    hidden = meta.get(Hidden)
+    if isinstance(hidden, Hidden) and hidden.in_context("table"):
+        return None
+    label = meta.get(Label)
+    align = meta.get(ColumnAlign)
+    width = meta.get(ColumnWidth)
+    style = f' style="text-align: {align.align}"' if isinstance(align, ColumnAlign) else ""
+    sortable = meta.get(Sortable)
+    filterable = meta.get(Filterable)
+    grouped = meta.get(Grouped)
+    choices = meta.get(Choices)
+    annotation = _unwrap_optional(field_info.annotation)
+    if (
+        isinstance(sortable, Sortable)
+        and annotation is not field_info.annotation
+        and not any(isinstance(m, PrimaryKey) for m in field_info.metadata)
+    ):
+        # Keyset pages compare the sort column of the last row, which can't be NULL
+        msg = f"Sortable field {name!r} is nullable; AirTable can only sort on NOT NULL fields."
+        raise TypeError(msg)
+    return _Column(
+        name=name,
+        label=label.text if isinstance(label, Label) else name.replace("_", " ").title(),
+        style=style,
+        cell_open=f"<td{style}>",
+        format=_cell_formatter(field_info, meta),
+        sortable=sortable if isinstance(sortable, Sortable) else None,
+        filterable=filterable if isinstance(filterable, Filterable) else None,
+        group=grouped.name if isinstance(grouped, Grouped) else None,
+        width=width if isinstance(width, ColumnWidth) else None,
+        choices=choices.options if isinstance(choices, Choices) else (),
+        input_type=_filter_input_type(annotation),
+        coerce=TypeAdapter(annotation),
+    )
+
+
+def _filter_params(name: str, kind: str) -> list[tuple[str, str]]:
+    """Return the (query parameter, filter lookup) pairs for a filterable column."""
+    if kind == "range":
+        return [(f"{name}__gte", f"{name}__gte"), (f"{name}__lte", f"{name}__lte")]
+    if kind == "contains":
+        return [(name, f"{name}__icontains")]
+    if kind == "multi_select":
+        return [(name, f"{name}__in")]
+    return [(name, name)]
+
+
+def _priority(field_info: FieldInfo) -> int:
+    for m in field_info.metadata:
+        if isinstance(m, Priority):
+            return m.level
+    return 0
+
+
+_table_plans: WeakKeyDictionary[type[AirModel], tuple[dict[str, Any], _TablePlan]] = WeakKeyDictionary()
+
+
+def _table_plan(model: type[AirModel]) -> _TablePlan:
+    """Return the model's compiled table plan, compiling it on first use or after a model rebuild."""
+    fields = model.model_fields
+    cached = _table_plans.get(model)
+    if cached is not None and cached[0] is fields:
+        return cached[1]
+    # Higher Priority first; the sort is stable, so ties keep declaration order
+    ordered = sorted(fields.items(), key=lambda item: -_priority(item[1]))
+    columns = tuple(column for name, info in ordered if (column := _compile_column(name, info)) is not None)
+    primary_key = next(
+        (name for name, info in fields.items() if any(isinstance(m, PrimaryKey) for m in info.metadata)), None
+    )
+    default_sort = next(
+        (
+            f"-{column.name}" if column.sortable.descending else column.name
+            for column in columns
+            if column.sortable is not None and column.sortable.default
+        ),
+        primary_key,
+    )
+    plan = _TablePlan(columns=columns, primary_key=primary_key, default_sort=default_sort)
+    _table_plans[model] = (fields, plan)
+    return plan
+
+
+class AirTable[M: AirModel]:
+    """A server-side data table for an AirModel, driven by AirField metadata.
+
+    Only columns and filters declared on the model are honored, so query
+    parameters can't sort or filter on arbitrary columns. Each request
+    fetches one page, plus one row to learn whether another page exists;
+    there is no ``COUNT(*)``. Pages are keyset-paginated: the next page
+    link carries an opaque ``after`` cursor instead of a page number, so
+    deep pages cost the same as the first. Keyset pages compare the sort
+    columns, so ``Sortable`` fields must not be nullable; a model with a
+    ``Sortable`` ``X | None`` field raises ``TypeError`` when its table
+    class is defined.
+
+    With htmx, clicking a sortable header re-renders the table, typing in
+    a filter re-renders only its body, and scrolling to the end loads the
+    next page of rows into it. Without htmx the same links and a "More"
+    link work as plain pagination.
+
+    Example::
+
+        from typing import Annotated
+
+        import air
+        from air.field import DisplayFormat, Filterable, Sortable
+
+
+        class Glaze(air.AirModel):
+            id: int | None = air.AirField(default=None, primary_key=True)
+            name: Annotated[str, Sortable(default=True), Filterable("contains")]
+            cone: Annotated[int, Sortable(), Filterable("range")]
+            price: Annotated[float, DisplayFormat("currency")]
+
+
+        class GlazeTable(air.AirTable[Glaze]):
+            page_size = 50
+
+
+        @app.get("/glazes")
+        async def glazes(request: air.Request) -> GlazeTable:
+            return await GlazeTable.from_request(request)
+    """
+
+    model: type[M] | None = None
+    page_size: ClassVar[int] = 25
+    #: Path the table's htmx requests go to. Defaults to the request's path.
+    url: str = ""
+    #: The ``id`` of the ``<table>``. Defaults to the class name in kebab case.
+    table_id: ClassVar[str] = ""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "model" not in cls.__dict__:
+            for base in getattr(cls, "__orig_bases__", ()):
+                if get_origin(base) is AirTable:
+                    args = get_args(base)
+                    if args and isinstance(args[0], type) and issubclass(args[0], AirModel):
+                        cls.model = args[0]
+                        break
+        if "table_id" not in cls.__dict__:
+            cls.table_id = "".join(f"-{c.lower()}" if c.isupper() else c for c in cls.__name__).lstrip("-")
+        if cls.model is not None:
+            _table_plan(cls.model)
+
+    def __init__(
+        self,
+        rows: Sequence[M],
+        *,
+        after: str | None = None,
+        next_cursor: str | None = None,
+        sort: str | None = None,
+        filters: dict[str, list[str]] | None = None,
+        url: str = "",
+        fragment: str = "table",
+    ) -> None:
+        if self.model is None:
+            msg = "model"
+            raise NotImplementedError(msg)
+        self.rows = rows
+        #: Cursor this page was loaded after, None for the first page.
+        self.after = after
+        #: Cursor for the next page, None on the last page.
+        self.next_cursor = next_cursor
+        self.sort = sort
+        self.filters = filters or {}
+        self.url = self.url or url
+        #: Which part ``render()`` returns: ``"table"``, ``"body"`` (the ``<tbody>``) or ``"rows"``.
+        self.fragment = fragment
+
+    @classmethod
+    def filter_lookups(cls, params: dict[str, list[str]]) -> dict[str, Any]:
+        """Translate query parameters into ``AirModel.filter()`` lookups.
+
+        Only ``Filterable`` columns are read. ``exact`` and ``contains``
+        read the field's name, ``range`` reads ``<name>__gte`` and
+        ``<name>__lte``, and ``multi_select`` reads every ``<name>``.
+        Blank values are skipped, and so are values that don't validate
+        against the field's type.
+
+        Returns:
+            Keyword arguments for ``AirModel.filter()``.
+        """
+        assert cls.model is not None
+        lookups: dict[str, Any] = {}
+        for column in _table_plan(cls.model).columns:
+            if column.filterable is None:
+                continue
+            kind = column.filterable.kind
+            keys = _filter_params(column.name, kind)
+            for param, lookup in keys:
+                values = [value for value in params.get(param, ()) if value]
+                if not values:
+                    continue
+                try:
+                    if kind == "contains":
+                        lookups[lookup] = values[0]
+                    elif kind == "multi_select":
+                        lookups[lookup] = [column.coerce.validate_strings(value) for value in values]
+                    else:
+                        lookups[lookup] = column.coerce.validate_strings(values[0])
+                except ValidationError:
+                    continue
+        return lookups
+
+    @classmethod
+    async def load(
+        cls,
+        *,
+        after: str | None = None,
+        sort: str | None = None,
+        filters: dict[str, list[str]] | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """Fetch one page of rows and return the table for it.
+
+        Args:
+            after: The previous page's ``next_cursor``. A cursor that doesn't
+                match the sort, e.g. from an edited URL, loads the first page,
+                or no rows when only the ``rows`` fragment was asked for.
+            sort: A sortable field name, ``-`` prefixed for descending.
+                Anything else falls back to the ``Sortable(default=True)``
+                field, then the primary key.
+            filters: Raw query parameters, see ``filter_lookups()``.
+            **kwargs: Passed to the constructor.
+
+        Returns:
+            The table, holding at most ``page_size`` rows.
+        """
+        assert cls.model is not None
+        plan = _table_plan(cls.model)
+        sortable = {column.name for column in plan.columns if column.sortable is not None}
+        if sort is None or sort.removeprefix("-") not in sortable:
+            sort = plan.default_sort
+        filters = filters or {}
+        lookups = cls.filter_lookups(filters)
+        page = None
+        if after is not None:
+            try:
+                page = await cls.model.paginate(after=after, order_by=sort, page_size=cls.page_size, **lookups)
+            except InvalidCursor:
+                if kwargs.get("fragment") == "rows":
+                    # Restarting at page 1 would append duplicate rows to the ones already shown
+                    return cls([], after=after, sort=sort, filters=filters, **kwargs)
+        if page is None:
+            after = None
+            page = await cls.model.paginate(order_by=sort, page_size=cls.page_size, **lookups)
+        return cls(page.items, after=after, next_cursor=page.next_cursor, sort=sort, filters=filters, **kwargs)
+
+    @classmethod
+    async def from_request(cls, request: Request) -> Self:
+        """Load the cursor, sort and filters named in the request's query string.
+
+        The part rendered follows the htmx request: the next page's rows
+        for the loader row, the body for a filter input, else the table.
+
+        Returns:
+            The table for this request.
+        """
+        params = {key: request.query_params.getlist(key) for key in request.query_params}
+        fragment = "table"
+        if request.headers.get("HX-Request") == "true":
+            if request.headers.get("HX-Trigger") == f"{cls.table_id}-more":
+                fragment = "rows"
+            elif request.headers.get("HX-Target") == f"{cls.table_id}-body":
+                fragment = "body"
+        return await cls.load(
+            after=request.query_params.get("after") or None,
+            sort=request.query_params.get("sort"),
+            filters={key: values for key, values in params.items() if key not in {"after", "sort"}},
+            url=request.url.path,
+            fragment=fragment,
+        )
+
+    def query_string(self, *, after: str | None = None, sort: str | None = None) -> str:
+        """Return the query string for this table's state, with ``after`` or ``sort`` changed.
+
+        Returns:
+            The encoded query string, without a leading ``?``.
+        """
+        params: list[tuple[str, str]] = [(key, value) for key, values in self.filters.items() for value in values]
+        if sort or self.sort:
+            params.append(("sort", sort or self.sort or ""))
+        if after is not None:
+            params.append(("after", after))
+        return urlencode(params)
+
+    def render_row(self, row: M) -> str:
+        """Render a single ``<tr>``, e.g. to swap one edited row in place.
+
+        Returns:
+            The row's HTML.
+        """
+        assert self.model is not None
+        return _table_plan(self.model).render_rows((row,), f"{self.table_id}-row-")
+
+    def render_rows(self) -> str:
+        """Render this page's rows, followed by the loader row when more pages exist.
+
+        Returns:
+            The rows' HTML.
+        """
+        assert self.model is not None
+        plan = _table_plan(self.model)
+        html = plan.render_rows(self.rows, f"{self.table_id}-row-")
+        if self.next_cursor is not None:
+            next_url = escape(f"{self.url}?{self.query_string(after=self.next_cursor)}")
+            html += (
+                f'<tr id="{self.table_id}-more" class="air-table-more" hx-get="{next_url}" '
+                f'hx-trigger="revealed" hx-swap="outerHTML">'
+                f'<td colspan="{len(plan.columns)}"><a href="{next_url}">More</a></td></tr>\n'
+            )
+        return html
+
+    def render_body(self) -> str:
+        """Render the ``<tbody>``, the target of filter inputs.
+
+        Returns:
+            The body's HTML.
+        """
+        return f'<tbody id="{self.table_id}-body">\n{self.render_rows()}</tbody>'
+
+    def render_head(self) -> str:
+        """Render the ``<colgroup>`` and ``<thead>``: group, header and filter rows.
+
+        Returns:
+            The head's HTML.
+        """
+        assert self.model is not None
+        columns = _table_plan(self.model).columns
+        parts: list[str] = []
+        if any(column.width is not None for column in columns):
+            total = sum(column.width.weight if column.width else 1.0 for column in columns)
+            parts.append("<colgroup>")
+            for column in columns:
+                width = column.width or ColumnWidth()
+                style = f"width: {width.weight / total:.1%}"
+                if width.min_chars is not None:
+                    style += f"; min-width: {width.min_chars}ch"
+                if width.max_chars is not None:
+                    style += f"; max-width: {width.max_chars}ch"
+                parts.append(f'<col style="{style}">')
+            parts.append("</colgroup>\n")
+        parts.append("<thead>\n")
+        if any(column.group is not None for column in columns):
+            parts.append(self._group_row(columns))
+        parts.append("<tr>")
+        parts.extend(self._header_cell(column) for column in columns)
+        parts.append("</tr>\n")
+        if any(column.filterable is not None for column in columns):
+            parts.append(self._filter_row(columns))
+        parts.append("</thead>\n")
+        return "".join(parts)
+
+    def render(self) -> str:
+        """Render the part of the table named by ``fragment``.
+
+        Returns:
+            The table, its body, or its rows, as HTML.
+        """
+        if self.fragment == "rows":
+            return self.render_rows()
+        if self.fragment == "body":
+            return self.render_body()
+        return f'<table id="{self.table_id}" class="air-table">\n{self.render_head()}{self.render_body()}\n</table>'
+
+    def __html__(self) -> str:
+        return self.render()
+
+    def __str__(self) -> str:
+        return self.render()
+
+    def _group_row(self, columns: Sequence[_Column]) -> str:
+        cells = "".join(
+            f'<th colspan="{sum(1 for _ in run)}" scope="colgroup">{escape(group or "")}</th>'
+            for group, run in groupby(columns, key=attrgetter("group"))
+        )
+        return f'<tr class="air-table-groups">{cells}</tr>\n'
+
+    def _header_cell(self, column: _Column) -> str:
+        label = escape(column.label)
+        if column.sortable is None:
+            return f'<th scope="col"{column.style}>{label}</th>'
+        current = self.sort or ""
+        ascending = current == column.name
+        descending = current == f"-{column.name}"
+        aria = ' aria-sort="ascending"' if ascending else ' aria-sort="descending"' if descending else ""
+        arrow = " ▲" if ascending else " ▼" if descending else ""
+        href = escape(f"{self.url}?{self.query_string(sort=f'-{column.name}' if ascending else column.name)}")
+        return (
+            f'<th scope="col"{column.style}{aria}><a href="{href}" hx-get="{href}" '
+            f'hx-target="#{self.table_id}" hx-swap="outerHTML">{label}{arrow}</a></th>'
+        )
+
+    def _filter_row(self, columns: Sequence[_Column]) -> str:
+        url = escape(self.url)
+        hx = (
+            f'hx-get="{url}" hx-target="#{self.table_id}-body" hx-swap="outerHTML" '
+            'hx-include="closest tr" hx-trigger="input changed delay:300ms, search"'
+        )
+        cells: list[str] = []
+        for column in columns:
+            if column.filterable is None:
+                cells.append("<th></th>")
+                continue
+            cells.append(f"<th>{self._filter_control(column, hx)}</th>")
+        sort = f'<input type="hidden" name="sort" value="{escape(self.sort)}">' if self.sort else ""
+        return f'<tr class="air-table-filters">{"".join(cells)}{sort}</tr>\n'
+
+    def _filter_control(self, column: _Column, hx: str) -> str:
+        assert column.filterable is not None
+        name = escape(column.name)
+        label = escape(column.label)
+        kind = column.filterable.kind
+        if kind == "range":
+            low = escape(self._filter_value(f"{column.name}__gte"))
+            high = escape(self._filter_value(f"{column.name}__lte"))
+            return (
+                f'<input type="{column.input_type}" name="{name}__gte" value="{low}" '
+                f'aria-label="{label} from" {hx}>'
+                f'<input type="{column.input_type}" name="{name}__lte" value="{high}" '
+                f'aria-label="{label} to" {hx}>'
+            )
+        if column.choices:
+            selected = set(self.filters.get(column.name, ()))
+            multiple = " multiple" if kind == "multi_select" else ""
+            blank = "" if multiple else '<option value="">All</option>'
+            options = "".join(
+                f'<option value="{escape(str(value))}"{" selected" if str(value) in selected else ""}>'
+                f"{escape(text)}</option>"
+                for value, text in column.choices
+            )
+            return f'<select name="{name}" aria-label="{label}"{multiple} {hx}>{blank}{options}</select>'
+        value = escape(self._filter_value(column.name))
+        return f'<input type="{column.input_type}" name="{name}" value="{value}" aria-label="{label}" {hx}>'
+
+    def _filter_value(self, key: str) -> str:
+        values = self.filters.get(key)
+        return values[0] if values else ""
@@ -1,15 +1,12 @@
 from __future__ import annotations
 
 import re
-from typing import Final, Literal
+from typing import TYPE_CHECKING, Final, Literal
 
 from frozendict import frozendict
 
-# noinspection PyUnresolvedReferences
-from pygments.lexers.html import HtmlLexer
-
-# noinspection PyUnresolvedReferences
-from pygments.lexers.python import PythonLexer
+if TYPE_CHECKING:
+    from pygments.lexer import Lexer
 
 
 class TagKeys:
@@ -119,8 +116,8 @@ EMPTY_JOIN_SEPARATOR: Final = ""
 AIR_PREFIX: Final = "air."
 HOMEPAGE_FILE_NAME: Final = "index.html"
 HTML_SUFFIX: Final = ".html"
-HTML_LEXER: Final = HtmlLexer()
-PYTHON_LEXER: Final = PythonLexer()
+HTML_LEXER_NAME: Final = "html"
+PYTHON_LEXER_NAME: Final = "python"
 _LOOKS_LIKE_FULL_HTML_UNICODE_RE: Final = re.compile(
     r"""
     \s*
@@ -150,3 +147,29 @@ _LOOKS_LIKE_HTML_UNICODE_RE: Final = re.compile(
     """,
     re.IGNORECASE | re.DOTALL | re.VERBOSE,
 )
+
+
+def __getattr__(name: str) -> Lexer:
+    """Build the ``HTML_LEXER`` and ``PYTHON_LEXER`` Pygments lexers on first access (PEP 562).
+
+    Pygments is only imported when one of them is used, not with ``air``.
+
+    Returns:
+        The lexer instance, created once.
+
+    Raises:
+        AttributeError: If the name is not one of the lexer constants.
+    """
+    if name == "HTML_LEXER":
+        from pygments.lexers.html import HtmlLexer  # noqa: PLC0415
+
+        lexer = HtmlLexer()
+    elif name == "PYTHON_LEXER":
+        from pygments.lexers.python import PythonLexer  # noqa: PLC0415
+
+        lexer = PythonLexer()
+    else:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    globals()[name] = lexer
+    return lexer
@@ -8,9 +8,6 @@ from functools import cached_property
 from types import MappingProxyType
 from typing import TYPE_CHECKING, ClassVar, Self
 
-from rich.pretty import pretty_repr
-from selectolax.lexbor import LexborHTMLParser, LexborNode
-
 from air.tags.constants import (
     DEFAULT_INDENTATION_SIZE,
     EMPTY_JOIN_SEPARATOR,
@@ -47,6 +44,8 @@ from .utils import (
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from selectolax.lexbor import LexborNode
+
     from air.tags.types import StrPath
 
     from .types import (
@@ -568,6 +567,8 @@ class BaseTag:
             A formatted string produced by the rich pretty printer when available,
             otherwise the standard string form of the mapping.
         """
+        from rich.pretty import pretty_repr  # noqa: PLC0415
+
         return pretty_repr(
             self.to_dict(),
             max_width=max_width,
@@ -743,6 +744,8 @@ class BaseTag:
             TypeError: If ``html_source`` is not a string.
             ValueError: If the markup is not valid HTML.
         """
+        from selectolax.lexbor import LexborHTMLParser  # noqa: PLC0415
+
         if not isinstance(html_source, str):
             msg = f"{cls.__name__}.from_html(html_source) expects a string argument."
             raise TypeError(msg)
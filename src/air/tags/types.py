@@ -2,14 +2,7 @@ from __future__ import annotations
 
 from os import PathLike
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import Literal
 
-if TYPE_CHECKING:
-    # noinspection PyUnresolvedReferences
-    from pygments.lexers.html import HtmlLexer
-
-    # noinspection PyUnresolvedReferences
-    from pygments.lexers.python import PythonLexer
-
-type LexerType = HtmlLexer | PythonLexer
+type LexerType = Literal["html", "python"]
 type StrPath = PathLike | Path | str
@@ -6,30 +6,13 @@ import base64
 import html
 import re
 import tempfile
-import webbrowser
 from collections import UserString
+from functools import cache
 from io import StringIO
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from urllib.error import URLError
 
-import minify_html
-import nh3
-from lxml.etree import indent as indent_element_tree
-
-# noinspection PyProtectedMember
-from lxml.html import (
-    HtmlElement,
-    document_fromstring as parse_html_document_from_string,
-    fromstring as parse_html_from_string,
-    tostring as serialize_document_to_html_string,
-)
-from rich import box
-from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.text import Text
-
 from air.exceptions import BrowserOpenError
 
 from .constants import (
@@ -44,20 +27,27 @@ from .constants import (
     FORMAT_HTML_ENCODING,
     HOMEPAGE_FILE_NAME,
     HTML_DOCTYPE,
-    HTML_LEXER,
+    HTML_LEXER_NAME,
     HTML_PANEL_TITLE,
     HTML_SUFFIX,
     LOCALS_CLEANUP_EXCLUDED_KEYS,
     PANEL_BORDER_STYLE,
     PANEL_TITLE_STYLE,
-    PYTHON_LEXER,
+    PYTHON_LEXER_NAME,
     PYTHON_PANEL_TITLE,
     PanelTitleType,
 )
 
 if TYPE_CHECKING:
+    from pygments.lexer import Lexer
+    from rich.console import Console
+
     from .types import LexerType, StrPath
 
+# Formatting, parsing, and pretty-printing dependencies (minify_html, nh3, lxml,
+# rich, pygments, webbrowser) are imported inside the helpers that use them,
+# so `import air` stays cheap for production workers that never call them.
+
 
 def is_full_html_document(text: str) -> bool:
     """Check if a string looks like a full HTML document using a simple heuristic
@@ -102,6 +92,8 @@ def looks_like_html(text: str) -> bool:
         bool: True if the text is detected as HTML and matches the HTML-like
             Unicode pattern; otherwise, False.
     """
+    import nh3  # noqa: PLC0415
+
     return nh3.is_html(text) and bool(_LOOKS_LIKE_HTML_UNICODE_RE.fullmatch(text))
 
 
@@ -177,6 +169,8 @@ def compact_format_html(source: str) -> str:
         retain required attribute spacing while stripping comments, optional
         closing tags, and excess whitespace, and to minify inline CSS/JS.
     """
+    import minify_html  # noqa: PLC0415
+
     # noinspection PyArgumentEqualDefault
     return minify_html.minify(
         source,  # your HTML string
@@ -244,7 +238,14 @@ def format_html(
     Returns:
         The serialized HTML produced by `lxml.html.tostring`.
     """
-    html_element: HtmlElement = (
+    from lxml.etree import indent as indent_element_tree  # noqa: PLC0415
+    from lxml.html import (  # noqa: PLC0415
+        document_fromstring as parse_html_document_from_string,
+        fromstring as parse_html_from_string,
+        tostring as serialize_document_to_html_string,
+    )
+
+    html_element = (
         parse_html_document_from_string(source, ensure_head_body=with_head)
         if with_body
         else parse_html_from_string(source)
@@ -286,6 +287,8 @@ def _open_new_tab(url: str) -> None:
     Raises:
         BrowserOpenError: The browser invocation returned a failure signal.
     """
+    import webbrowser  # noqa: PLC0415
+
     open_new_tab_successfully = webbrowser.open_new_tab(url)
     if not open_new_tab_successfully:
         msg = f"Could not open browser for URI: {url}. "
@@ -437,7 +440,7 @@ def pretty_print_python(
         theme: Rich syntax highlighting theme name.
         record: Whether to buffer the output for later export.
     """
-    _get_pretty_console(source, lexer=PYTHON_LEXER, panel_title=PYTHON_PANEL_TITLE, theme=theme, record=record)
+    _get_pretty_console(source, lexer=PYTHON_LEXER_NAME, panel_title=PYTHON_PANEL_TITLE, theme=theme, record=record)
 
 
 def pretty_print_html(
@@ -472,7 +475,7 @@ def _get_pretty_html_console(
     Returns:
         A configured Rich console instance.
     """
-    return _get_pretty_console(source, lexer=HTML_LEXER, panel_title=HTML_PANEL_TITLE, theme=theme, record=record)
+    return _get_pretty_console(source, lexer=HTML_LEXER_NAME, panel_title=HTML_PANEL_TITLE, theme=theme, record=record)
 
 
 def _get_pretty_console(
@@ -499,7 +502,15 @@ def _get_pretty_console(
     Returns:
         A configured Console instance with the styled syntax and panel displayed.
     """
-    syntax = Syntax(code=source, lexer=lexer, theme=theme, line_numbers=True, indent_guides=True, word_wrap=True)
+    from rich import box  # noqa: PLC0415
+    from rich.console import Console  # noqa: PLC0415
+    from rich.panel import Panel  # noqa: PLC0415
+    from rich.syntax import Syntax  # noqa: PLC0415
+    from rich.text import Text  # noqa: PLC0415
+
+    syntax = Syntax(
+        code=source, lexer=_get_lexer(lexer), theme=theme, line_numbers=True, indent_guides=True, word_wrap=True
+    )
     title = Text(panel_title, style=PANEL_TITLE_STYLE)
     panel = Panel(
         syntax,
@@ -513,6 +524,23 @@ def _get_pretty_console(
     return console
 
 
+@cache
+def _get_lexer(name: LexerType) -> Lexer:
+    """Return a shared Pygments lexer instance for the given lexer name.
+
+    Building a lexer compiles its token tables, so it is done once, on first use.
+
+    Args:
+        name: The Pygments lexer alias, either HTML or Python.
+
+    Returns:
+        The cached lexer instance.
+    """
+    from pygments.lexers import get_lexer_by_name  # noqa: PLC0415
+
+    return get_lexer_by_name(name)
+
+
 def locals_cleanup(
     data: dict[str, Any],
     _skip: frozenset[str] = LOCALS_CLEANUP_EXCLUDED_KEYS,
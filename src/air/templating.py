@@ -4,38 +4,322 @@ A common pattern is to use a Jinja template as the project base and then use Air
 """
 
 import importlib
-from collections.abc import Callable, Sequence
+import inspect
+import sys
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
 from os import PathLike
+from pathlib import Path
 from types import ModuleType
-from typing import Any, Literal, overload
+from typing import Any, Final, Literal, SupportsIndex, overload
 
+import anyio
 import jinja2
+from anyio.streams.memory import MemoryObjectSendStream
 from fastapi.templating import Jinja2Templates
+from markupsafe import Markup
+from starlette.background import BackgroundTask
 from starlette.requests import Request as StarletteRequest
-from starlette.responses import HTMLResponse
+from starlette.responses import HTMLResponse, StreamingResponse
 from starlette.templating import _TemplateResponse
+from starlette.types import Send
 
-from .requests import Request
+from .requests import HX_BOOSTED, HX_HISTORY_RESTORE_REQUEST, HX_REQUEST, HX_TARGET, HtmxDetails, Request
+from .responses import relay_batches
 from .tags.models.base import BaseTag
 from .tags.utils import SafeStr
 from .utils import cached_signature
 
+type BytecodeCacheOption = jinja2.BytecodeCache | str | PathLike[str] | bool | None
+"""A Jinja bytecode cache, a directory to keep one in, `True` for the system temp directory, or off."""
+
+
+def make_bytecode_cache(option: BytecodeCacheOption) -> jinja2.BytecodeCache | None:
+    """Turn a `bytecode_cache` argument into a Jinja bytecode cache.
+
+    Compiled templates are stored keyed on a checksum of their source, so
+    edited templates are recompiled and every worker and `--reload` restart
+    after the first reuses the cached code.
+
+    Returns:
+        The bytecode cache, or None when caching is off.
+    """
+    if option is None or option is False:
+        return None
+    if option is True:
+        return jinja2.FileSystemBytecodeCache()
+    if isinstance(option, jinja2.BytecodeCache):
+        return option
+    directory = Path(option)
+    directory.mkdir(parents=True, exist_ok=True)
+    return jinja2.FileSystemBytecodeCache(str(directory))
+
+
+def _make_templates(
+    directory: str | PathLike[str] | Sequence[str | PathLike[str]] | None,
+    context_processors: list[Callable[[StarletteRequest], dict[str, Any]]] | None,
+    env: jinja2.Environment | None,
+    bytecode_cache: BytecodeCacheOption,
+) -> Jinja2Templates:
+    """Create the Starlette templates object for a renderer.
+
+    Raises:
+        ValueError: If neither a directory nor an environment is given.
+    """
+    if directory is not None:
+        templates = Jinja2Templates(directory=directory, context_processors=context_processors, env=env)
+    elif env is not None:
+        templates = Jinja2Templates(env=env, context_processors=context_processors)
+    else:
+        msg = "Pass a template directory or a jinja2.Environment."
+        raise ValueError(msg)
+    cache = make_bytecode_cache(bytecode_cache)
+    if cache is not None:
+        templates.env.bytecode_cache = cache
+    return templates
+
+
+def compiled_environment(path: str | PathLike[str]) -> jinja2.Environment:
+    """Create a Jinja environment that loads templates precompiled by `air templates compile`.
+
+    Returns:
+        An autoescaping environment backed by a `jinja2.ModuleLoader`.
+    """
+    return jinja2.Environment(loader=jinja2.ModuleLoader(str(path)), autoescape=True)
+
+
+def compile_templates(
+    directory: str | PathLike[str],
+    target: str | PathLike[str],
+    *,
+    zip: bool = True,  # noqa: A002 - mirrors jinja2.Environment.compile_templates
+) -> list[str]:
+    """Compile every template under `directory` to Python code in a zip file or module directory.
+
+    Load the result with `compiled_environment(target)`.
+
+    Returns:
+        The names of the compiled templates.
+    """
+    env = jinja2.Environment(loader=jinja2.FileSystemLoader(str(directory)), autoescape=True)
+    names = env.list_templates()
+    env.compile_templates(str(target), zip="deflated" if zip else None, ignore_errors=False)
+    return names
+
+
+class _LazyTag:
+    """Stand-in for an Air Tag in a Jinja context that renders the tag only if the template uses it.
+
+    Jinja and markupsafe treat objects with `__html__` as safe markup, so
+    `{{ tag }}` and `{{ tag|safe }}` both output the rendered HTML. Used as
+    a string instead (`in`, slicing, comparisons, truth tests, `~`, string
+    methods and filters), it behaves like the rendered HTML `str`, and
+    those operations return plain strings. The HTML is rendered on first
+    use and reused after that.
+    """
+
+    __slots__ = ("_html", "tag")
+
+    def __init__(self, tag: BaseTag) -> None:
+        self.tag = tag
+        self._html: str | None = None
+
+    def __html__(self) -> str:
+        if self._html is None:
+            self._html = str(self.tag)
+        return self._html
+
+    def __str__(self) -> str:
+        return self.__html__()
+
+    def __repr__(self) -> str:
+        return f"_LazyTag({self.tag!r})"
+
+    def __getattr__(self, name: str) -> Any:
+        # Private names stay missing so copy and pickle don't recurse through an unset slot
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.__html__(), name)
+
+    def __len__(self) -> int:
+        return len(self.__html__())
+
+    def __contains__(self, item: str) -> bool:
+        return item in self.__html__()
+
+    def __getitem__(self, index: SupportsIndex | slice) -> str:
+        return self.__html__()[index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__html__())
+
+    def __hash__(self) -> int:
+        return hash(self.__html__())
+
+    def __eq__(self, other: object) -> bool:
+        return self.__html__() == (str(other) if isinstance(other, _LazyTag) else other)
+
+    def __lt__(self, other: str) -> bool:
+        return self.__html__() < str(other)
+
+    def __le__(self, other: str) -> bool:
+        return self.__html__() <= str(other)
+
+    def __gt__(self, other: str) -> bool:
+        return self.__html__() > str(other)
+
+    def __ge__(self, other: str) -> bool:
+        return self.__html__() >= str(other)
+
+    def __add__(self, other: str) -> str:
+        return self.__html__() + other
+
+    def __radd__(self, other: str) -> str:
+        return other + self.__html__()
+
 
 def _jinja_context_item(item: Any) -> Any:
     """Prepare an item for processing by Jinja.
 
-    BaseTag instances are converted to string.
+    BaseTag instances are wrapped in a `_LazyTag`, so tags the template
+    never outputs are never rendered.
     All other objects are handled by Jinja directly.
 
     Returns:
-        The item as a string if it's a BaseTag, otherwise the item unchanged.
+        The item wrapped in a `_LazyTag` if it's a BaseTag, otherwise the item unchanged.
     """
 
     if isinstance(item, BaseTag):
-        return str(item)
+        return _LazyTag(item)
     return item
 
 
+def _tag_markup(value: Any) -> Any:
+    """Render an Air Tag that reaches async template output, e.g. one returned by an awaited call.
+
+    Returns:
+        The tag as Markup, otherwise the value unchanged.
+    """
+    if isinstance(value, BaseTag):
+        return Markup(str(value))
+    return value
+
+
+def async_environment(env: jinja2.Environment) -> jinja2.Environment:
+    """Create an async-enabled overlay of `env` that shares its loader, globals and filters.
+
+    Calls in the templates are awaited when they return awaitables, and Air
+    Tags in the output are rendered. The overlay has no bytecode cache:
+    Jinja keys cached code on the template alone, and async and sync
+    environments compile the same template to different code.
+
+    Returns:
+        The async environment.
+    """
+    options: dict[str, Any] = {"enable_async": True, "bytecode_cache": None}
+    if env.finalize is None:
+        options["finalize"] = _tag_markup
+    return env.overlay(**options)
+
+
+async def _resolve_context(context: dict[Any, Any]) -> dict[Any, Any]:
+    """Await the awaitable values in a context concurrently and prepare every value for Jinja.
+
+    Returns:
+        The context with awaitables replaced by their results.
+    """
+    resolved = dict(context)
+
+    async def resolve(key: Any, value: Awaitable[Any]) -> None:
+        resolved[key] = _jinja_context_item(await value)
+
+    async with anyio.create_task_group() as task_group:
+        for key, value in context.items():
+            if inspect.isawaitable(value):
+                task_group.start_soon(resolve, key, value)
+            else:
+                resolved[key] = _jinja_context_item(value)
+    return resolved
+
+
+FRAGMENT_VARY_HEADERS: Final[tuple[str, ...]] = (HX_REQUEST, HX_BOOSTED, HX_TARGET, HX_HISTORY_RESTORE_REQUEST)
+"""Request headers that decide whether `JinjaRenderer(block=...)` renders a block or the whole page."""
+
+
+def _select_block(request: Request, template: jinja2.Template, *, block: str | bool | None) -> str | None:
+    """Choose the block to render on its own for this request.
+
+    Returns:
+        The block name, or None to render the whole template.
+
+    Raises:
+        ValueError: If an explicitly named block is not defined in the template.
+    """
+    if block is None or block is False:
+        return None
+    if isinstance(block, str) and block not in template.blocks:
+        msg = f"Template {template.name!r} has no block named {block!r}."
+        raise ValueError(msg)
+    htmx = getattr(request, "htmx", None)
+    if not isinstance(htmx, HtmxDetails) or not htmx or htmx.boosted or htmx.history_restore_request:
+        return None
+    name = htmx.target if block is True else block
+    return name if name in template.blocks else None
+
+
+def _render_block(template: jinja2.Template, name: str, context: dict[Any, Any]) -> str:
+    """Render one block of a template, skipping everything outside it.
+
+    Returns:
+        The rendered block.
+    """
+    return "".join(template.blocks[name](template.new_context(context)))
+
+
+class _TemplateStreamResponse(StreamingResponse):
+    """Stream an async Jinja template, sending whatever has rendered since the last write as one chunk.
+
+    Rendering runs in a producer task. When the template awaits something
+    slow, the output so far goes out at once; a template that renders
+    without awaiting hands control back to the event loop every
+    `max_batch` chunks.
+    """
+
+    def __init__(
+        self,
+        template: jinja2.Template,
+        context: dict[Any, Any],
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = "text/html",
+        background: BackgroundTask | None = None,
+        *,
+        max_batch: int = 64,
+    ) -> None:
+        self.template = template
+        self.context = context
+        self.max_batch = max_batch
+        super().__init__(self._render(), status_code, headers, media_type, background)
+
+    async def _render(self) -> AsyncIterator[str]:
+        context = await _resolve_context(self.context)
+        async for chunk in self.template.generate_async(context):
+            yield chunk
+
+    async def stream_response(self, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+
+        async def produce(send_stream: MemoryObjectSendStream[str]) -> None:
+            async for chunk in self.body_iterator:
+                await send_stream.send(chunk)  # ty: ignore[invalid-argument-type]
+
+        async def send_batch(chunks: list[str]) -> None:
+            await send({"type": "http.response.body", "body": "".join(chunks).encode(self.charset), "more_body": True})
+
+        await relay_batches(produce, send_batch, max_queue=self.max_batch, max_batch=self.max_batch)
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
 class JinjaRenderer:
     """Template renderer to make Jinja easier in Air.
 
@@ -47,11 +331,13 @@ class JinjaRenderer:
         env: The env is the central Jinja object that holds configuration, filters, globals,
             and template loading settings, and is responsible for compiling and rendering
             templates.
+        bytecode_cache: Cache compiled templates across processes: a directory,
+            `True` for the system temp directory, or a `jinja2.BytecodeCache`.
 
     Example:
 
         # Instantiate the render callable
-        jinja = JinjaRenderer('templates')
+        jinja = JinjaRenderer('templates', bytecode_cache='.cache/jinja')
 
         # Use for returning Jinja from views
         @app.get('/')
@@ -80,12 +366,15 @@ class JinjaRenderer:
 
     def __init__(
         self,
-        directory: str | PathLike[str] | Sequence[str | PathLike[str]],
+        directory: str | PathLike[str] | Sequence[str | PathLike[str]] | None = None,
         context_processors: list[Callable[[StarletteRequest], dict[str, Any]]] | None = None,
         env: jinja2.Environment | None = None,
+        *,
+        bytecode_cache: BytecodeCacheOption = None,
     ) -> None:
         """Initialize with template directory path"""
-        self.templates = Jinja2Templates(directory=directory, context_processors=context_processors, env=env)
+        self.templates = _make_templates(directory, context_processors, env, bytecode_cache)
+        self._async_env: jinja2.Environment | None = None
 
     @overload
     def __call__(
@@ -95,6 +384,7 @@ class JinjaRenderer:
         context: dict[Any, Any] | None = None,
         *,
         as_string: Literal[False] = False,
+        block: str | bool | None = None,
         **kwargs: Any,
     ) -> HTMLResponse: ...
 
@@ -106,6 +396,7 @@ class JinjaRenderer:
         context: dict[Any, Any] | None = None,
         *,
         as_string: Literal[True],
+        block: str | bool | None = None,
         **kwargs: Any,
     ) -> SafeStr: ...
 
@@ -116,6 +407,7 @@ class JinjaRenderer:
         context: dict[Any, Any] | None = None,
         *,
         as_string: bool = False,
+        block: str | bool | None = None,
         **kwargs: Any,
     ) -> HTMLResponse | SafeStr:
         """Render template with request and context. If an Air Tag
@@ -127,6 +419,10 @@ class JinjaRenderer:
             context: Optional context dictionary.
             as_string: If True, return the rendered HTML as a SafeStr instead of
                 an HTMLResponse. Useful for embedding Jinja output inside AirTags.
+            block: For HTMX requests, render only this `{% block %}` of the template,
+                or with `True` the block named after the `HX-Target` element's id.
+                Full-page requests, boosted requests and targets without a matching
+                block get the whole template.
             **kwargs: Additional context variables.
 
         Returns:
@@ -137,16 +433,160 @@ class JinjaRenderer:
         if kwargs:
             context |= kwargs
 
-        # Attempt to render any Tags in the context
-        context = {k: _jinja_context_item(v) for k, v in context.items()}
-        response = self.templates.TemplateResponse(request=request, name=name, context=context)
         if as_string:
-            body = response.body
-            if hasattr(body, "decode"):
-                return SafeStr(body.decode("utf-8"))
-            return SafeStr(body)
+            return self.render_to_string(request, name, context, block=block)
+        if block is None or block is False:
+            # Attempt to render any Tags in the context
+            context = {k: _jinja_context_item(v) for k, v in context.items()}
+            return self.templates.TemplateResponse(request=request, name=name, context=context)
+
+        template = self.templates.get_template(name)
+        fragment = _select_block(request, template, block=block)
+        if fragment is None:
+            context = {k: _jinja_context_item(v) for k, v in context.items()}
+            response = self.templates.TemplateResponse(request=request, name=name, context=context)
+        else:
+            response = HTMLResponse(_render_block(template, fragment, self._template_context(request, context)))
+        response.headers.add_vary_header(", ".join(FRAGMENT_VARY_HEADERS))
         return response
 
+    def render_to_string(
+        self,
+        request: Request,
+        name: str,
+        context: dict[Any, Any] | None = None,
+        *,
+        block: str | bool | None = None,
+        **kwargs: Any,
+    ) -> SafeStr:
+        """Render a template straight to a string, without building a response.
+
+        Applies the same context as `__call__`: Air Tags are rendered,
+        `request` is added and the context processors run.
+
+        Args:
+            request: The request object.
+            name: The template name.
+            context: Optional context dictionary.
+            block: Render only this block for HTMX requests, as in `__call__`.
+            **kwargs: Additional context variables.
+
+        Returns:
+            The rendered HTML as a SafeStr, ready to embed inside Air Tags.
+        """
+        if context is None:
+            context = {}
+        if kwargs:
+            context |= kwargs
+        context = self._template_context(request, context)
+        template = self.templates.get_template(name)
+        fragment = _select_block(request, template, block=block)
+        if fragment is not None:
+            return SafeStr(_render_block(template, fragment, context))
+        return SafeStr(template.render(context))
+
+    def _template_context(self, request: Request, context: dict[Any, Any]) -> dict[Any, Any]:
+        """Prepare a context the way `TemplateResponse` does, with Air Tags made lazy.
+
+        Returns:
+            The context for the template.
+        """
+        context = {k: _jinja_context_item(v) for k, v in context.items()}
+        context.setdefault("request", request)
+        for context_processor in self.templates.context_processors:
+            context.update(context_processor(request))
+        return context
+
+    @property
+    def async_env(self) -> jinja2.Environment:
+        """The async-enabled overlay of the environment, used by `stream`."""
+        if self._async_env is None:
+            self._async_env = async_environment(self.templates.env)
+        return self._async_env
+
+    def stream(
+        self,
+        request: Request,
+        name: str,
+        context: dict[Any, Any] | None = None,
+        *,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        **kwargs: Any,
+    ) -> StreamingResponse:
+        """Render a template asynchronously, streaming the HTML as it is produced.
+
+        Rendering never holds the event loop for the whole template, and the
+        page starts reaching the browser before slow parts are done.
+        Awaitable context values are awaited concurrently before rendering
+        starts. Async functions in the context are awaited where the template
+        calls them, and Air Tags they return are rendered.
+
+        Example:
+
+            @app.get('/report')
+            async def report(request: Request):
+                return jinja.stream(
+                    request,
+                    'report.html',
+                    summary=load_summary(),  # awaited before rendering
+                    rows=fetch_rows,  # awaited where the template calls rows()
+                )
+
+        Args:
+            request: The request object.
+            name: The template name.
+            context: Optional context dictionary.
+            status_code: The response status code.
+            headers: Extra response headers.
+            **kwargs: Additional context variables.
+
+        Returns:
+            A streaming response that renders the template.
+        """
+        context = dict(context or {}) | kwargs
+        context.setdefault("request", request)
+        for context_processor in self.templates.context_processors:
+            context.update(context_processor(request))
+        template = self.async_env.get_template(name)
+        return _TemplateStreamResponse(template, context, status_code=status_code, headers=headers)
+
+
+@dataclass(frozen=True, slots=True)
+class _ResolvedCallable:
+    """A tag callable found by `Renderer`, with the parameter names used to filter its context."""
+
+    module: ModuleType
+    attribute: str
+    func: Callable[..., Any]
+    parameters: tuple[str, ...]
+
+    def is_current(self) -> bool:
+        """Check that the module and attribute still hold this callable, e.g. after `importlib.reload`.
+
+        Returns:
+            True if the cached callable can be used.
+        """
+        return (
+            sys.modules.get(self.module.__name__) is self.module and vars(self.module).get(self.attribute) is self.func
+        )
+
+
+def _filter_context(parameters: tuple[str, ...], context: dict[Any, Any], request: Request | None) -> dict[str, Any]:
+    """Pick the context entries named in `parameters`, plus `request` when it is expected.
+
+    Returns:
+        The keyword arguments for the callable.
+    """
+    filtered_context = {name: context[name] for name in parameters if name in context}
+    if request and "request" in parameters:
+        filtered_context["request"] = request
+    return filtered_context
+
+
+_resolved_callables: dict[tuple[str, str | None], _ResolvedCallable] = {}
+"""Tag callables resolved by `Renderer`, keyed on dotted name and package."""
+
 
 class Renderer:
     """Template/Tag renderer to make composing pluggable functions easier.
@@ -159,6 +599,9 @@ class Renderer:
         env: The env is the central Jinja object that holds configuration, filters, globals,
             and template loading settings, and is responsible for compiling and rendering
             templates.
+        package: Package used to resolve relative tag callable names.
+        bytecode_cache: Cache compiled templates across processes: a directory,
+            `True` for the system temp directory, or a `jinja2.BytecodeCache`.
 
     Example:
 
@@ -197,13 +640,15 @@ class Renderer:
 
     def __init__(
         self,
-        directory: str | PathLike[str] | Sequence[str | PathLike[str]],
+        directory: str | PathLike[str] | Sequence[str | PathLike[str]] | None = None,
         context_processors: list[Callable[[StarletteRequest], dict[str, Any]]] | None = None,
         env: jinja2.Environment | None = None,
         package: str | None = None,
+        *,
+        bytecode_cache: BytecodeCacheOption = None,
     ) -> None:
         """Initialize with template directory path"""
-        self.templates = Jinja2Templates(directory=directory, context_processors=context_processors, env=env)
+        self.templates = _make_templates(directory, context_processors, env, bytecode_cache)
         self.package = package
 
     def __call__(
@@ -276,15 +721,29 @@ class Renderer:
         Returns:
             Rendered string from the tag callable.
         """
+        resolved = self._resolve_tag_callable(name)
+        filtered_context = _filter_context(resolved.parameters, context, request)
+
+        if filtered_context and args:
+            return resolved.func(**filtered_context)
+        return resolved.func(*args, **filtered_context)
+
+    def _resolve_tag_callable(self, name: str) -> _ResolvedCallable:
+        """Find the callable for a dotted name, importing its module only on a cache miss.
+
+        Returns:
+            The cached callable with its parameter names.
+        """
+        key = (name, self.package)
+        resolved = _resolved_callables.get(key)
+        if resolved is not None and resolved.is_current():
+            return resolved
         module_name, func_name = name.rsplit(".", 1)
         module = self._import_module(module_name)
         tag_callable = getattr(module, func_name)
-
-        filtered_context = self._filter_context_for_callable(tag_callable, context, request)
-
-        if filtered_context and args:
-            return tag_callable(**filtered_context)
-        return tag_callable(*args, **filtered_context)
+        resolved = _ResolvedCallable(module, func_name, tag_callable, tuple(cached_signature(tag_callable).parameters))
+        _resolved_callables[key] = resolved
+        return resolved
 
     def _import_module(self, module_name: str) -> ModuleType:
         """Import module handling relative imports.
@@ -308,14 +767,4 @@ class Renderer:
         Returns:
             Filtered context dictionary with only expected parameters.
         """
-        sig = cached_signature(tag_callable)
-        filtered_context = {}
-
-        for param_name in sig.parameters:
-            if param_name in context:
-                filtered_context[param_name] = context[param_name]
-
-        if "request" in sig.parameters and request:
-            filtered_context["request"] = request
-
-        return filtered_context
+        return _filter_context(tuple(cached_signature(tag_callable).parameters), context, request)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import inspect
 from functools import cache
-from typing import TYPE_CHECKING, Any, Final, Literal
+from typing import TYPE_CHECKING, Any, Final, Literal, get_type_hints
 
 from fastapi.datastructures import Default
 from fastapi.utils import generate_unique_id
@@ -104,3 +104,46 @@ def cached_unwrap(fn: Callable[..., Any]) -> Callable[..., Any]:
         original2 = cached_unwrap(my_func)  # Fast!
     """
     return inspect.unwrap(fn)
+
+
+@cache
+def resolved_signature(fn: Callable[..., Any]) -> inspect.Signature:
+    """Get function signature with string annotations resolved, with caching.
+
+    Resolves PEP 563 (``from __future__ import annotations``) string
+    annotations on the unwrapped function, keeping ``Annotated`` extras.
+    Route registration calls this once per endpoint per process, so
+    routers included into apps, or the same handler registered for
+    several methods, don't pay for ``get_type_hints`` again. The first
+    registration of each endpoint, and so process start-up, costs the
+    same as before.
+
+    Args:
+        fn: The potentially decorated function to inspect
+
+    Returns:
+        The function's signature with resolved annotations
+
+    Example:
+
+        from __future__ import annotations
+
+        from air.utils import resolved_signature
+
+
+        def my_func(a: int) -> str:
+            return str(a)
+
+
+        sig = resolved_signature(my_func)
+        assert sig.parameters["a"].annotation is int
+    """
+    resolved_hints = get_type_hints(cached_unwrap(fn), include_extras=True)
+    sig = cached_signature(fn)
+    return sig.replace(
+        parameters=[
+            param.replace(annotation=resolved_hints.get(name, param.annotation))
+            for name, param in sig.parameters.items()
+        ],
+        return_annotation=resolved_hints.get("return", sig.return_annotation),
+    )
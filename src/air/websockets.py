@@ -0,0 +1,114 @@
+"""Tools for handling WebSocket connections."""
+
+from collections.abc import AsyncIterable, Iterable
+from typing import Any, Self
+
+from anyio.streams.memory import MemoryObjectSendStream
+from starlette.websockets import (
+    WebSocket as _WebSocket,
+    WebSocketDisconnect as WebSocketDisconnect,
+)
+
+from .responses import relay_batches
+from .tags.models.base import BaseTag
+
+
+class AirWebSocket(_WebSocket):
+    """A wrapper around `starlette.websockets.WebSocket` that sends Air tags.
+
+    Each connection keeps a render buffer: `queue()` renders fragments into it
+    and `flush()` sends everything queued as one text frame. The htmx ws
+    extension swaps every top-level element of a message by its `id`
+    (out-of-band), so several fragments can share one frame.
+
+    Example:
+
+        import air
+
+        app = air.Air()
+
+
+        @app.websocket("/chat")
+        async def chat(websocket: air.WebSocket) -> None:
+            await websocket.accept()
+            async for message in websocket.iter_json():
+                websocket.queue(air.Div(air.P(message["text"]), id="messages", hx_swap_oob="beforeend"))
+                websocket.queue(air.Input(name="text", id="text"))
+                await websocket.flush()
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._buffer: list[str] = []
+
+    @classmethod
+    def adopt(cls, websocket: _WebSocket) -> Self:
+        """Make a Starlette WebSocket an AirWebSocket in place.
+
+        The object itself is kept, so a connection a dependency already
+        accepted stays accepted and both sides see the same state.
+
+        Returns:
+            The same websocket, now an AirWebSocket.
+        """
+        if isinstance(websocket, cls):
+            return websocket
+        websocket.__class__ = cls
+        assert isinstance(websocket, cls)
+        websocket._buffer = []
+        return websocket
+
+    @property
+    def buffered(self) -> int:
+        """Number of fragments queued and not yet flushed."""
+        return len(self._buffer)
+
+    def queue(self, *fragments: BaseTag | str) -> None:
+        """Render fragments into the connection's buffer without sending them."""
+        self._buffer.extend(str(fragment) for fragment in fragments)
+
+    async def flush(self) -> None:
+        """Send all queued fragments as a single text frame."""
+        if not self._buffer:
+            return
+        text = "".join(self._buffer)
+        self._buffer.clear()
+        await self.send_text(text)
+
+    async def send_tag(self, *fragments: BaseTag | str) -> None:
+        """Render and send fragments, along with anything already queued, as one text frame."""
+        self.queue(*fragments)
+        await self.flush()
+
+    async def stream_tags(
+        self, fragments: AsyncIterable[BaseTag | str] | Iterable[BaseTag | str], *, max_batch: int = 64
+    ) -> None:
+        """Send fragments from an iterable, coalescing up to `max_batch` fragments per frame.
+
+        An async iterable is consumed by a producer task; whatever it has
+        rendered while the previous frame was being sent goes out together,
+        so a fast producer is batched and a slow one is never delayed.
+        """
+        if isinstance(fragments, AsyncIterable):
+            await self._stream_async(fragments, max_batch)
+            return
+        for fragment in fragments:
+            self.queue(fragment)
+            if self.buffered >= max_batch:
+                await self.flush()
+        await self.flush()
+
+    async def _stream_async(self, fragments: AsyncIterable[BaseTag | str], max_batch: int) -> None:
+        async def produce(send_stream: MemoryObjectSendStream[str]) -> None:
+            async for fragment in fragments:
+                await send_stream.send(str(fragment))
+
+        async def send_batch(texts: list[str]) -> None:
+            self._buffer.extend(texts)
+            await self.flush()
+
+        await relay_batches(produce, send_batch, max_queue=max_batch, max_batch=max_batch)
+
+
+WebSocket = AirWebSocket
+"""Alias for the `AirWebSocket` class; use it if it improves clarity."""
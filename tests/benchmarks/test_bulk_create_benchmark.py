@@ -0,0 +1,102 @@
+"""Benchmark loading 1,000,000 rows with AirModel.bulk_create against a recording pool.
+
+The pool answers immediately, so the numbers are the client-side cost of
+each path: building and binding the INSERT chunks and hydrating what
+``RETURNING *`` sends back, or feeding records to ``COPY``. The pool also
+records every statement so the run can check that none of them passes
+PostgreSQL's bind-parameter limit. A single statement for all rows, as
+bulk_create used to send, would need 4,000,000 parameters.
+"""
+
+from collections.abc import AsyncGenerator, Iterable, Iterator
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any
+
+import anyio
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from air import AirField
+from air.model import AirDB, AirModel
+from air.model.main import MAX_BIND_PARAMS
+
+ROWS = 1_000_000
+
+
+class Shard(AirModel):
+    id: int | None = AirField(default=None, primary_key=True)
+    glaze: str
+    cone: int
+    kiln: str
+    fired_at: datetime
+
+
+FIRED = datetime(2026, 3, 1)
+ITEMS = [{"glaze": f"glaze {n % 97}", "cone": n % 14, "kiln": "anagama", "fired_at": FIRED} for n in range(ROWS)]
+RETURNED = [{"id": n, **item} for n, item in enumerate(ITEMS[:1000])]
+
+
+class RecordingPool:
+    """Returns canned rows and counts what it was sent."""
+
+    def __init__(self) -> None:
+        self.statements = 0
+        self.most_params = 0
+        self.copied = 0
+
+    async def fetch(self, sql: str, *args: Any) -> list[dict[str, Any]]:
+        self.statements += 1
+        self.most_params = max(self.most_params, len(args))
+        return RETURNED[: len(args) // 4]
+
+    async def copy_records_to_table(self, table_name: str, *, records: Iterable[Any], columns: list[str]) -> str:
+        self.statements += 1
+        count = sum(1 for _ in records)
+        self.copied += count
+        return f"COPY {count}"
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncGenerator["RecordingPool"]:
+        yield self
+
+    def transaction(self) -> "RecordingPool":
+        return self
+
+    async def start(self) -> None:
+        pass
+
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:
+        pass
+
+
+@pytest.fixture
+def pool() -> Iterator[RecordingPool]:
+    db = AirDB()
+    fake = RecordingPool()
+    db.connect(fake)
+    yield fake
+    db.disconnect()
+
+
+def test_bulk_create_returning_benchmark(benchmark: BenchmarkFixture, pool: RecordingPool) -> None:
+    """Chunked multi-row INSERT ... RETURNING *, hydrating trusted rows."""
+    shards = benchmark.pedantic(lambda: anyio.run(lambda: Shard.bulk_create(ITEMS, trusted=True)), rounds=3)
+
+    assert len(shards) == ROWS
+    assert pool.most_params <= MAX_BIND_PARAMS
+
+
+def test_bulk_create_copy_benchmark(benchmark: BenchmarkFixture, pool: RecordingPool) -> None:
+    """returning=False: one COPY streams every record."""
+
+    def load() -> int:
+        pool.statements = 0
+        count = anyio.run(lambda: Shard.bulk_create(ITEMS, returning=False))
+        assert pool.statements == 1
+        return count
+
+    assert benchmark.pedantic(load, rounds=3) == ROWS
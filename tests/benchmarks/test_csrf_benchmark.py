@@ -0,0 +1,71 @@
+"""Benchmark CSRF token generation and verification throughput.
+
+The baseline is the previous scheme: `secrets.token_urlsafe` plus a
+hex-encoded HMAC-SHA256 over a colon-separated text payload.
+"""
+
+import hashlib
+import hmac
+import secrets
+import time
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from air.form.csrf import CsrfSigner
+
+TOKEN_COUNT = 10_000
+SECRET = b"s" * 32
+
+
+def _text_token() -> str:
+    payload = f"{int(time.time())}:{secrets.token_urlsafe(16)}"
+    return f"{payload}:{hmac.new(SECRET, payload.encode(), hashlib.sha256).hexdigest()}"
+
+
+def _check_text_token(token: str) -> str:
+    timestamp, nonce, sig = token.split(":")
+    expected = hmac.new(SECRET, f"{timestamp}:{nonce}".encode(), hashlib.sha256).hexdigest()
+    if not hmac.compare_digest(expected, sig) or time.time() - int(timestamp) > 3600:
+        raise ValueError(token)
+    return token
+
+
+def test_generate_text_tokens_benchmark(benchmark: BenchmarkFixture) -> None:
+    """Baseline: text tokens with a hex HMAC-SHA256."""
+    tokens = benchmark(lambda: [_text_token() for _ in range(TOKEN_COUNT)])
+    assert len(set(tokens)) == TOKEN_COUNT
+
+
+def test_generate_packed_tokens_benchmark(benchmark: BenchmarkFixture) -> None:
+    """Packed base64url tokens with a keyed BLAKE2b MAC."""
+    signer = CsrfSigner(SECRET)
+    tokens = benchmark(lambda: [signer.generate() for _ in range(TOKEN_COUNT)])
+    assert len(set(tokens)) == TOKEN_COUNT
+
+
+def test_verify_text_tokens_benchmark(benchmark: BenchmarkFixture) -> None:
+    """Baseline: split, re-sign and compare text tokens."""
+    tokens = [_text_token() for _ in range(TOKEN_COUNT)]
+    verified = benchmark(lambda: [_check_text_token(token) for token in tokens])
+    assert verified == tokens
+
+
+def test_verify_packed_tokens_benchmark(benchmark: BenchmarkFixture) -> None:
+    """Decode, re-sign and compare packed tokens."""
+    signer = CsrfSigner(SECRET)
+    tokens = [signer.generate() for _ in range(TOKEN_COUNT)]
+    verified = benchmark(lambda: [signer.verify(token) for token in tokens])
+    assert verified == tokens
+
+
+def test_verify_packed_tokens_with_replay_cache_benchmark(benchmark: BenchmarkFixture) -> None:
+    """Verification plus the seen-nonce LRU; each round gets fresh tokens."""
+    signer = CsrfSigner(SECRET, replay_cache=TOKEN_COUNT)
+
+    def setup() -> tuple[tuple[list[str]], dict]:
+        return ([signer.generate() for _ in range(TOKEN_COUNT)],), {}
+
+    def verify_all(tokens: list[str]) -> list[str]:
+        return [signer.verify(token) for token in tokens]
+
+    benchmark.pedantic(verify_all, setup=setup, rounds=10)
@@ -0,0 +1,119 @@
+"""Benchmark AirForm rendering with and without the per-model render plan.
+
+The render plan holds each field's metadata-derived HTML, pre-escaped, so
+a render only fills in values and errors. Clearing the plan cache before
+every round measures what reading the field metadata costs per render.
+"""
+
+from enum import Enum
+from typing import Literal
+
+from pydantic import BaseModel
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from air.field import AirField
+from air.form import (
+    AirForm,
+    default_form_widget,
+    main as form_main,
+)
+
+
+class Glaze(Enum):
+    CELADON = "celadon"
+    TENMOKU = "tenmoku"
+    SHINO = "shino"
+    ASH = "ash"
+
+
+class CommissionModel(BaseModel):
+    name: str = AirField(label="Your name", placeholder="Ada", min_length=2, max_length=80)
+    email: str = AirField(type="email", label="Email", help_text="We reply within a day.")
+    phone: str | None = AirField(default=None, type="phone", label="Phone")
+    pieces: int = AirField(label="Number of pieces", ge=1, le=50)
+    budget: float = AirField(type="currency", label="Budget")
+    glaze: Glaze
+    finish: Literal["matte", "satin", "gloss"] = "satin"
+    kiln: str = AirField(default="gas", choices=[("gas", "Gas"), ("wood", "Wood"), ("electric", "Electric")])
+    food_safe: bool = True
+    rush: bool = False
+    notes: str = AirField(default="", widget="textarea", max_length=2000)
+    reference: str = AirField(default="", label="Reference", placeholder="Order number")
+
+
+class CommissionForm(AirForm[CommissionModel]):
+    pass
+
+
+DATA = {
+    "name": "Ada <Lovelace>",
+    "email": "ada@example.com",
+    "pieces": "12",
+    "budget": "350.50",
+    "glaze": "tenmoku",
+    "finish": "gloss",
+    "kiln": "wood",
+    "food_safe": "on",
+    "notes": "Matching set & one serving bowl",
+}
+
+ERRORS = [
+    {"type": "missing", "loc": ("phone",), "msg": "Field required", "input": None},
+    {"type": "greater_than_equal", "loc": ("pieces",), "msg": "too small", "input": "0"},
+]
+
+
+def test_form_render_benchmark(benchmark: BenchmarkFixture) -> None:
+    """A re-rendered form with submitted values and errors, using the cached render plan."""
+    form = CommissionForm(DATA)
+    form.errors = ERRORS  # ty: ignore[invalid-assignment]
+
+    html = benchmark(form.render)
+
+    assert 'value="Ada &lt;Lovelace&gt;"' in html
+    assert 'aria-describedby="pieces-error"' in html
+
+
+def test_form_widget_with_plan_benchmark(benchmark: BenchmarkFixture) -> None:
+    """The default widget alone, filling values and errors into the render plan."""
+    html = benchmark(default_form_widget, model=CommissionModel, data=DATA, errors=ERRORS)
+
+    assert '<option value="wood" selected>Wood</option>' in html
+
+
+def test_form_widget_without_plan_benchmark(benchmark: BenchmarkFixture) -> None:
+    """Baseline: field metadata is read and escaped again on every render."""
+
+    def render_uncached() -> str:
+        form_main._form_plans.clear()
+        return default_form_widget(model=CommissionModel, data=DATA, errors=ERRORS)
+
+    html = benchmark(render_uncached)
+
+    assert '<option value="wood" selected>Wood</option>' in html
+
+
+SKUS = [(f"sku-{n:05d}", f"Stoneware item {n} ({n % 12} glaze)") for n in range(5000)]
+
+
+class SkuModel(BaseModel):
+    sku: str = AirField(choices=SKUS, label="SKU")
+
+
+def test_large_select_cached_options_benchmark(benchmark: BenchmarkFixture) -> None:
+    """A 5,000-option select: cached option HTML with the selected value patched in."""
+    html = benchmark(default_form_widget, model=SkuModel, data={"sku": "sku-04321"})
+
+    assert '<option value="sku-04321" selected>' in html
+
+
+def test_large_select_rebuilt_options_benchmark(benchmark: BenchmarkFixture) -> None:
+    """Baseline: options are rebuilt and escaped on every render."""
+
+    def render_uncached() -> str:
+        form_main._form_plans.clear()
+        return default_form_widget(model=SkuModel, data={"sku": "sku-04321"})
+
+    html = benchmark(render_uncached)
+
+    assert '<option value="sku-04321" selected>' in html
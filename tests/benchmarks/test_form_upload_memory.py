@@ -0,0 +1,117 @@
+"""Memory check for streaming a 1 GB upload through AirForm.from_stream().
+
+The request body is generated chunk by chunk and fed straight to the
+ASGI app, as a server would: Starlette's TestClient reads the whole
+body into memory first, which would defeat the point. The file goes
+to a hashing sink, so peak traced memory should stay near one chunk
+no matter how large the upload is.
+"""
+
+import hashlib
+import logging
+import re
+import time
+import tracemalloc
+from collections.abc import Iterator
+from typing import Any
+
+import anyio
+import pytest
+from pydantic import BaseModel
+
+import air
+from air import AirForm
+from air.form.streaming import HashSink
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+UPLOAD_SIZE = 1024**3
+CHUNK_SIZE = 64 * 1024
+BOUNDARY = "kiln-log-boundary"
+
+
+class KilnLogModel(BaseModel):
+    kiln: str
+    log: str
+
+
+class KilnLogForm(AirForm[KilnLogModel]):
+    pass
+
+
+def _body(csrf_token: str, chunk: bytes) -> Iterator[bytes]:
+    yield (
+        f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="csrf_token"\r\n\r\n{csrf_token}\r\n'
+        f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="kiln"\r\n\r\nanagama\r\n'
+        f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="log"; filename="firing.bin"\r\n'
+        "Content-Type: application/octet-stream\r\n\r\n"
+    ).encode()
+    for _ in range(UPLOAD_SIZE // len(chunk)):
+        yield chunk
+    yield f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+async def _upload(app: air.Air, body: Iterator[bytes]) -> list[dict[str, Any]]:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/logs",
+        "raw_path": b"/logs",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"content-type", f"multipart/form-data; boundary={BOUNDARY}".encode())],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    sent: list[dict[str, Any]] = []
+    chunks = iter(body)
+
+    async def receive() -> dict[str, Any]:
+        data = next(chunks, None)
+        if data is None:
+            return {"type": "http.request", "body": b"", "more_body": False}
+        return {"type": "http.request", "body": data, "more_body": True}
+
+    async def send(message: dict[str, Any]) -> None:
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent
+
+
+@pytest.mark.memory
+def test_stream_one_gigabyte_upload_memory() -> None:
+    """A 1 GB upload is hashed as it arrives, with bounded memory."""
+    app = air.Air()
+    digests: list[str] = []
+
+    @app.post("/logs")
+    async def upload_log(request: air.Request) -> air.P:
+        form = await KilnLogForm.from_stream(request, uploads={"log": lambda upload: HashSink()})
+        digests.append(form.data.log)
+        return air.P("stored")
+
+    match = re.search(r'name="csrf_token" value="([^"]+)"', KilnLogForm().render())
+    assert match
+    chunk = b"\x5a" * CHUNK_SIZE
+    expected = hashlib.sha256()
+    for _ in range(UPLOAD_SIZE // CHUNK_SIZE):
+        expected.update(chunk)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    sent = anyio.run(_upload, app, _body(match.group(1), chunk))
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    logging.getLogger(__name__).info(
+        "1 GB upload: %.2f s, %.0f MB/s, peak traced memory %.2f MB", elapsed, 1024 / elapsed, peak / 1024**2
+    )
+    assert sent[0]["status"] == 200
+    assert digests == [expected.hexdigest()]
+    # A handful of in-flight chunks, never the upload itself
+    assert peak < 16 * CHUNK_SIZE
@@ -0,0 +1,64 @@
+"""Benchmark AirForm validation of 10,000 CSV-style submissions.
+
+Compares validating each row with its own form against
+`AirForm.validate_many`, which skips the per-call setup of `validate()`.
+"""
+
+from pydantic import BaseModel
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from air.field import AirField
+from air.form import AirForm
+
+ROW_COUNT = 10_000
+
+
+class ClayOrderModel(BaseModel):
+    customer: str = AirField(min_length=2)
+    clay: str
+    kilograms: float
+    bags: int
+    wedged: bool
+    delivery: bool | None = None
+    notes: str = ""
+
+
+class ClayOrderForm(AirForm[ClayOrderModel]):
+    pass
+
+
+ROWS = [
+    {
+        "customer": f"Studio {n}",
+        "clay": ("stoneware", "porcelain", "earthenware")[n % 3],
+        "kilograms": f"{n % 50 + 0.5}",
+        "bags": str(n % 9 + 1),
+        **({"wedged": "on"} if n % 2 else {}),
+        # One row in a hundred has a typo in a number column
+        **({"bags": "two"} if n % 100 == 0 else {}),
+    }
+    for n in range(ROW_COUNT)
+]
+
+
+def test_validate_rows_one_by_one_benchmark(benchmark: BenchmarkFixture) -> None:
+    """Baseline: a form per row, each calling validate()."""
+
+    def validate_all() -> list[ClayOrderForm]:
+        forms = []
+        for row in ROWS:
+            form = ClayOrderForm()
+            form.validate(row)
+            forms.append(form)
+        return forms
+
+    forms = benchmark(validate_all)
+
+    assert sum(form.is_valid for form in forms) == ROW_COUNT - ROW_COUNT // 100
+
+
+def test_validate_many_benchmark(benchmark: BenchmarkFixture) -> None:
+    """All rows validated with validate_many."""
+    forms = benchmark(ClayOrderForm.validate_many, ROWS)
+
+    assert sum(form.is_valid for form in forms) == ROW_COUNT - ROW_COUNT // 100
@@ -0,0 +1,46 @@
+"""Benchmark `import air` with `python -X importtime` and enforce a budget.
+
+Production workers pay the import cost on every start and every `--reload`,
+so the cumulative time of the `air` package import is kept under a budget.
+A timing budget alone is a weak guard, so the import tree is also checked
+for the optional dependencies that must only load on first use.
+"""
+
+import re
+import subprocess
+import sys
+
+from tests.test_imports import LAZY_MODULES
+
+# Cumulative microseconds for the top-level `air` import line. The lazy import
+# measured 0.33-0.47 s; the eager one it replaced took about 0.75 s.
+IMPORT_TIME_BUDGET_US = 600_000
+
+_IMPORTTIME_LINE_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)")
+
+
+def _import_times() -> dict[str, int]:
+    """Return cumulative import times, in microseconds, of every module a fresh `import air` loads.
+
+    Returns:
+        A mapping of module name to cumulative import time; top-level imports are keyed by their own name.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import air"], capture_output=True, text=True, check=True
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if match := _IMPORTTIME_LINE_RE.match(line):
+            _, cumulative, _, module = match.groups()
+            times[module] = int(cumulative)
+    return times
+
+
+def test_import_air_time_budget() -> None:
+    """The cumulative `import air` time stays within budget."""
+    runs = [_import_times() for _ in range(5)]
+    best = min(times["air"] for times in runs)
+
+    eager = {module.split(".")[0] for module in runs[0]}.intersection(LAZY_MODULES)
+    assert not eager, f"import air loaded {sorted(eager)}"
+    assert best < IMPORT_TIME_BUDGET_US, f"import air took {best / 1000:.1f} ms"
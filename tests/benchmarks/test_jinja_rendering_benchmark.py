@@ -5,16 +5,26 @@ equivalent HTML generation using Jinja2 templates.
 """
 
 import tempfile
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 from unittest.mock import Mock
 
+from markupsafe import Markup
 from pytest_benchmark.fixture import BenchmarkFixture
 from starlette.datastructures import URL
 from starlette.requests import Request
 from starlette.responses import HTMLResponse
 
+import air
 from air.templating import JinjaRenderer
 
+CARD_TEMPLATE = """<article class="card" id="card-{{ id }}">
+    <h2>{{ name }}</h2>
+    <p>{{ description }}</p>
+    {{ actions|safe }}
+</article>"""
+
 
 def test_jinja_complex_page_rendering_benchmark(benchmark: BenchmarkFixture) -> None:
     """Benchmark Jinja2 template rendering for complex HTML structure."""
@@ -83,3 +93,177 @@ def test_jinja_complex_page_rendering_benchmark(benchmark: BenchmarkFixture) ->
             return jinja_renderer(mock_request, "complex_page.html", context=context)
 
         benchmark(render_jinja_page)
+
+
+PRODUCTS = [
+    {
+        "id": i,
+        "name": f"Product {i}",
+        "description": f"Description for product {i}",
+        "actions": air.Div(air.Button("Add to Cart", data_product=i), class_="product-actions"),
+    }
+    for i in range(1, 21)
+]
+
+
+def _mixed_page(render_card: Callable[[dict[str, Any]], air.SafeStr]) -> str:
+    """An Air Tags layout embedding one Jinja-rendered card per product."""
+    return air.Html(
+        air.Head(air.Title("Product Catalog")),
+        air.Body(
+            air.H1("Product Catalog"),
+            air.Section(*(render_card(product) for product in PRODUCTS), class_="product-grid"),
+        ),
+    ).render()
+
+
+def _card_renderer(temp_dir: str) -> tuple[JinjaRenderer, air.Request]:
+    (Path(temp_dir) / "card.html").write_text(CARD_TEMPLATE)
+    mock_request = Mock(spec=air.Request)
+    mock_request.url = URL("http://localhost/test")
+    return JinjaRenderer(directory=temp_dir), mock_request
+
+
+def test_jinja_in_air_tags_via_response_benchmark(benchmark: BenchmarkFixture) -> None:
+    """Baseline: each card builds a TemplateResponse and decodes its body, as `as_string` used to."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        jinja_renderer, mock_request = _card_renderer(temp_dir)
+
+        def render_card(product: dict[str, Any]) -> air.SafeStr:
+            response = jinja_renderer(mock_request, "card.html", context=dict(product))
+            return air.SafeStr(bytes(response.body).decode("utf-8"))
+
+        html = benchmark(_mixed_page, render_card)
+
+    assert html.count('class="card"') == len(PRODUCTS)
+
+
+def test_jinja_in_air_tags_render_to_string_benchmark(benchmark: BenchmarkFixture) -> None:
+    """Each card is rendered straight to a SafeStr with `as_string=True`."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        jinja_renderer, mock_request = _card_renderer(temp_dir)
+
+        def render_card(product: dict[str, Any]) -> air.SafeStr:
+            return jinja_renderer(mock_request, "card.html", context=dict(product), as_string=True)
+
+        html = benchmark(_mixed_page, render_card)
+
+    assert html.count('class="card"') == len(PRODUCTS)
+
+
+OPTIONAL_BLOCKS_TEMPLATE = """<main>
+{% if tab == "orders" %}{{ orders }}{% endif %}
+{% if tab == "customers" %}{{ customers }}{% endif %}
+{% if tab == "products" %}{{ products }}{% endif %}
+{% if tab == "reports" %}{{ reports }}{% endif %}
+</main>"""
+
+
+def _large_table(name: str) -> air.Table:
+    return air.Table(
+        *(air.Tr(air.Td(f"{name} {i}"), air.Td(air.A("Edit", href=f"/{name}/{i}"))) for i in range(250)),
+        class_=name,
+    )
+
+
+def _optional_blocks() -> dict[str, air.Table]:
+    """Fresh tags per round, as a view builds them per request; tags cache their own rendering."""
+    return {name: _large_table(name) for name in ("orders", "customers", "products", "reports")}
+
+
+def _optional_blocks_renderer(temp_dir: str) -> tuple[JinjaRenderer, air.Request]:
+    (Path(temp_dir) / "tabs.html").write_text(OPTIONAL_BLOCKS_TEMPLATE)
+    mock_request = Mock(spec=air.Request)
+    mock_request.url = URL("http://localhost/test")
+    return JinjaRenderer(directory=temp_dir), mock_request
+
+
+def test_jinja_optional_blocks_eager_benchmark(benchmark: BenchmarkFixture) -> None:
+    """Baseline: every tag is rendered up front, although only one tab is shown."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        jinja_renderer, mock_request = _optional_blocks_renderer(temp_dir)
+
+        def render_page() -> air.SafeStr:
+            context = {name: Markup(tag.render()) for name, tag in _optional_blocks().items()}
+            return jinja_renderer(mock_request, "tabs.html", context=context, tab="orders", as_string=True)
+
+        html = benchmark(render_page)
+
+    assert 'class="orders"' in html
+    assert 'class="reports"' not in html
+
+
+def test_jinja_optional_blocks_lazy_benchmark(benchmark: BenchmarkFixture) -> None:
+    """Tags are passed to Jinja lazily, so only the shown tab is rendered."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        jinja_renderer, mock_request = _optional_blocks_renderer(temp_dir)
+
+        def render_page() -> air.SafeStr:
+            return jinja_renderer(mock_request, "tabs.html", context=_optional_blocks(), tab="orders", as_string=True)
+
+        html = benchmark(render_page)
+
+    assert 'class="orders"' in html
+    assert 'class="reports"' not in html
+
+
+FRAGMENT_BASE_TEMPLATE = """<html>
+<head><title>{{ title }}</title></head>
+<body>
+    <nav><ul>{% for link in links %}<li><a href="{{ link.href }}">{{ link.label }}</a></li>{% endfor %}</ul></nav>
+    {% block content %}{% endblock %}
+    <footer>{% for product in products %}<a href="/p/{{ product.id }}">{{ product.name }}</a>{% endfor %}</footer>
+</body>
+</html>"""
+
+FRAGMENT_PAGE_TEMPLATE = """{% extends "base.html" %}
+{% block content %}
+<main>
+    <h1>{{ title }}</h1>
+    {% block results %}
+    <ul id="results">{% for product in products[:10] %}<li>{{ product.name }}: {{ product.price }}</li>{% endfor %}</ul>
+    {% endblock %}
+</main>
+{% endblock %}"""
+
+FRAGMENT_CONTEXT = {
+    "title": "Search",
+    "links": [{"href": f"/section/{i}", "label": f"Section {i}"} for i in range(50)],
+    "products": [{"id": i, "name": f"Product {i}", "price": f"${i}.99"} for i in range(500)],
+}
+
+
+def _fragment_renderer(temp_dir: str) -> JinjaRenderer:
+    (Path(temp_dir) / "base.html").write_text(FRAGMENT_BASE_TEMPLATE)
+    (Path(temp_dir) / "page.html").write_text(FRAGMENT_PAGE_TEMPLATE)
+    return JinjaRenderer(directory=temp_dir)
+
+
+def _hx_request(target: str | None) -> air.Request:
+    headers = [(b"hx-request", b"true")] if target else []
+    if target:
+        headers.append((b"hx-target", target.encode()))
+    return air.Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def test_jinja_full_page_for_search_benchmark(benchmark: BenchmarkFixture) -> None:
+    """Baseline: the whole page, layout included, is rendered for a search update."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        jinja_renderer = _fragment_renderer(temp_dir)
+        request = _hx_request(None)
+
+        html = benchmark(jinja_renderer.render_to_string, request, "page.html", dict(FRAGMENT_CONTEXT), block=True)
+
+    assert "<footer>" in html
+
+
+def test_jinja_block_for_search_benchmark(benchmark: BenchmarkFixture) -> None:
+    """An HTMX request targeting `#results` renders only the `results` block."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        jinja_renderer = _fragment_renderer(temp_dir)
+        request = _hx_request("results")
+
+        html = benchmark(jinja_renderer.render_to_string, request, "page.html", dict(FRAGMENT_CONTEXT), block=True)
+
+    assert html.lstrip().startswith('<ul id="results">')
+    assert "<footer>" not in html
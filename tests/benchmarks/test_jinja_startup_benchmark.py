@@ -0,0 +1,73 @@
+"""Benchmark cold-start template loading for a 200-template project.
+
+Each round builds a fresh JinjaRenderer, as a new worker process or a
+`--reload` restart would, and loads every template once. Compares
+compiling from source, loading from a warm bytecode cache, and loading
+templates precompiled by `air templates compile`.
+"""
+
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from air.templating import JinjaRenderer, compile_templates, compiled_environment
+
+TEMPLATE_COUNT = 200
+
+TEMPLATE = """{% extends "base.html" %}
+{% block content %}
+<section id="page-{{ n }}">
+  <h1>{{ title }} {{ n }}</h1>
+  {% for item in items %}
+    <article class="{{ loop.cycle('odd', 'even') }}">
+      {% if item.featured %}<strong>{{ item.name|title }}</strong>{% else %}{{ item.name }}{% endif %}
+      <ul>{% for tag in item.tags %}<li>{{ tag }}</li>{% endfor %}</ul>
+    </article>
+  {% endfor %}
+</section>
+{% endblock %}
+"""
+
+
+@pytest.fixture(scope="module")
+def template_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    directory = tmp_path_factory.mktemp("templates")
+    (directory / "base.html").write_text("<html><body>{% block content %}{% endblock %}</body></html>")
+    for n in range(TEMPLATE_COUNT):
+        (directory / f"page_{n}.html").write_text(TEMPLATE.replace("{{ n }}", str(n)))
+    return directory
+
+
+def _load_all(renderer: JinjaRenderer) -> int:
+    env = renderer.templates.env
+    return sum(1 for n in range(TEMPLATE_COUNT) if env.get_template(f"page_{n}.html"))
+
+
+def test_jinja_startup_from_source_benchmark(benchmark: BenchmarkFixture, template_dir: Path) -> None:
+    """Every template is parsed and compiled on first use."""
+    loaded = benchmark(lambda: _load_all(JinjaRenderer(template_dir)))
+
+    assert loaded == TEMPLATE_COUNT
+
+
+def test_jinja_startup_bytecode_cache_benchmark(
+    benchmark: BenchmarkFixture, template_dir: Path, tmp_path: Path
+) -> None:
+    """Templates are loaded from a bytecode cache warmed by an earlier process."""
+    cache_dir = tmp_path / "bytecode"
+    _load_all(JinjaRenderer(template_dir, bytecode_cache=cache_dir))
+
+    loaded = benchmark(lambda: _load_all(JinjaRenderer(template_dir, bytecode_cache=cache_dir)))
+
+    assert loaded == TEMPLATE_COUNT
+
+
+def test_jinja_startup_precompiled_benchmark(benchmark: BenchmarkFixture, template_dir: Path, tmp_path: Path) -> None:
+    """Templates are imported from a zip written by `air templates compile`."""
+    target = tmp_path / "templates.zip"
+    compile_templates(template_dir, target)
+
+    loaded = benchmark(lambda: _load_all(JinjaRenderer(env=compiled_environment(target))))
+
+    assert loaded == TEMPLATE_COUNT
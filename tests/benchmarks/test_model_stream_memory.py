@@ -0,0 +1,152 @@
+"""Memory check for exporting one million rows with AirModel.stream().
+
+A fake connection hands out rows from a generator, like a server-side
+cursor fetching `prefetch` rows per round trip. The rows are written
+out as a CSV StreamingResponse straight through the ASGI app, so peak
+traced memory should stay near one batch no matter how many rows go
+out.
+"""
+
+import csv
+import io
+import logging
+import time
+import tracemalloc
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
+
+import anyio
+import pytest
+from starlette.responses import StreamingResponse
+
+import air
+from air import AirField
+from air.model import AirDB, AirModel
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+ROW_COUNT = 1_000_000
+
+
+class Firing(AirModel):
+    id: int | None = AirField(default=None, primary_key=True)
+    kiln: str
+    cone: int
+    fired_at: datetime
+
+
+class CursorConnection:
+    def __init__(self) -> None:
+        self.prefetch = 0
+
+    async def _rows(self) -> AsyncIterator[dict[str, Any]]:
+        fired_at = datetime(2026, 3, 1)
+        for n in range(ROW_COUNT):
+            yield {"id": n, "kiln": f"Kiln {n % 40}", "cone": n % 12, "fired_at": fired_at}
+
+    def cursor(self, sql: str, *args: Any, prefetch: int) -> AsyncIterator[dict[str, Any]]:
+        self.prefetch = prefetch
+        return self._rows()
+
+    def transaction(self) -> Any:
+        class Transaction:
+            async def start(self) -> None: ...
+            async def commit(self) -> None: ...
+            async def rollback(self) -> None: ...
+
+        return Transaction()
+
+
+class CursorPool:
+    def __init__(self) -> None:
+        self.connection = CursorConnection()
+
+    def acquire(self) -> Any:
+        connection = self.connection
+
+        class Acquire:
+            async def __aenter__(self) -> CursorConnection:
+                return connection
+
+            async def __aexit__(self, *args: object) -> None: ...
+
+        return Acquire()
+
+
+async def _csv_lines() -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    async for firing in Firing.stream(order_by="id", trusted=True):
+        writer.writerow((firing.id, firing.kiln, firing.cone, firing.fired_at.isoformat()))
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+async def _export(app: air.Air) -> tuple[int, int]:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/firings.csv",
+        "raw_path": b"/firings.csv",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    status = 0
+    received = 0
+
+    async def receive() -> dict[str, Any]:
+        await anyio.sleep_forever()
+        return {}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status, received
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        else:
+            received += message["body"].count(b"\n")
+
+    await app(scope, receive, send)
+    return status, received
+
+
+@pytest.mark.memory
+def test_stream_one_million_rows_memory() -> None:
+    """A million-row CSV export never holds more than a few rows."""
+    app = air.Air()
+
+    @app.get("/firings.csv")
+    async def export() -> StreamingResponse:
+        return StreamingResponse(_csv_lines(), media_type="text/csv")
+
+    db = AirDB()
+    pool = CursorPool()
+    db.connect(pool)
+    try:
+        tracemalloc.start()
+        started = time.perf_counter()
+        status, lines = anyio.run(_export, app)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        db.disconnect()
+
+    logging.getLogger(__name__).info(
+        "1M-row CSV export: %.2f s, %.0f rows/s, peak traced memory %.2f MB",
+        elapsed,
+        ROW_COUNT / elapsed,
+        peak / 1024**2,
+    )
+    assert status == 200
+    assert lines == ROW_COUNT
+    assert pool.connection.prefetch == 500
+    # Bounded by a batch of rows, not by the result set
+    assert peak < 4 * 1024**2
@@ -0,0 +1,131 @@
+"""Benchmark AirModel query overhead against a mock pool.
+
+The pool returns canned rows immediately, so the numbers are the ORM's
+own cost per call: building the statement and validating the rows.
+The baseline rebuilds the SQL on every call, as AirModel used to.
+Row hydration is measured separately over a 50,000-row result.
+"""
+
+import re
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any
+
+import anyio
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from air import AirField
+from air.model import AirDB, AirModel
+from air.model.main import _is_primary_key, _parse_kwargs, _table_prefix  # noqa: PLC2701
+
+CALLS = 1_000
+EXPORT_ROWS = 50_000
+
+
+class Glaze(AirModel):
+    id: int | None = AirField(default=None, primary_key=True)
+    name: str
+    cone: int
+    color: str
+    fired_at: datetime
+
+
+ROW = {"id": 1, "name": "Celadon", "cone": 10, "color": "green", "fired_at": datetime(2026, 3, 1)}
+
+
+class InstantPool:
+    async def fetch(self, sql: str, *args: Any) -> list[dict[str, Any]]:
+        return [ROW]
+
+    async def fetchrow(self, sql: str, *args: Any) -> dict[str, Any]:
+        return ROW
+
+
+def _rebuilt_filter_sql(**kwargs: Any) -> tuple[str, list[Any]]:
+    prefix = _table_prefix(Glaze.__module__)
+    snake = re.sub(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])", "_", Glaze.__name__).lower()
+    pk = next((name for name, info in Glaze.model_fields.items() if _is_primary_key(info)), None)
+    _ = [name for name in Glaze.model_fields if name != pk]
+    conditions, values = _parse_kwargs(kwargs)
+    sql = f'SELECT * FROM "{prefix}_{snake}" WHERE {" AND ".join(conditions)} ORDER BY "name" ASC LIMIT 20'
+    return sql, values
+
+
+def _run(call: Any) -> None:
+    async def many() -> None:
+        for _ in range(CALLS):
+            await call()
+
+    anyio.run(many)
+
+
+def test_filter_rebuilding_sql_benchmark(benchmark: BenchmarkFixture) -> None:
+    """Baseline: table name, primary key and WHERE clause rebuilt per call."""
+    pool = InstantPool()
+
+    async def call() -> list[Glaze]:
+        sql, values = _rebuilt_filter_sql(cone__gte=6, color="green")
+        return [Glaze.model_validate(dict(row)) for row in await pool.fetch(sql, *values)]
+
+    benchmark(_run, call)
+
+
+def test_filter_cached_sql_benchmark(benchmark: BenchmarkFixture) -> None:
+    """AirModel.filter with per-class metadata and memoized statements."""
+    db = AirDB()
+    db.connect(InstantPool())
+    try:
+        benchmark(_run, lambda: Glaze.filter(cone__gte=6, color="green", order_by="name", limit=20))
+    finally:
+        db.disconnect()
+    assert len(Glaze._air_meta.statements) == 1
+
+
+def test_create_cached_sql_benchmark(benchmark: BenchmarkFixture) -> None:
+    """AirModel.create with a memoized INSERT."""
+    db = AirDB()
+    db.connect(InstantPool())
+    try:
+        benchmark(_run, lambda: Glaze.create(name="Celadon", cone=10, color="green", fired_at=datetime(2026, 3, 1)))
+    finally:
+        db.disconnect()
+
+
+EXPORT = [{**ROW, "id": n} for n in range(EXPORT_ROWS)]
+
+
+class ExportPool:
+    async def fetch(self, sql: str, *args: Any) -> list[dict[str, Any]]:
+        return EXPORT
+
+
+def _hydrate(**options: Any) -> list[Glaze]:
+    return anyio.run(lambda: Glaze.all(**options))
+
+
+@pytest.fixture
+def export_pool() -> Iterator[None]:
+    db = AirDB()
+    db.connect(ExportPool())
+    yield
+    db.disconnect()
+
+
+def test_hydrate_validated_benchmark(benchmark: BenchmarkFixture, export_pool: None) -> None:
+    """Baseline: model_validate per row."""
+    glazes = benchmark.pedantic(_hydrate, rounds=5)
+    assert len(glazes) == EXPORT_ROWS
+
+
+def test_hydrate_model_construct_benchmark(benchmark: BenchmarkFixture) -> None:
+    """model_construct per row, for comparison."""
+    glazes = benchmark.pedantic(lambda: [Glaze.model_construct(**row) for row in EXPORT], rounds=5)
+    assert len(glazes) == EXPORT_ROWS
+
+
+def test_hydrate_trusted_benchmark(benchmark: BenchmarkFixture, export_pool: None) -> None:
+    """Compiled row factory for trusted rows."""
+    glazes = benchmark.pedantic(_hydrate, kwargs={"trusted": True}, rounds=5)
+    assert len(glazes) == EXPORT_ROWS
+    assert glazes[-1] == Glaze.model_validate({**ROW, "id": EXPORT_ROWS - 1})
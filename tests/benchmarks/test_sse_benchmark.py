@@ -0,0 +1,103 @@
+"""Load benchmark for SSEResponse.
+
+Drives an Air app directly over ASGI with a thousand concurrent local SSE
+connections, each receiving a stream of rendered tag events, and checks
+that every client gets every event while batching keeps the number of
+ASGI sends below the number of events.
+"""
+
+from collections.abc import AsyncGenerator
+from contextlib import AsyncExitStack
+from typing import Any
+
+import anyio
+import anyio.lowlevel
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import air
+from air.responses import format_sse
+
+CONNECTIONS = 1_000
+EVENTS_PER_CONNECTION = 20
+
+
+def _make_app() -> air.Air:
+    app = air.Air()
+
+    async def ticker() -> AsyncGenerator[air.Li]:
+        for i in range(EVENTS_PER_CONNECTION):
+            yield air.Li(f"tick {i}", class_="tick")
+
+    @app.get("/ticks")
+    async def ticks() -> air.SSEResponse:
+        return air.SSEResponse(ticker(), ping=15)
+
+    return app
+
+
+async def _connect(app: air.Air, results: list[tuple[bytes, int]]) -> None:
+    bodies: list[bytes] = []
+
+    async def receive() -> dict[str, Any]:
+        await anyio.sleep_forever()
+        return {}
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.body" and message["body"]:
+            bodies.append(message["body"])
+        # Yield to the event loop like a real socket write would.
+        await anyio.lowlevel.checkpoint()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ticks",
+        "raw_path": b"/ticks",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver"), (b"accept", b"text/event-stream")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    await app(scope, receive, send)
+    results.append((b"".join(bodies), len(bodies)))
+
+
+async def _run_load(app: air.Air) -> list[tuple[bytes, int]]:
+    results: list[tuple[bytes, int]] = []
+    async with anyio.create_task_group() as task_group:
+        for _ in range(CONNECTIONS):
+            task_group.start_soon(_connect, app, results)
+    return results
+
+
+def test_sse_concurrent_connections_benchmark(benchmark: BenchmarkFixture) -> None:
+    """Benchmark a thousand concurrent SSE clients streaming rendered tags."""
+    app = _make_app()
+    expected = b"".join(format_sse(air.Li(f"tick {i}", class_="tick")) for i in range(EVENTS_PER_CONNECTION))
+
+    results = benchmark.pedantic(anyio.run, args=(_run_load, app), rounds=3, iterations=1)
+
+    assert len(results) == CONNECTIONS
+    assert all(body == expected for body, _ in results)
+    assert sum(sends for _, sends in results) < CONNECTIONS * EVENTS_PER_CONNECTION
+
+
+async def _fan_out(hub: air.Broadcast, subscribers: int) -> int:
+    async with AsyncExitStack() as stack:
+        for _ in range(subscribers):
+            await stack.enter_async_context(hub.subscribe("dashboard"))
+        await hub.publish(air.Div(air.H2("Live"), air.P("update"), class_="card"), channel="dashboard")
+        return hub.stats().max_lag
+
+
+def test_broadcast_fan_out_benchmark(benchmark: BenchmarkFixture) -> None:
+    """Benchmark publishing one rendered tag to 5,000 subscribers."""
+    hub = air.Broadcast()
+
+    max_lag = benchmark(anyio.run, _fan_out, hub, 5_000)
+
+    assert max_lag == 1
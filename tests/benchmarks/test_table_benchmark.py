@@ -0,0 +1,110 @@
+"""Benchmark AirTable over a one-million-row result set.
+
+The fake pool holds a million rows in index order and answers keyset
+queries with a binary search, as a PostgreSQL index seek would, so
+each page costs the same no matter how deep it is. The baseline renders the same page row by row
+with Air tags.
+"""
+
+from bisect import bisect_right
+from collections.abc import Iterator
+from datetime import datetime
+from operator import itemgetter
+from typing import Annotated, Any
+
+import anyio
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import air
+from air import AirField, AirTable
+from air.field import DisplayFormat, Filterable, Sortable
+from air.model import AirDB, AirModel
+
+ROW_COUNT = 1_000_000
+
+
+class Firing(AirModel):
+    id: int | None = AirField(default=None, primary_key=True)
+    kiln: Annotated[str, Sortable(), Filterable("contains")]
+    cone: Annotated[int, Sortable(default=True)]
+    cost: Annotated[float, DisplayFormat("currency")]
+    fired_at: Annotated[datetime, DisplayFormat("%Y-%m-%d")]
+
+
+class FiringTable(AirTable[Firing]):
+    page_size = 100
+
+
+class MillionRowPool:
+    """Serves keyset pages of a million rows sorted by (cone, id) and counts rows returned."""
+
+    def __init__(self) -> None:
+        fired_at = datetime(2026, 3, 1)
+        rows = [
+            {"id": n, "kiln": f"Kiln {n % 40}", "cone": n % 12, "cost": n * 0.25, "fired_at": fired_at}
+            for n in range(ROW_COUNT)
+        ]
+        self.rows = sorted(rows, key=itemgetter("cone", "id"))
+        self.keys = [(row["cone"], row["id"]) for row in self.rows]
+        self.returned = 0
+
+    async def fetch(self, sql: str, *args: Any) -> list[dict[str, Any]]:
+        assert '("cone", "id") >' in sql or "WHERE" not in sql
+        start = bisect_right(self.keys, (args[0], args[1])) if len(args) == 3 else 0
+        rows = self.rows[start : start + args[-1]]
+        self.returned += len(rows)
+        return rows
+
+
+@pytest.fixture(scope="module")
+def pool() -> Iterator[MillionRowPool]:
+    db = AirDB()
+    fake = MillionRowPool()
+    db.connect(fake)
+    yield fake
+    db.disconnect()
+
+
+def _tag_rows(rows: list[Firing]) -> str:
+    return "".join(
+        air.Tr(
+            air.Td(row.id),
+            air.Td(row.kiln),
+            air.Td(row.cone),
+            air.Td(f"${row.cost:,.2f}"),
+            air.Td(row.fired_at.strftime("%Y-%m-%d")),
+            id=f"firing-table-row-{row.id}",
+        ).render()
+        for row in rows
+    )
+
+
+def test_load_deep_page_fetches_one_page(benchmark: BenchmarkFixture, pool: MillionRowPool) -> None:
+    """Loading page 5,000 of 10,000 fetches page_size + 1 rows."""
+    skipped = anyio.run(lambda: Firing.paginate(order_by="cone", page_size=4999 * FiringTable.page_size, trusted=True))
+
+    def load() -> FiringTable:
+        pool.returned = 0
+        table = anyio.run(lambda: FiringTable.load(after=skipped.next_cursor))
+        assert pool.returned == FiringTable.page_size + 1
+        return table
+
+    table = benchmark.pedantic(load, rounds=20)
+
+    assert (table.rows[0].cone, table.rows[0].id) == pool.keys[499_900]
+    assert table.next_cursor is not None
+
+
+def test_render_page_with_tags_benchmark(benchmark: BenchmarkFixture, pool: MillionRowPool) -> None:
+    """Baseline: one Air tag tree per row."""
+    table = anyio.run(lambda: FiringTable.load())
+    html = benchmark(_tag_rows, table.rows)
+    assert html.count("<tr") == FiringTable.page_size
+
+
+def test_render_page_bulk_benchmark(benchmark: BenchmarkFixture, pool: MillionRowPool) -> None:
+    """Compiled per-model row renderer."""
+    table = anyio.run(lambda: FiringTable.load())
+    html = benchmark(table.render_rows)
+    assert html.count('<tr id="firing-table-row-') == FiringTable.page_size
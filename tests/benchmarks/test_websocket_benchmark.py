@@ -0,0 +1,56 @@
+"""Benchmark WebSocket tag messages per second.
+
+Air's runtime dependencies include no WebSocket client library, so the
+connection runs over Starlette's in-process test transport rather than a
+TCP socket. That isolates the cost Air adds: rendering tags and framing
+them, with and without batching.
+"""
+
+from fastapi.testclient import TestClient
+from pytest_benchmark.fixture import BenchmarkFixture
+from starlette.testclient import WebSocketTestSession
+
+import air
+
+MESSAGES = 1_000
+
+
+def _make_client(*, batch: int) -> TestClient:
+    app = air.Air()
+
+    @app.websocket("/ws")
+    async def ws(websocket: air.WebSocket) -> None:
+        await websocket.accept()
+        while (await websocket.receive_text()) == "go":
+            await websocket.stream_tags(
+                (air.Tr(air.Td(i), air.Td(f"row {i}"), id=f"row-{i}") for i in range(MESSAGES)), max_batch=batch
+            )
+            await websocket.send_text("done")
+
+    return TestClient(app)
+
+
+def _receive_all(connection: WebSocketTestSession) -> int:
+    connection.send_text("go")
+    frames = 0
+    while connection.receive_text() != "done":
+        frames += 1
+    return frames
+
+
+def test_websocket_unbatched_messages_benchmark(benchmark: BenchmarkFixture) -> None:
+    """One frame per rendered tag."""
+    with _make_client(batch=1).websocket_connect("/ws") as connection:
+        frames = benchmark(_receive_all, connection)
+        connection.send_text("stop")
+
+    assert frames == MESSAGES
+
+
+def test_websocket_batched_messages_benchmark(benchmark: BenchmarkFixture) -> None:
+    """Up to 64 rendered tags coalesced per frame."""
+    with _make_client(batch=64).websocket_connect("/ws") as connection:
+        frames = benchmark(_receive_all, connection)
+        connection.send_text("stop")
+
+    assert frames == -(-MESSAGES // 64)
@@ -0,0 +1,9 @@
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _csrf_key_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Keep any CSRF key file a test creates inside its own tmp_path."""
+    monkeypatch.setenv("AIRFORM_SECRET_FILE", str(tmp_path / "airform-csrf.key"))
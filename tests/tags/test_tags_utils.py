@@ -19,59 +19,9 @@ from air.tags.utils import SafeStr
 from .test_base_tag import FRAGMENT_HTML_SAMPLE_FILE_PATH
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
     from pathlib import Path
 
 
-@pytest.fixture
-def stub_lxml(monkeypatch: pytest.MonkeyPatch) -> Iterator[dict[str, Any]]:
-    captured: dict[str, Any] = {}
-
-    class DummyNode:
-        def __init__(self, label: str) -> None:
-            self.label = label
-            self.indented = False
-
-    def document_fromstring(source: str, *, ensure_head_body: bool) -> DummyNode:
-        node = DummyNode(f"doc::{source}::{ensure_head_body}")
-        captured["document"] = node
-        return node
-
-    def fromstring(source: str) -> DummyNode:
-        node = DummyNode(f"node::{source}")
-        captured["node"] = node
-        return node
-
-    def indent(node: DummyNode) -> None:
-        node.indented = True
-
-    def tostring(node: DummyNode, encoding: str, *, pretty_print: bool, doctype: str | None) -> str:
-        captured["serialized"] = (node.label, encoding, pretty_print, doctype)
-        return f"serialized::{node.label}::{encoding}::{pretty_print}::{doctype}"
-
-    lxml_module = types.ModuleType("lxml")
-    etree_module = types.ModuleType("lxml.etree")
-    html_module = types.ModuleType("lxml.html")
-
-    etree_module.indent = indent
-    html_module.document_fromstring = document_fromstring
-    html_module.fromstring = fromstring
-    html_module.tostring = tostring
-
-    lxml_module.etree = etree_module
-    lxml_module.html = html_module
-
-    monkeypatch.setitem(sys.modules, "lxml", lxml_module)
-    monkeypatch.setitem(sys.modules, "lxml.etree", etree_module)
-    monkeypatch.setitem(sys.modules, "lxml.html", html_module)
-
-    yield captured
-
-    monkeypatch.delitem(sys.modules, "lxml", raising=False)
-    monkeypatch.delitem(sys.modules, "lxml.etree", raising=False)
-    monkeypatch.delitem(sys.modules, "lxml.html", raising=False)
-
-
 @pytest.fixture
 def stub_rich(monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
     printed: list[dict[str, Any]] = []
@@ -202,7 +152,7 @@ def test_compact_format_html_minifies_with_safe_defaults(monkeypatch: pytest.Mon
         captured["options"] = options
         return "minified"
 
-    monkeypatch.setattr(utils.minify_html, "minify", fake_minify)
+    monkeypatch.setitem(sys.modules, "minify_html", types.SimpleNamespace(minify=fake_minify))
 
     result = utils.compact_format_html("<p> spaced </p>")
 
@@ -227,13 +177,13 @@ def test_compact_format_html_minifies_with_safe_defaults(monkeypatch: pytest.Mon
     }
 
 
-def test_format_html_uses_lxml_document_path(stub_lxml: dict[str, Any]) -> None:
+def test_format_html_uses_lxml_document_path() -> None:
     result = utils.format_html("<p/>", with_body=True, with_head=True, with_doctype=True, pretty=True)
 
     assert result == "<!doctype html>\n<html>\n  <head></head>\n  <body>\n    <p></p>\n  </body>\n</html>\n"
 
 
-def test_format_html_uses_lxml_fragment_path(stub_lxml: dict[str, Any]) -> None:
+def test_format_html_uses_lxml_fragment_path() -> None:
     result = utils.format_html("<span/>", with_body=False, pretty=False)
 
     assert result == "<span></span>"
@@ -284,7 +234,7 @@ def test_open_new_tab_success(monkeypatch: pytest.MonkeyPatch) -> None:
         visited.append(url)
         return True
 
-    monkeypatch.setattr(utils.webbrowser, "open_new_tab", record)
+    monkeypatch.setitem(sys.modules, "webbrowser", types.SimpleNamespace(open_new_tab=record))
 
     utils._open_new_tab("https://example.com")
 
@@ -295,7 +245,7 @@ def test_open_new_tab_failure(monkeypatch: pytest.MonkeyPatch) -> None:
     def deny(url: str) -> bool:
         return False
 
-    monkeypatch.setattr(utils.webbrowser, "open_new_tab", deny)
+    monkeypatch.setitem(sys.modules, "webbrowser", types.SimpleNamespace(open_new_tab=deny))
 
     with pytest.raises(BrowserOpenError):
         utils._open_new_tab("https://example.com")
@@ -498,3 +448,14 @@ def test_read_html_raises_value_error() -> None:
         match=full_match("Expected a .html file extension."),
     ):
         utils.read_html(file_path="temp.txt")
+
+
+def test_lexer_constants_are_pygments_lexers() -> None:
+    from pygments.lexers.html import HtmlLexer  # noqa: PLC0415
+    from pygments.lexers.python import PythonLexer  # noqa: PLC0415
+
+    assert isinstance(air.tags.constants.HTML_LEXER, HtmlLexer)
+    assert isinstance(air.tags.constants.PYTHON_LEXER, PythonLexer)
+    assert air.tags.constants.HTML_LEXER is air.tags.constants.HTML_LEXER
+    with pytest.raises(AttributeError):
+        _ = air.tags.constants.NOT_A_LEXER
@@ -0,0 +1,164 @@
+from collections.abc import Callable
+from typing import Any
+
+import anyio
+import pytest
+
+import air
+from air.broadcast import BroadcastStats, MemoryBackend
+from air.responses import format_sse
+
+
+@pytest.mark.asyncio
+async def test_publish_fans_out_shared_bytes() -> None:
+    hub = air.Broadcast()
+
+    async with hub.subscribe() as first, hub.subscribe() as second:
+        await hub.publish(air.P("Hello"))
+        frame_one = await anext(aiter(first))
+        frame_two = await anext(aiter(second))
+
+    assert frame_one == format_sse(air.P("Hello"))
+    assert frame_one is frame_two
+
+
+@pytest.mark.asyncio
+async def test_publish_renders_once() -> None:
+    hub = air.Broadcast()
+    renders = 0
+
+    class CountingTag(air.P):
+        def __str__(self) -> str:
+            nonlocal renders
+            renders += 1
+            return super().__str__()
+
+    async with hub.subscribe(), hub.subscribe(), hub.subscribe():
+        await hub.publish(CountingTag("x"))
+
+    assert renders == 1
+
+
+@pytest.mark.asyncio
+async def test_publish_sse_event_and_bytes() -> None:
+    hub = air.Broadcast(event="update")
+
+    async with hub.subscribe() as subscriber:
+        await hub.publish(air.SSEEvent("a", id="1"))
+        await hub.publish("b")
+        await hub.publish(b": raw\n\n")
+        frames = [await anext(aiter(subscriber)) for _ in range(3)]
+
+    assert frames == [b"event: update\nid: 1\ndata: a\n\n", b"event: update\ndata: b\n\n", b": raw\n\n"]
+
+
+@pytest.mark.asyncio
+async def test_channels_are_isolated() -> None:
+    hub = air.SSEHub()
+
+    async with hub.subscribe("a") as on_a, hub.subscribe("b") as on_b:
+        await hub.publish("for a", channel="a")
+
+        assert on_a.lag == 1
+        assert on_b.lag == 0
+
+
+@pytest.mark.asyncio
+async def test_subscriber_count_tracks_subscriptions() -> None:
+    hub = air.Broadcast()
+
+    async with hub.subscribe("a"), hub.subscribe("a"), hub.subscribe("b"):
+        assert hub.subscriber_count("a") == 2
+        assert hub.subscriber_count("b") == 1
+        assert hub.subscriber_count() == 3
+
+    assert hub.subscriber_count() == 0
+    assert hub.stats().channels == 0
+
+
+@pytest.mark.asyncio
+async def test_drop_policy_keeps_slow_subscriber() -> None:
+    hub = air.Broadcast(max_queue=2)
+
+    async with hub.subscribe() as subscriber:
+        for i in range(5):
+            await hub.publish(str(i))
+
+        assert subscriber.dropped == 3
+        assert hub.stats() == BroadcastStats(
+            channels=1, subscribers=1, published=5, dropped=3, disconnected=0, max_lag=2
+        )
+
+
+@pytest.mark.asyncio
+async def test_close_policy_disconnects_slow_subscriber() -> None:
+    hub = air.Broadcast(max_queue=1, overflow="close")
+
+    async with hub.subscribe() as subscriber:
+        await hub.publish("kept")
+        await hub.publish("overflow")
+
+        assert hub.subscriber_count() == 0
+        assert [frame async for frame in subscriber] == [format_sse("kept")]
+        assert hub.stats().disconnected == 1
+
+
+@pytest.mark.asyncio
+async def test_custom_backend_receives_encoded_frames() -> None:
+    class RecordingBackend(MemoryBackend):
+        def __init__(self) -> None:
+            super().__init__()
+            self.sent: list[tuple[str, bytes]] = []
+
+        def attach(self, deliver: Callable[[str, bytes], None]) -> None:
+            self.sent.clear()
+            super().attach(deliver)
+
+        async def publish(self, channel: str, frame: bytes) -> None:
+            self.sent.append((channel, frame))
+            await super().publish(channel, frame)
+
+    backend = RecordingBackend()
+    hub = air.Broadcast(backend=backend)
+
+    async with hub.subscribe("news") as subscriber:
+        await hub.publish("hi", channel="news")
+        assert await anext(aiter(subscriber)) == format_sse("hi")
+
+    assert backend.sent == [("news", format_sse("hi"))]
+
+
+@pytest.mark.asyncio
+async def test_response_streams_published_events() -> None:
+    hub = air.Broadcast()
+    bodies: list[bytes] = []
+    received_both = anyio.Event()
+
+    async def receive() -> dict[str, Any]:
+        await anyio.sleep_forever()
+        return {}
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.body" and message["body"]:
+            bodies.append(message["body"])
+            if b"".join(bodies).count(b"\n\n") == 2:
+                received_both.set()
+
+    scope = {"type": "http", "asgi": {"spec_version": "2.4"}}
+    async with anyio.create_task_group() as task_group:
+        task_group.start_soon(hub.response("live"), scope, receive, send)
+        await anyio.wait_all_tasks_blocked()
+        assert hub.subscriber_count("live") == 1
+        await hub.publish(air.Li("one"), channel="live")
+        await hub.publish(air.Li("two"), channel="live")
+        with anyio.fail_after(1):
+            await received_both.wait()
+        task_group.cancel_scope.cancel()
+
+    assert b"".join(bodies) == format_sse(air.Li("one")) + format_sse(air.Li("two"))
+    assert hub.subscriber_count() == 0
+
+
+def test_broadcast_rejects_empty_queue() -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        air.Broadcast(max_queue=0)
@@ -0,0 +1,441 @@
+import os
+import time
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import anyio
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from starlette.responses import StreamingResponse
+
+import air
+from air import cache
+from air.cache import CachedPage, DiskCacheBackend, MemoryCacheBackend, PageCacheMiddleware
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(cache, "time", fake)
+    return fake
+
+
+def _cached_app(**middleware_kwargs: object) -> tuple[air.Air, list[str]]:
+    app = air.Air()
+    renders: list[str] = []
+
+    @app.page(cache_ttl=60)
+    def catalog(request: air.Request) -> air.Html | air.Children:
+        renders.append("catalog")
+        return air.layouts.mvpcss(air.H1(f"Catalog {len(renders)}"), is_htmx=request.htmx.is_hx_request)
+
+    @app.page
+    def uncached() -> air.P:
+        renders.append("uncached")
+        return air.P(f"Uncached {len(renders)}")
+
+    app.add_middleware(PageCacheMiddleware, **middleware_kwargs)
+    return app, renders
+
+
+def test_route_opt_in_is_cached() -> None:
+    app, renders = _cached_app()
+    client = TestClient(app)
+
+    first = client.get("/catalog")
+    second = client.get("/catalog")
+
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert second.headers["age"] == "0"
+    assert second.text == first.text
+    assert renders == ["catalog"]
+
+
+def test_routes_without_ttl_are_not_cached() -> None:
+    app, renders = _cached_app()
+    client = TestClient(app)
+
+    client.get("/uncached")
+    response = client.get("/uncached")
+
+    assert "x-cache" not in response.headers
+    assert renders == ["uncached", "uncached"]
+
+
+def test_default_ttl_and_route_opt_out() -> None:
+    app = air.Air()
+    renders: list[str] = []
+
+    @app.page
+    def index() -> air.P:
+        renders.append("index")
+        return air.P("Home")
+
+    @app.page(cache_ttl=0)
+    def live() -> air.P:
+        renders.append("live")
+        return air.P("Live")
+
+    app.add_middleware(PageCacheMiddleware, ttl=30)
+    client = TestClient(app)
+    for _ in range(2):
+        client.get("/")
+        client.get("/live")
+
+    assert renders == ["index", "live", "live"]
+
+
+def test_htmx_headers_are_part_of_the_key() -> None:
+    app, renders = _cached_app()
+    client = TestClient(app)
+
+    full = client.get("/catalog")
+    fragment = client.get("/catalog", headers={"HX-Request": "true"})
+    fragment_again = client.get("/catalog", headers={"HX-Request": "true"})
+    other_target = client.get("/catalog", headers={"HX-Request": "true", "HX-Target": "main"})
+
+    assert full.text.startswith("<!doctype html>")
+    assert not fragment.text.startswith("<!doctype html>")
+    assert fragment_again.headers["x-cache"] == "HIT"
+    assert fragment_again.text == fragment.text
+    assert other_target.headers["x-cache"] == "MISS"
+    assert len(renders) == 3
+    assert {value.strip() for value in full.headers["vary"].split(",")} >= {
+        "hx-request",
+        "hx-boosted",
+        "hx-target",
+        "hx-history-restore-request",
+    }
+
+
+def test_scheme_and_host_are_part_of_the_key() -> None:
+    app, renders = _cached_app()
+
+    first = TestClient(app, base_url="http://tenant-a.example").get("/catalog")
+    other_host = TestClient(app, base_url="http://tenant-b.example").get("/catalog")
+    other_scheme = TestClient(app, base_url="https://tenant-a.example").get("/catalog")
+    again = TestClient(app, base_url="http://tenant-a.example").get("/catalog")
+
+    assert [first.headers["x-cache"], other_host.headers["x-cache"], other_scheme.headers["x-cache"]] == ["MISS"] * 3
+    assert again.headers["x-cache"] == "HIT"
+    assert again.text == first.text
+    assert len(renders) == 3
+
+
+def test_query_string_is_part_of_the_key() -> None:
+    app, renders = _cached_app()
+    client = TestClient(app)
+
+    client.get("/catalog?page=1")
+    client.get("/catalog?page=2")
+    client.get("/catalog?page=1")
+
+    assert len(renders) == 2
+
+
+def test_credentialed_and_unsafe_requests_bypass_cache() -> None:
+    app, renders = _cached_app()
+    client = TestClient(app)
+
+    client.get("/catalog", headers={"Cookie": "session=1"})
+    client.get("/catalog", headers={"Authorization": "Bearer token"})
+    client.head("/catalog")
+    client.get("/catalog")
+
+    assert len(renders) == 4
+
+
+def test_uncacheable_responses_are_not_stored() -> None:
+    app = air.Air()
+    renders: list[str] = []
+
+    @app.get("/private", cache_ttl=60)
+    def private() -> air.AirResponse:
+        renders.append("private")
+        return air.AirResponse("Private", headers={"Cache-Control": "private, max-age=0"})
+
+    @app.get("/cookie", cache_ttl=60)
+    def cookie() -> air.AirResponse:
+        renders.append("cookie")
+        response = air.AirResponse("Cookie")
+        response.set_cookie("seen", "1")
+        return response
+
+    @app.get("/missing", cache_ttl=60)
+    def missing() -> air.AirResponse:
+        renders.append("missing")
+        return air.AirResponse("Missing", status_code=404)
+
+    async def events() -> AsyncGenerator[str]:
+        yield "tick"
+
+    @app.get("/events", cache_ttl=60)
+    def stream() -> air.SSEResponse:
+        renders.append("events")
+        return air.SSEResponse(events())
+
+    app.add_middleware(PageCacheMiddleware)
+    client = TestClient(app)
+    for _ in range(2):
+        for path in ("/private", "/cookie", "/missing", "/events"):
+            client.get(path)
+
+    assert sorted(renders) == sorted(["private", "cookie", "missing", "events"] * 2)
+
+
+def test_custom_cacheable_predicate() -> None:
+    app, renders = _cached_app(cacheable=lambda scope: True)
+    client = TestClient(app)
+
+    client.get("/catalog", headers={"Cookie": "session=1"})
+    client.get("/catalog", headers={"Cookie": "session=1"})
+
+    assert renders == ["catalog"]
+
+
+def test_expired_page_is_rendered_again(clock: FakeClock) -> None:
+    app, renders = _cached_app()
+    client = TestClient(app)
+
+    client.get("/catalog")
+    clock.now += 59
+    assert client.get("/catalog").headers["age"] == "59"
+    clock.now += 2
+    response = client.get("/catalog")
+
+    assert response.headers["x-cache"] == "MISS"
+    assert len(renders) == 2
+
+
+def test_stale_while_revalidate(clock: FakeClock) -> None:
+    app = air.Air()
+    renders: list[int] = []
+
+    @app.page(cache_ttl=10, stale_while_revalidate=30)
+    def news() -> air.P:
+        renders.append(len(renders) + 1)
+        return air.P(f"News {len(renders)}")
+
+    app.add_middleware(PageCacheMiddleware)
+    client = TestClient(app)
+
+    client.get("/news")
+    clock.now += 15
+    stale = client.get("/news")
+    refreshed = client.get("/news")
+    clock.now += 100
+    expired = client.get("/news")
+
+    assert stale.headers["x-cache"] == "STALE"
+    assert stale.text == "<p>News 1</p>"
+    assert refreshed.headers["x-cache"] == "HIT"
+    assert refreshed.text == "<p>News 2</p>"
+    assert expired.headers["x-cache"] == "MISS"
+    assert renders == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+def _streaming_app(**middleware_kwargs: object) -> tuple[air.Air, list[str]]:
+    app = air.Air()
+    renders: list[str] = []
+
+    async def chunks() -> AsyncGenerator[str]:
+        yield "<p>one</p>"
+        yield "<p>two</p>"
+
+    @app.get("/stream", cache_ttl=60)
+    def stream() -> StreamingResponse:
+        renders.append("stream")
+        return StreamingResponse(chunks(), media_type="text/html")
+
+    app.add_middleware(PageCacheMiddleware, **middleware_kwargs)
+    return app, renders
+
+
+def test_streamed_responses_are_not_cached_by_default() -> None:
+    app, renders = _streaming_app()
+    client = TestClient(app)
+
+    responses = [client.get("/stream") for _ in range(2)]
+
+    assert [response.text for response in responses] == ["<p>one</p><p>two</p>"] * 2
+    assert "x-cache" not in responses[1].headers
+    assert renders == ["stream", "stream"]
+
+
+def test_streamed_responses_cached_when_opted_in() -> None:
+    app, renders = _streaming_app(cache_streaming=True)
+    client = TestClient(app)
+
+    client.get("/stream")
+    response = client.get("/stream")
+
+    assert response.headers["x-cache"] == "HIT"
+    assert response.text == "<p>one</p><p>two</p>"
+    assert renders == ["stream"]
+
+
+async def test_concurrent_misses_render_once() -> None:
+    app = air.Air()
+    renders = 0
+
+    @app.page(cache_ttl=60)
+    async def slow() -> air.P:
+        nonlocal renders
+        renders += 1
+        await anyio.sleep(0.05)
+        return air.P("Slow")
+
+    app.add_middleware(PageCacheMiddleware)
+    responses: list[httpx.Response] = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+
+        async def fetch() -> None:
+            responses.append(await client.get("/slow"))
+
+        async with anyio.create_task_group() as task_group:
+            for _ in range(10):
+                task_group.start_soon(fetch)
+
+    assert renders == 1
+    assert {response.text for response in responses} == {"<p>Slow</p>"}
+    assert sorted(response.headers["x-cache"] for response in responses) == ["HIT"] * 9 + ["MISS"]
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_evicts_least_recently_used() -> None:
+    backend = MemoryCacheBackend(max_entries=2)
+    page = CachedPage(status=200, headers=[], body=b"x", created=0, ttl=1)
+
+    await backend.set("a", page)
+    await backend.set("b", page)
+    await backend.get("a")
+    await backend.set("c", page)
+
+    assert await backend.get("a") is page
+    assert await backend.get("b") is None
+    assert len(backend) == 2
+    await backend.delete("a")
+    await backend.clear()
+    assert len(backend) == 0
+
+
+@pytest.mark.asyncio
+async def test_disk_backend_round_trip(tmp_path: Path) -> None:
+    backend = DiskCacheBackend(tmp_path / "pages")
+    page = CachedPage(
+        status=200,
+        headers=[(b"content-type", b"text/html; charset=utf-8")],
+        body=b"<p>caf\xc3\xa9\n</p>",
+        created=time.time(),
+        ttl=10.0,
+        stale_while_revalidate=2.0,
+    )
+
+    await backend.set("/a?#", page)
+
+    assert await backend.get("/a?#") == page
+    assert await backend.get("/missing?#") is None
+    await backend.delete("/a?#")
+    assert await backend.get("/a?#") is None
+
+
+def test_disk_backend_ignores_corrupt_files_and_clears(tmp_path: Path) -> None:
+    backend = DiskCacheBackend(tmp_path)
+    page = CachedPage(status=200, headers=[], body=b"", created=0, ttl=1)
+    anyio.run(backend.set, "key", page)
+    next(tmp_path.glob("*.page")).write_bytes(b"not json\n")
+
+    assert anyio.run(backend.get, "key") is None
+
+    anyio.run(backend.set, "key", page)
+    anyio.run(backend.clear)
+    assert list(tmp_path.glob("*.page")) == []
+
+
+def test_disk_backend_deletes_expired_page_on_read(tmp_path: Path) -> None:
+    backend = DiskCacheBackend(tmp_path)
+    anyio.run(backend.set, "old", CachedPage(status=200, headers=[], body=b"", created=time.time() - 100, ttl=10))
+    anyio.run(backend.set, "new", CachedPage(status=200, headers=[], body=b"", created=time.time(), ttl=10))
+
+    assert anyio.run(backend.get, "old") is None
+    assert anyio.run(backend.get, "new") is not None
+    assert len(list(tmp_path.glob("*.page"))) == 1
+
+
+def test_disk_backend_evicts_least_recently_used(tmp_path: Path) -> None:
+    backend = DiskCacheBackend(tmp_path, max_entries=10)
+    now = time.time()
+    for n in range(10):
+        anyio.run(backend.set, str(n), CachedPage(status=200, headers=[], body=b"x", created=now, ttl=60))
+        os.utime(backend._path(str(n)), (now - 20 + n, now - 20 + n))
+    assert anyio.run(backend.get, "0") is not None
+
+    anyio.run(backend.set, "new", CachedPage(status=200, headers=[], body=b"x", created=now, ttl=60))
+
+    # Over the limit: evicted down to 90%, least recently used first
+    assert len(list(tmp_path.glob("*.page"))) == 9
+    assert anyio.run(backend.get, "1") is None
+    assert anyio.run(backend.get, "2") is None
+    assert anyio.run(backend.get, "0") is not None
+    assert anyio.run(backend.get, "new") is not None
+
+
+def test_disk_backend_scans_only_when_over_its_limits(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    backend = DiskCacheBackend(tmp_path, max_entries=10)
+    page = CachedPage(status=200, headers=[], body=b"x", created=time.time(), ttl=60)
+    scans = 0
+    scandir = os.scandir
+
+    def counting_scandir(path: Path) -> object:
+        nonlocal scans
+        scans += 1
+        return scandir(path)
+
+    monkeypatch.setattr(cache.os, "scandir", counting_scandir)
+    for n in range(10):
+        anyio.run(backend.set, str(n), page)
+    anyio.run(backend.set, "0", page)
+    anyio.run(backend.delete, "1")
+    anyio.run(backend.set, "10", page)
+    assert scans == 1
+
+    anyio.run(backend.set, "11", page)
+    assert scans == 2
+    assert len(list(tmp_path.glob("*.page"))) == 9
+
+
+def test_disk_backend_max_bytes(tmp_path: Path) -> None:
+    backend = DiskCacheBackend(tmp_path, max_entries=None, max_bytes=3000)
+    now = time.time()
+    for n in range(5):
+        anyio.run(backend.set, str(n), CachedPage(status=200, headers=[], body=b"x" * 1000, created=now, ttl=60))
+        os.utime(backend._path(str(n)), (now - 10 + n, now - 10 + n))
+
+    assert sum(path.stat().st_size for path in tmp_path.glob("*.page")) <= 3000
+    assert anyio.run(backend.get, "4") is not None
+    assert anyio.run(backend.get, "0") is None
+
+
+def test_middleware_with_disk_backend(tmp_path: Path) -> None:
+    app, renders = _cached_app(backend=DiskCacheBackend(tmp_path))
+    client = TestClient(app)
+
+    first = client.get("/catalog")
+    second = client.get("/catalog")
+
+    assert second.headers["x-cache"] == "HIT"
+    assert second.text == first.text
+    assert second.headers["content-type"] == "text/html; charset=utf-8"
+    assert renders == ["catalog"]
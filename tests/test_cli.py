@@ -1,10 +1,12 @@
 """Tests for the Air CLI."""
 
 import re
+from pathlib import Path
 
 from typer.testing import CliRunner
 
 from air.cli import app
+from air.templating import compiled_environment
 
 runner = CliRunner()
 
@@ -45,3 +47,44 @@ def test_cli_run_help() -> None:
     assert "--host" in output
     assert "--port" in output
     assert "--reload" in output
+
+
+def test_cli_templates_compile_zip(tmp_path: Path) -> None:
+    templates = tmp_path / "templates"
+    (templates / "partials").mkdir(parents=True)
+    (templates / "home.html").write_text("<h1>{{ title }}</h1>")
+    (templates / "partials" / "nav.html").write_text("<nav></nav>")
+
+    result = runner.invoke(app, ["templates", "compile", str(templates)], color=False)
+
+    assert result.exit_code == 0
+    assert "Compiled 2 templates" in strip_ansi(result.output)
+    env = compiled_environment(tmp_path / "templates.zip")
+    assert env.get_template("home.html").render(title="<Hi>") == "<h1>&lt;Hi&gt;</h1>"
+    assert env.get_template("partials/nav.html").render() == "<nav></nav>"
+
+
+def test_cli_templates_compile_directory(tmp_path: Path) -> None:
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "home.html").write_text("{{ 1 + 1 }}")
+    output = tmp_path / "out"
+
+    result = runner.invoke(app, ["templates", "compile", str(templates), "--no-zip", "--output", str(output)])
+
+    assert result.exit_code == 0
+    assert "Compiled 1 template " in strip_ansi(result.output)
+    assert compiled_environment(output).get_template("home.html").render() == "2"
+
+
+def test_cli_templates_compile_errors(tmp_path: Path) -> None:
+    missing = runner.invoke(app, ["templates", "compile", str(tmp_path / "missing")], color=False)
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "broken.html").write_text("{% if %}")
+    broken = runner.invoke(app, ["templates", "compile", str(templates)], color=False)
+
+    assert missing.exit_code == 1
+    assert "Template directory not found" in strip_ansi(missing.output)
+    assert broken.exit_code == 1
+    assert "Could not compile templates" in strip_ansi(broken.output)
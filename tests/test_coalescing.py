@@ -0,0 +1,260 @@
+import threading
+import time
+
+import anyio
+import httpx
+import pytest
+from starlette.background import BackgroundTask
+
+import air
+from air.coalescing import SingleFlight
+
+
+async def _fetch_concurrently(app: air.Air, requests: list[tuple[str, dict[str, str]]]) -> list[httpx.Response]:
+    responses: list[httpx.Response] = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+
+        async def fetch(path: str, headers: dict[str, str]) -> None:
+            responses.append(await client.get(path, headers=headers))
+
+        async with anyio.create_task_group() as task_group:
+            for path, headers in requests:
+                task_group.start_soon(fetch, path, headers)
+    return responses
+
+
+@pytest.mark.asyncio
+async def test_singleflight_option_coalesces_async_handler() -> None:
+    app = air.Air()
+    calls = 0
+
+    @app.get("/popular", singleflight=True)
+    async def popular() -> air.P:
+        nonlocal calls
+        calls += 1
+        await anyio.sleep(0.05)
+        return air.P("Popular")
+
+    responses = await _fetch_concurrently(app, [("/popular", {})] * 20)
+
+    assert calls == 1
+    assert {response.text for response in responses} == {"<p>Popular</p>"}
+    assert {response.headers["content-length"] for response in responses} == {"14"}
+
+
+@pytest.mark.asyncio
+async def test_singleflight_decorator_coalesces_sync_handler() -> None:
+    app = air.Air()
+    calls = 0
+    lock = threading.Lock()
+
+    @app.page
+    @air.singleflight
+    def report() -> air.P:
+        nonlocal calls
+        with lock:
+            calls += 1
+        time.sleep(0.05)
+        return air.P("Report")
+
+    responses = await _fetch_concurrently(app, [("/report", {})] * 10)
+
+    assert calls == 1
+    assert {response.text for response in responses} == {"<p>Report</p>"}
+
+
+@pytest.mark.asyncio
+async def test_singleflight_keys_on_query_and_vary_headers() -> None:
+    app = air.Air()
+    calls: list[str] = []
+
+    @app.get("/items")
+    @air.singleflight(vary=["Accept-Language"])
+    async def items(request: air.Request) -> air.P:
+        calls.append(f"{request.url.query}|{request.headers.get('accept-language')}")
+        await anyio.sleep(0.05)
+        return air.P(request.headers.get("accept-language", ""))
+
+    responses = await _fetch_concurrently(
+        app,
+        [
+            ("/items?page=1", {"Accept-Language": "en"}),
+            ("/items?page=1", {"Accept-Language": "en"}),
+            ("/items?page=1", {"Accept-Language": "fr"}),
+            ("/items?page=2", {"Accept-Language": "en"}),
+        ],
+    )
+
+    assert sorted(calls) == ["page=1|en", "page=1|fr", "page=2|en"]
+    assert sorted(response.text for response in responses) == ["<p>en</p>"] * 3 + ["<p>fr</p>"]
+
+
+@pytest.mark.asyncio
+async def test_singleflight_never_shares_between_users() -> None:
+    app = air.Air()
+    calls: list[str] = []
+
+    @app.get("/me", singleflight=True)
+    async def me(request: air.Request) -> air.P:
+        user = request.cookies.get("session") or request.headers.get("authorization", "anonymous")
+        calls.append(user)
+        await anyio.sleep(0.05)
+        return air.P(f"Hello {user}")
+
+    responses = await _fetch_concurrently(
+        app,
+        [
+            ("/me", {"Cookie": "session=alice"}),
+            ("/me", {"Cookie": "session=bob"}),
+            ("/me", {"Cookie": "session=alice"}),
+            ("/me", {"Authorization": "Bearer carol"}),
+        ],
+    )
+
+    assert sorted(calls) == ["Bearer carol", "alice", "bob"]
+    assert sorted(response.text for response in responses) == [
+        "<p>Hello Bearer carol</p>",
+        "<p>Hello alice</p>",
+        "<p>Hello alice</p>",
+        "<p>Hello bob</p>",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_singleflight_never_shares_between_hosts() -> None:
+    app = air.Air()
+    calls: list[str] = []
+
+    @app.get("/home", singleflight=True)
+    async def home(request: air.Request) -> air.P:
+        calls.append(request.url.netloc)
+        await anyio.sleep(0.05)
+        return air.P(request.url.netloc)
+
+    responses = await _fetch_concurrently(
+        app,
+        [("/home", {"Host": "tenant-a.example"}), ("/home", {"Host": "tenant-b.example"})] * 2,
+    )
+
+    assert sorted(calls) == ["tenant-a.example", "tenant-b.example"]
+    assert (
+        sorted(response.text for response in responses)
+        == ["<p>tenant-a.example</p>"] * 2 + ["<p>tenant-b.example</p>"] * 2
+    )
+
+
+@pytest.mark.asyncio
+async def test_singleflight_route_option_accepts_vary_headers() -> None:
+    app = air.Air()
+    calls = 0
+
+    @app.get("/news", singleflight=["Accept-Language"])
+    async def news(request: air.Request) -> air.P:
+        nonlocal calls
+        calls += 1
+        await anyio.sleep(0.05)
+        return air.P(request.headers.get("accept-language", ""))
+
+    responses = await _fetch_concurrently(
+        app,
+        [
+            ("/news", {"Accept-Language": "en", "Cookie": "session=alice"}),
+            ("/news", {"Accept-Language": "en", "Cookie": "session=bob"}),
+            ("/news", {"Accept-Language": "fr"}),
+        ],
+    )
+
+    assert calls == 2
+    assert sorted(response.text for response in responses) == ["<p>en</p>", "<p>en</p>", "<p>fr</p>"]
+
+
+@pytest.mark.asyncio
+async def test_singleflight_runs_background_tasks_once() -> None:
+    app = air.Air()
+    tasks: list[str] = []
+
+    @app.get("/with-task", singleflight=True)
+    async def with_task() -> air.AirResponse:
+        await anyio.sleep(0.05)
+        return air.AirResponse("ok", background=BackgroundTask(tasks.append, "ran"))
+
+    responses = await _fetch_concurrently(app, [("/with-task", {})] * 5)
+
+    assert {response.text for response in responses} == {"ok"}
+    assert tasks == ["ran"]
+
+
+@pytest.mark.asyncio
+async def test_singleflight_does_not_share_cookies_or_failures() -> None:
+    app = air.Air()
+    calls = {"cookie": 0, "failing": 0}
+
+    @app.get("/cookie", singleflight=True)
+    async def cookie() -> air.AirResponse:
+        calls["cookie"] += 1
+        session = str(calls["cookie"])
+        await anyio.sleep(0.05)
+        response = air.AirResponse("cookie")
+        response.set_cookie("session", session)
+        return response
+
+    @app.get("/failing", singleflight=True)
+    async def failing() -> air.P:
+        calls["failing"] += 1
+        await anyio.sleep(0.05)
+        if calls["failing"] == 1:
+            raise air.HTTPException(status_code=503)
+        return air.P("Recovered")
+
+    cookie_responses = await _fetch_concurrently(app, [("/cookie", {})] * 3)
+    failing_responses = await _fetch_concurrently(app, [("/failing", {})] * 3)
+
+    assert calls["cookie"] == 3
+    assert len({response.headers["set-cookie"] for response in cookie_responses}) == 3
+    assert sorted(response.status_code for response in failing_responses) == [200, 200, 503]
+
+
+@pytest.mark.asyncio
+async def test_singleflight_ignores_unsafe_methods() -> None:
+    app = air.Air()
+    calls = 0
+
+    @app.post("/submit", singleflight=True)
+    async def submit() -> air.P:
+        nonlocal calls
+        calls += 1
+        await anyio.sleep(0.01)
+        return air.P("ok")
+
+    transport = httpx.ASGITransport(app=app)
+    async with (
+        httpx.AsyncClient(transport=transport, base_url="http://testserver") as client,
+        anyio.create_task_group() as task_group,
+    ):
+        for _ in range(3):
+            task_group.start_soon(client.post, "/submit")
+
+    assert calls == 3
+
+
+def test_singleflight_state_is_cleared() -> None:
+    flight = SingleFlight()
+    app = air.Air()
+
+    @app.page(singleflight=True)
+    def index() -> air.P:
+        return air.P("Home")
+
+    route = next(route for route in app.routes if getattr(route, "path", None) == "/")
+
+    assert isinstance(route.endpoint.singleflight, SingleFlight)
+    assert route.endpoint.singleflight.in_flight == 0
+    assert flight.vary == (
+        "hx-request",
+        "hx-boosted",
+        "hx-target",
+        "hx-history-restore-request",
+        "cookie",
+        "authorization",
+    )
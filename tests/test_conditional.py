@@ -0,0 +1,236 @@
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+import air
+from air.conditional import body_etag, etag_matches, http_date, not_modified_since, quote_etag
+
+
+def test_body_etag_is_stable_and_quoted() -> None:
+    assert body_etag(b"<h1>Hi</h1>") == body_etag(b"<h1>Hi</h1>")
+    assert body_etag(b"<h1>Hi</h1>") != body_etag(b"<h1>Bye</h1>")
+    assert body_etag(b"").startswith('"')
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("v1", '"v1"'), ('"v1"', '"v1"'), ('W/"v1"', 'W/"v1"')],
+)
+def test_quote_etag(value: str, expected: str) -> None:
+    assert quote_etag(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("if_none_match", "etag", "expected"),
+    [
+        ('"a"', '"a"', True),
+        ('"b", "a"', '"a"', True),
+        ('W/"a"', '"a"', True),
+        ('"a"', 'W/"a"', True),
+        ("*", '"a"', True),
+        ('"b"', '"a"', False),
+    ],
+)
+def test_etag_matches(if_none_match: str, etag: str, *, expected: bool) -> None:
+    assert etag_matches(if_none_match, etag) is expected
+
+
+def test_http_date_and_not_modified_since() -> None:
+    moment = datetime(2024, 1, 2, 3, 4, 5, 678, tzinfo=UTC)
+
+    assert http_date(moment) == "Tue, 02 Jan 2024 03:04:05 GMT"
+    assert http_date(moment.replace(tzinfo=None)) == "Tue, 02 Jan 2024 03:04:05 GMT"
+    assert not_modified_since("Tue, 02 Jan 2024 03:04:05 GMT", moment)
+    assert not not_modified_since("Tue, 02 Jan 2024 03:04:04 GMT", moment)
+    assert not not_modified_since("not a date", moment)
+
+
+@pytest.mark.parametrize(
+    ("if_modified_since", "expected"),
+    [
+        ("Tue Jan  2 03:04:05 2024", True),
+        ("Tue Jan  2 03:04:04 2024", False),
+        ("Tue, 02 Jan 2024 03:04:05 -0000", True),
+        ("Tue, 02 Jan 2024 03:04:04 -0000", False),
+        ("Tue, 02 Jan 99999 03:04:05 GMT", False),
+    ],
+)
+def test_not_modified_since_zoneless_dates_are_utc(if_modified_since: str, *, expected: bool) -> None:
+    moment = datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)
+
+    assert not_modified_since(if_modified_since, moment) is expected
+
+
+def test_etag_true_hashes_rendered_body() -> None:
+    app = air.Air()
+    renders = 0
+
+    @app.page(etag=True)
+    def index() -> air.H1:
+        nonlocal renders
+        renders += 1
+        return air.H1("Catalog")
+
+    client = TestClient(app)
+    first = client.get("/")
+    etag = first.headers["etag"]
+    second = client.get("/", headers={"If-None-Match": etag})
+    changed = client.get("/", headers={"If-None-Match": '"stale"'})
+
+    assert first.status_code == 200
+    assert etag == body_etag(b"<h1>Catalog</h1>")
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+    assert changed.status_code == 200
+    assert changed.text == "<h1>Catalog</h1>"
+    assert renders == 3
+
+
+def test_etag_function_skips_rendering_when_unchanged() -> None:
+    app = air.Air()
+    version = "v1"
+    renders = 0
+
+    @app.get("/catalog", etag=lambda request: version)
+    def catalog() -> air.Main:
+        nonlocal renders
+        renders += 1
+        return air.Main(air.P(version))
+
+    client = TestClient(app)
+    first = client.get("/catalog")
+    cached = client.get("/catalog", headers={"If-None-Match": '"v1"'})
+    version = "v2"
+    updated = client.get("/catalog", headers={"If-None-Match": '"v1"'})
+
+    assert first.headers["etag"] == '"v1"'
+    assert cached.status_code == 304
+    assert updated.status_code == 200
+    assert updated.headers["etag"] == '"v2"'
+    assert renders == 2
+
+
+def test_async_etag_function_receives_air_request() -> None:
+    app = air.Air()
+    seen: list[type] = []
+
+    async def version(request: air.Request) -> str:
+        seen.append(type(request))
+        return f"user-{request.query_params.get('user', 'anon')}"
+
+    @app.page(etag=version)
+    def profile() -> air.P:
+        return air.P("Profile")
+
+    client = TestClient(app)
+    response = client.get("/profile?user=7", headers={"If-None-Match": '"user-7"'})
+
+    assert response.status_code == 304
+    assert seen == [air.AirRequest]
+
+
+def test_last_modified_function() -> None:
+    app = air.Air()
+    modified = datetime(2024, 5, 1, 12, 0, 0, tzinfo=UTC)
+
+    @app.page(last_modified=lambda request: modified)
+    def news() -> air.P:
+        return air.P("News")
+
+    client = TestClient(app)
+    first = client.get("/news")
+    cached = client.get("/news", headers={"If-Modified-Since": "Wed, 01 May 2024 12:00:00 GMT"})
+    stale = client.get("/news", headers={"If-Modified-Since": "Tue, 30 Apr 2024 12:00:00 GMT"})
+
+    assert first.headers["last-modified"] == "Wed, 01 May 2024 12:00:00 GMT"
+    assert cached.status_code == 304
+    assert cached.headers["last-modified"] == "Wed, 01 May 2024 12:00:00 GMT"
+    assert stale.status_code == 200
+
+
+def test_last_modified_accepts_asctime_and_ignores_garbage() -> None:
+    app = air.Air()
+
+    @app.page(last_modified=lambda request: datetime(2024, 5, 1, 12, 0, 0, tzinfo=UTC))
+    def news() -> air.P:
+        return air.P("News")
+
+    client = TestClient(app)
+
+    assert client.get("/news", headers={"If-Modified-Since": "Wed May  1 12:00:00 2024"}).status_code == 304
+    assert client.get("/news", headers={"If-Modified-Since": "Wed, 01 May 2024 12:00:00 -0000"}).status_code == 304
+    assert client.get("/news", headers={"If-Modified-Since": "yesterday"}).status_code == 200
+
+
+def test_if_none_match_takes_precedence_over_if_modified_since() -> None:
+    app = air.Air()
+
+    @app.page(etag=lambda request: "v2", last_modified=lambda request: datetime(2024, 1, 1, tzinfo=UTC))
+    def page() -> air.P:
+        return air.P("Page")
+
+    client = TestClient(app)
+    response = client.get(
+        "/page", headers={"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 01 May 2024 12:00:00 GMT"}
+    )
+
+    assert response.status_code == 200
+
+
+def test_conditional_get_ignores_errors_and_unsafe_methods() -> None:
+    app = air.Air()
+
+    @app.get("/missing", etag=True)
+    def missing() -> air.AirResponse:
+        return air.AirResponse("Missing", status_code=404)
+
+    @app.post("/submit", etag=lambda request: "v1")
+    def submit() -> air.P:
+        return air.P("Submitted")
+
+    client = TestClient(app)
+    missing_response = client.get("/missing", headers={"If-None-Match": "*"})
+    submit_response = client.post("/submit", headers={"If-None-Match": '"v1"'})
+
+    assert missing_response.status_code == 404
+    assert "etag" not in missing_response.headers
+    assert submit_response.status_code == 200
+    assert "etag" not in submit_response.headers
+
+
+def test_etag_true_keeps_handler_etag_and_skips_streams() -> None:
+    app = air.Air()
+
+    @app.get("/explicit", etag=True)
+    def explicit() -> air.AirResponse:
+        return air.AirResponse("Body", headers={"ETag": '"custom"'})
+
+    async def events() -> AsyncGenerator[str]:
+        yield "tick"
+
+    @app.get("/stream", etag=True)
+    def stream() -> air.SSEResponse:
+        return air.SSEResponse(events())
+
+    client = TestClient(app)
+
+    assert client.get("/explicit", headers={"If-None-Match": '"custom"'}).status_code == 304
+    assert "etag" not in client.get("/stream").headers
+
+
+def test_router_page_etag_and_head() -> None:
+    app = air.Air()
+    router = air.AirRouter()
+
+    @router.page(etag=lambda request: "v1")
+    def about() -> air.P:
+        return air.P("About")
+
+    app.include_router(router)
+    client = TestClient(app)
+
+    assert client.head("/about", headers={"If-None-Match": '"v1"'}).status_code == 304
+    assert about.url() == "/about"
@@ -19,6 +19,7 @@ from air.field import (
     Placeholder,
     PrimaryKey,
     ReadOnly,
+    RemoteChoices,
     Widget,
 )
 
@@ -108,6 +109,15 @@ class TestAirFieldProducesTypedMetadata:
         assert meta is not None
         assert meta.options == (("r", "Red"), ("g", "Green"))
 
+    def test_choices_url(self) -> None:
+        class M(BaseModel):
+            country: str = AirField(choices=[("fr", "France")], choices_url="/options/country")
+
+        meta = _get_meta(M, "country", RemoteChoices)
+        assert meta is not None
+        assert meta.url == "/options/country"
+        assert _get_meta(M, "country", Widget) is None
+
     def test_primary_key(self) -> None:
         class M(BaseModel):
             id: int = AirField(primary_key=True)
@@ -6,13 +6,19 @@ original default_form_widget didn't yet support.
 """
 
 import re
+from enum import Enum
+from pathlib import Path
 from typing import Annotated
+from unittest.mock import Mock
 
 import annotated_types
 import pytest
+from fastapi.testclient import TestClient
 from pydantic import BaseModel, Field
 from starlette.datastructures import FormData
+from starlette.responses import StreamingResponse
 
+from air import Air
 from air.field import AirField
 from air.form import (
     AirForm,
@@ -20,8 +26,10 @@ from air.form import (
     default_form_widget,
     errors_to_dict,
     get_user_error_message,
+    main as form_main,
     pydantic_type_to_html_type,
 )
+from air.form.csrf import CsrfSigner
 
 # ── Validation tests (from Air) ─────────────────────────────────────
 
@@ -538,6 +546,51 @@ def test_validate_unchecked_checkbox_is_false() -> None:
     assert form.data.accepted is False
 
 
+def test_validate_many_matches_validate() -> None:
+    """validate_many gives each row the same outcome validate() would."""
+
+    class GlazeBatchModel(BaseModel):
+        name: str
+        cone: int
+        food_safe: bool | None
+
+    class GlazeBatchForm(AirForm[GlazeBatchModel]):
+        pass
+
+    rows = [
+        {"name": "Celadon", "cone": "10", "food_safe": "on"},
+        {"name": "Shino", "cone": "ten"},
+        {"cone": "6"},
+        {"name": "Tenmoku", "cone": "9"},
+    ]
+
+    forms = GlazeBatchForm.validate_many(rows)
+
+    assert [form.is_valid for form in forms] == [True, False, False, True]
+    assert forms[0].data == GlazeBatchModel(name="Celadon", cone=10, food_safe=True)
+    assert forms[3].data.food_safe is False
+    for form, row in zip(forms, rows, strict=True):
+        single = GlazeBatchForm()
+        single.validate(row)
+        assert form.errors == single.errors
+        assert form.submitted_data == single.submitted_data
+    assert errors_to_dict(forms[1].errors)["cone"]["type"] == "int_parsing"
+
+
+def test_validate_many_all_valid() -> None:
+    class KilnLogModel(BaseModel):
+        kiln: str
+        hours: float
+
+    class KilnLogForm(AirForm[KilnLogModel]):
+        pass
+
+    forms = KilnLogForm.validate_many({"kiln": f"k{n}", "hours": str(n)} for n in range(3))
+
+    assert [form.data.hours for form in forms] == [0.0, 1.0, 2.0]
+    assert all(form.errors is None for form in forms)
+
+
 def test_validate_required_bool_unchecked_is_false() -> None:
     """Required bool with no default still validates; unchecked means False."""
 
@@ -720,6 +773,102 @@ def test_custom_widget_swap() -> None:
     assert 'name="csrf_token"' in html  # CSRF token still included
 
 
+def test_render_plan_compiled_with_form_subclass(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The per-model render plan is built when the form class is defined, not per render."""
+
+    class GlazeModel(BaseModel):
+        name: str = AirField(label="Glaze name", placeholder="Celadon")
+        cone: int
+
+    class GlazeForm(AirForm[GlazeModel]):
+        pass
+
+    monkeypatch.setattr(form_main, "_compile_field", Mock(side_effect=AssertionError("recompiled")))
+
+    html = default_form_widget(model=GlazeModel, data={"name": "Tenmoku", "cone": 6})
+    assert '<label for="name">Glaze name</label>' in html
+    assert 'placeholder="Celadon" value="Tenmoku">' in html
+    assert 'value="6">' in GlazeForm({"cone": 6}).render()
+
+
+def test_render_plan_follows_model_rebuild() -> None:
+    """A model rebuilt once its forward references resolve gets a fresh render plan."""
+
+    class KilnModel(BaseModel):
+        atmosphere: "Atmosphere"
+
+    class Atmosphere(Enum):
+        OXIDATION = "oxidation"
+        REDUCTION = "reduction"
+
+    assert "<select" not in default_form_widget(model=KilnModel)
+    KilnModel.model_rebuild(_types_namespace={"Atmosphere": Atmosphere})
+    assert '<option value="reduction">Reduction</option>' in default_form_widget(model=KilnModel)
+
+
+def test_large_select_marks_only_the_selected_option() -> None:
+    """Cached option HTML gets the current value patched in as selected."""
+    skus = [(f"sku-{n}", f"SKU #{n} <{n % 7}>") for n in range(5000)]
+
+    class OrderModel(BaseModel):
+        sku: str = AirField(choices=skus)
+
+    html = default_form_widget(model=OrderModel, data={"sku": "sku-4321"})
+
+    assert html.count("<option") == 5001
+    assert html.count(" selected") == 2  # the placeholder and the chosen SKU
+    assert '    <option value="sku-4321" selected>SKU #4321 &lt;2&gt;</option>' in html
+    assert default_form_widget(model=OrderModel, data={"sku": "sku-9999"}).count(" selected") == 1
+
+
+def test_remote_choices_render_search_input() -> None:
+    """Fields with choices_url render a search input and an empty datalist instead of options."""
+
+    class ShippingModel(BaseModel):
+        country: str = AirField(choices=[("fr", "France")], choices_url="/options/country")
+
+    html = default_form_widget(model=ShippingModel, data={"country": "fr"})
+
+    assert (
+        '  <input name="country" id="country" type="search" required list="country-options" autocomplete="off"'
+        ' hx-get="/options/country" hx-trigger="input changed delay:250ms, focus once"'
+        ' hx-target="#country-options" value="fr">'
+    ) in html
+    assert '  <datalist id="country-options"></datalist>' in html
+    assert "<option" not in html
+
+
+def test_options_response_streams_matching_options() -> None:
+    """options_response filters a field's options by value or label, case-insensitively."""
+
+    class ShippingModel(BaseModel):
+        country: str = AirField(
+            choices=[("fr", "France"), ("de", "Germany"), ("fi", "Finland"), ("ae", "Emirates & Co")],
+            choices_url="/options/country",
+        )
+
+    class ShippingForm(AirForm[ShippingModel]):
+        pass
+
+    app = Air()
+
+    @app.get("/options/country")
+    def country_options(country: str = "") -> StreamingResponse:
+        return ShippingForm.options_response("country", country, limit=2)
+
+    client = TestClient(app)
+
+    assert client.get("/options/country", params={"country": "F"}).text == (
+        '<option value="fr">France</option><option value="fi">Finland</option>'
+    )
+    assert client.get("/options/country", params={"country": "&"}).text == (
+        '<option value="ae">Emirates &amp; Co</option>'
+    )
+    assert not client.get("/options/country", params={"country": "zz"}).text
+    with pytest.raises(KeyError):
+        ShippingForm.options_response("province", "x")
+
+
 # ── Empty string vs. too-short error message tests (pottery/ceramics) ──
 
 
@@ -902,6 +1051,159 @@ def test_csrf_token_excluded_from_field_rendering() -> None:
     assert "Stone Type" in html
 
 
+def _rendered_token(html: str) -> str:
+    match = re.search(r'name="csrf_token" value="([^"]+)"', html)
+    assert match
+    return match.group(1)
+
+
+def test_csrf_token_is_packed_base64url() -> None:
+    """Tokens are 33 packed bytes, base64url encoded without padding."""
+    token = CsrfSigner("kiln").generate()
+    assert len(token) == 44
+    assert re.fullmatch(r"[A-Za-z0-9_-]+", token)
+
+
+def test_csrf_token_rejects_expired_and_foreign_tokens() -> None:
+    """Expired tokens and tokens signed with another secret fail."""
+    signer = CsrfSigner("kiln")
+    token = signer.generate()
+    assert signer.verify(token) == token
+    with pytest.raises(ValueError, match="expired"):
+        CsrfSigner("kiln", max_age=-1).verify(token)
+    with pytest.raises(ValueError, match="Invalid CSRF token"):
+        CsrfSigner("glaze").verify(token)
+    with pytest.raises(ValueError, match="Invalid CSRF token"):
+        signer.verify("!" * 44)
+
+
+def test_csrf_token_bound_to_session() -> None:
+    """A session-bound token only verifies for the same session."""
+
+    class BroochModel(BaseModel):
+        finish: str
+
+    class BroochForm(AirForm[BroochModel]):
+        pass
+
+    token = _rendered_token(BroochForm(csrf_session_id="maker-1").render())
+
+    form = BroochForm(csrf_session_id="maker-1")
+    form.render()
+    assert form.validate({"finish": "matte", "csrf_token": token})
+
+    form = BroochForm(csrf_session_id="maker-2")
+    form.render()
+    assert not form.validate({"finish": "matte", "csrf_token": token})
+    assert form.errors
+    assert form.errors[0]["msg"] == "Invalid CSRF token."
+
+
+def test_csrf_rotation_accepts_previous_key_during_grace() -> None:
+    """Tokens signed before rotate() verify until the grace window ends."""
+    signer = CsrfSigner("first")
+    token = signer.generate()
+    signer.rotate("second")
+    assert signer.verify(token) == token
+    assert signer.verify(signer.generate())
+
+    closed = CsrfSigner("first", grace=0)
+    token = closed.generate()
+    closed.rotate("second")
+    with pytest.raises(ValueError, match="Invalid CSRF token"):
+        closed.verify(token)
+
+
+def test_csrf_previous_secrets_from_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    """AIRFORM_SECRET signs; AIRFORM_SECRET_FALLBACKS lists retired secrets."""
+    monkeypatch.setenv("AIRFORM_SECRET", "new-secret")
+    monkeypatch.setenv("AIRFORM_SECRET_FALLBACKS", "old-secret,older-secret")
+    signer = CsrfSigner.from_environment()
+    old_token = CsrfSigner("old-secret").generate()
+    assert signer.verify(old_token) == old_token
+    with pytest.raises(ValueError, match="Invalid CSRF token"):
+        CsrfSigner("old-secret").verify(signer.generate())
+
+
+def test_csrf_secret_with_comma_is_used_whole(monkeypatch: pytest.MonkeyPatch) -> None:
+    """AIRFORM_SECRET isn't split, so a secret containing a comma keeps its meaning."""
+    monkeypatch.setenv("AIRFORM_SECRET", "glaze,kiln")
+    signer = CsrfSigner.from_environment()
+    token = CsrfSigner("glaze,kiln").generate()
+    assert signer.verify(token) == token
+    with pytest.raises(ValueError, match="Invalid CSRF token"):
+        signer.verify(CsrfSigner("kiln").generate())
+
+
+def test_csrf_default_secret_is_per_process(monkeypatch: pytest.MonkeyPatch) -> None:
+    """With neither variable set, each signer gets a random key and no file is written."""
+    monkeypatch.delenv("AIRFORM_SECRET", raising=False)
+    monkeypatch.delenv("AIRFORM_SECRET_FILE", raising=False)
+    key_file = Mock()
+    monkeypatch.setattr("air.form.csrf._shared_key_file_secret", key_file)
+    first = CsrfSigner.from_environment()
+    second = CsrfSigner.from_environment()
+    key_file.assert_not_called()
+    with pytest.raises(ValueError, match="Invalid CSRF token"):
+        second.verify(first.generate())
+
+
+def test_csrf_replay_cache_rejects_reuse() -> None:
+    """With replay_cache, each token is accepted once, within the LRU bound."""
+    signer = CsrfSigner("kiln", replay_cache=2)
+    first = signer.generate()
+    signer.verify(first)
+    with pytest.raises(ValueError, match="already been used"):
+        signer.verify(first)
+
+    for _ in range(2):
+        signer.verify(signer.generate())
+    # Evicted from the bounded cache
+    assert signer.verify(first) == first
+
+
+def test_csrf_replay_cache_on_form() -> None:
+    """A form class with a replay-protected signer rejects a resubmission."""
+
+    class BangleModel(BaseModel):
+        size: str
+
+    class BangleForm(AirForm[BangleModel]):
+        csrf_signer = CsrfSigner("kiln", replay_cache=100)
+
+    form = BangleForm()
+    token = _rendered_token(form.render())
+    assert form.validate({"size": "M", "csrf_token": token})
+    assert not form.validate({"size": "M", "csrf_token": token})
+    assert form.errors
+    assert "already been used" in form.errors[0]["msg"]
+
+
+def test_csrf_key_file_shared_between_workers(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """With AIRFORM_SECRET_FILE, signers on one host share a private key file."""
+    key_file = tmp_path / "csrf.key"
+    monkeypatch.delenv("AIRFORM_SECRET", raising=False)
+    monkeypatch.setenv("AIRFORM_SECRET_FILE", str(key_file))
+
+    token = CsrfSigner.from_environment().generate()
+    assert CsrfSigner.from_environment().verify(token) == token
+    assert key_file.stat().st_mode & 0o777 == 0o600
+
+
+def test_csrf_key_file_ignored_when_readable_by_others(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """A key file other users can read isn't trusted; the secret falls back to per-process."""
+    key_file = tmp_path / "csrf.key"
+    key_file.write_bytes(b"k" * 32)
+    key_file.chmod(0o644)
+    monkeypatch.delenv("AIRFORM_SECRET", raising=False)
+    monkeypatch.setenv("AIRFORM_SECRET_FILE", str(key_file))
+
+    with pytest.warns(RuntimeWarning, match="per-process"):
+        signer = CsrfSigner.from_environment()
+    with pytest.raises(ValueError, match="Invalid CSRF token"):
+        CsrfSigner(b"k" * 32).verify(signer.generate())
+
+
 # ── SafeHTML / __html__ protocol tests ───────────────────────────────
 
 
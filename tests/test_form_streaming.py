@@ -0,0 +1,305 @@
+"""Tests for streaming form submissions: air.form.streaming and AirForm.from_stream()."""
+
+import hashlib
+import re
+from pathlib import Path
+from typing import Any
+
+import anyio
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from starlette.requests import ClientDisconnect
+
+import air
+from air import AirForm
+from air.form.streaming import (
+    FileSink,
+    FormField,
+    HashSink,
+    UploadChunk,
+    UploadEnd,
+    UploadSink,
+    UploadStart,
+    stream_form,
+)
+
+BOUNDARY = "glaze-boundary"
+
+
+class GlazeModel(BaseModel):
+    name: str
+    firing_cone: int
+    photo: str
+    tags: list[str] = []
+
+
+class GlazeForm(AirForm[GlazeModel]):
+    pass
+
+
+def _csrf_token() -> str:
+    match = re.search(r'name="csrf_token" value="([^"]+)"', GlazeForm().render())
+    assert match
+    return match.group(1)
+
+
+def _multipart(*parts: tuple[str, str | bytes, str | None]) -> bytes:
+    """Encode (name, value, filename) parts in the given order."""
+    body = b""
+    for name, value, filename in parts:
+        disposition = f'form-data; name="{name}"' + (f'; filename="{filename}"' if filename else "")
+        content = value.encode() if isinstance(value, str) else value
+        body += f"--{BOUNDARY}\r\nContent-Disposition: {disposition}\r\n\r\n".encode() + content + b"\r\n"
+    return body + f"--{BOUNDARY}--\r\n".encode()
+
+
+class TileModel(BaseModel):
+    name: str
+    photo: Path
+
+
+class TileForm(AirForm[TileModel]):
+    pass
+
+
+def _client(form_class: type[AirForm] = GlazeForm, **stream_options: Any) -> tuple[TestClient, dict[str, Any]]:
+    app = air.Air()
+    seen: dict[str, Any] = {}
+
+    @app.post("/glazes")
+    async def upload(request: air.Request) -> air.P:
+        form = await form_class.from_stream(request, **stream_options)
+        seen["form"] = form
+        return air.P("ok" if form.is_valid else "invalid")
+
+    return TestClient(app), seen
+
+
+def _post(client: TestClient, body: bytes) -> Any:
+    return client.post("/glazes", content=body, headers={"content-type": f"multipart/form-data; boundary={BOUNDARY}"})
+
+
+class RecordingSink(HashSink):
+    aborted = False
+
+    async def abort(self) -> None:
+        self.aborted = True
+
+
+def test_stream_form_yields_fields_and_chunks_in_order() -> None:
+    app = air.Air()
+    events: list[object] = []
+
+    @app.post("/raw")
+    async def raw(request: air.Request) -> air.P:
+        events.extend([event async for event in stream_form(request)])
+        return air.P("ok")
+
+    body = _multipart(("name", "Celadon", None), ("photo", b"\x89PNG" * 10, "celadon.png"), ("name", "Again", None))
+    TestClient(app).post("/raw", content=body, headers={"content-type": f"multipart/form-data; boundary={BOUNDARY}"})
+
+    assert events[0] == FormField("name", "Celadon")
+    assert isinstance(events[1], UploadStart)
+    assert events[1].filename == "celadon.png"
+    assert b"".join(event.data for event in events if isinstance(event, UploadChunk)) == b"\x89PNG" * 10
+    assert events[-2] == UploadEnd("photo", 40)
+    assert events[-1] == FormField("name", "Again")
+
+
+def test_stream_form_urlencoded() -> None:
+    app = air.Air()
+    events: list[object] = []
+
+    @app.post("/raw")
+    async def raw(request: air.Request) -> air.P:
+        events.extend([event async for event in stream_form(request)])
+        return air.P("ok")
+
+    TestClient(app).post("/raw", data={"name": "Tenmoku", "firing_cone": "10"})
+
+    assert events == [FormField("name", "Tenmoku"), FormField("firing_cone", "10")]
+
+
+def test_from_stream_hashes_upload() -> None:
+    photo = b"glaze test tile" * 1000
+    client, seen = _client(uploads={"photo": lambda upload: HashSink()})
+
+    body = _multipart(
+        ("csrf_token", _csrf_token(), None),
+        ("name", "Shino", None),
+        ("firing_cone", "10", None),
+        ("tags", "matte", None),
+        ("tags", "carbon trap", None),
+        ("photo", photo, "shino.jpg"),
+    )
+    response = _post(client, body)
+
+    assert response.text == "<p>ok</p>"
+    form = seen["form"]
+    assert form.data.photo == hashlib.sha256(photo).hexdigest()
+    assert form.data.tags == ["matte", "carbon trap"]
+
+
+def test_from_stream_writes_upload_to_disk(tmp_path: Path) -> None:
+    destination = tmp_path / "tile.jpg"
+    client, seen = _client(TileForm, uploads={"photo": lambda upload: FileSink(destination)})
+
+    body = _multipart(
+        ("csrf_token", _csrf_token(), None),
+        ("name", "Ash", None),
+        ("photo", b"wood ash" * 5000, "tile.jpg"),
+    )
+    _post(client, body)
+
+    assert seen["form"].is_valid
+    assert seen["form"].data.photo == destination
+    assert destination.read_bytes() == b"wood ash" * 5000
+
+
+def test_from_stream_enforces_file_size_mid_stream(tmp_path: Path) -> None:
+    destination = tmp_path / "huge.jpg"
+    client, seen = _client(uploads={"photo": lambda upload: FileSink(destination)}, max_file_size=1000)
+
+    body = _multipart(
+        ("csrf_token", _csrf_token(), None),
+        ("name", "Oribe", None),
+        ("firing_cone", "6", None),
+        ("photo", b"x" * 5000, "huge.jpg"),
+    )
+    _post(client, body)
+
+    form = seen["form"]
+    assert not form.is_valid
+    assert form.errors[0]["loc"] == ("photo",)
+    assert form.errors[0]["type"] == "too_long"
+    assert not destination.exists()
+
+
+def test_from_stream_rejects_bad_field_before_upload() -> None:
+    sinks: list[UploadSink] = []
+    client, seen = _client(uploads={"photo": lambda upload: sinks.append(HashSink()) or sinks[-1]})
+
+    body = _multipart(
+        ("csrf_token", _csrf_token(), None),
+        ("name", "Copper red", None),
+        ("firing_cone", "hot", None),
+        ("photo", b"x" * 5000, "red.jpg"),
+    )
+    _post(client, body)
+
+    form = seen["form"]
+    assert not form.is_valid
+    assert form.errors[0]["loc"] == ("firing_cone",)
+    assert form.submitted_data == {"name": "Copper red", "firing_cone": "hot"}
+    assert sinks == []
+
+
+def test_from_stream_requires_csrf_before_files() -> None:
+    sinks: list[UploadSink] = []
+    client, seen = _client(uploads={"photo": lambda upload: sinks.append(HashSink()) or sinks[-1]})
+
+    body = _multipart(
+        ("name", "Temmoku", None),
+        ("firing_cone", "10", None),
+        ("photo", b"x" * 100, "t.jpg"),
+        ("csrf_token", _csrf_token(), None),
+    )
+    _post(client, body)
+
+    form = seen["form"]
+    assert not form.is_valid
+    assert form.errors[0]["loc"] == ("csrf_token",)
+    assert sinks == []
+
+
+def test_from_stream_rejects_missing_and_bad_csrf() -> None:
+    client, seen = _client()
+
+    _post(client, _multipart(("name", "Chun", None), ("firing_cone", "9", None), ("photo", "none", None)))
+    assert seen["form"].errors[0]["msg"] == "CSRF token is missing."
+
+    _post(client, _multipart(("csrf_token", "forged", None), ("name", "Chun", None)))
+    assert seen["form"].errors[0]["msg"] == "Invalid CSRF token."
+
+
+def test_from_stream_aborts_uploads_when_model_invalid() -> None:
+    sink = RecordingSink()
+    client, seen = _client(uploads={"photo": lambda upload: sink})
+
+    body = _multipart(("csrf_token", _csrf_token(), None), ("photo", b"x" * 100, "t.jpg"))
+    _post(client, body)
+
+    form = seen["form"]
+    assert not form.is_valid
+    assert {error["loc"][0] for error in form.errors} == {"name", "firing_cone"}
+    assert sink.aborted
+
+
+def _disconnecting_request(body: bytes, sent: int) -> air.Request:
+    """A request whose client goes away after the first ``sent`` bytes of ``body``."""
+    messages = [{"type": "http.request", "body": body[:sent], "more_body": True}, {"type": "http.disconnect"}]
+
+    async def receive() -> dict[str, Any]:
+        return messages.pop(0)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/glazes",
+        "headers": [(b"content-type", f"multipart/form-data; boundary={BOUNDARY}".encode())],
+    }
+    return air.Request(scope, receive)
+
+
+def test_from_stream_removes_partial_upload_on_disconnect(tmp_path: Path) -> None:
+    destination = tmp_path / "tile.jpg"
+    body = _multipart(("csrf_token", _csrf_token(), None), ("name", "Ash", None), ("photo", b"x" * 200_000, "t.jpg"))
+    request = _disconnecting_request(body, 100_000)
+
+    async def upload() -> None:
+        await TileForm.from_stream(request, uploads={"photo": lambda upload: FileSink(destination)})
+
+    with pytest.raises(ClientDisconnect):
+        anyio.run(upload)
+    assert not destination.exists()
+
+
+class FailingSink(FileSink):
+    async def write(self, data: bytes) -> None:
+        await super().write(data)
+        msg = "disk full"
+        raise OSError(msg)
+
+
+def test_from_stream_removes_partial_upload_when_sink_fails(tmp_path: Path) -> None:
+    destination = tmp_path / "tile.jpg"
+    client, _ = _client(TileForm, uploads={"photo": lambda upload: FailingSink(destination)})
+
+    body = _multipart(("csrf_token", _csrf_token(), None), ("name", "Ash", None), ("photo", b"x" * 1000, "t.jpg"))
+    with pytest.raises(OSError, match="disk full"):
+        _post(client, body)
+    assert not destination.exists()
+
+
+def test_from_stream_rejects_unexpected_file() -> None:
+    client, seen = _client()
+
+    body = _multipart(("csrf_token", _csrf_token(), None), ("photo", b"x", "t.jpg"))
+    _post(client, body)
+
+    assert seen["form"].errors == [
+        {"type": "value_error", "loc": ("photo",), "msg": "Unexpected file.", "input": "t.jpg"}
+    ]
+
+
+def test_from_stream_malformed_body_is_bad_request() -> None:
+    client, _ = _client()
+
+    response = client.post(
+        "/glazes",
+        content=b"--glaze-boundary\r\nContent-Type: text/plain\r\n\r\nno disposition\r\n--glaze-boundary--\r\n",
+        headers={"content-type": f"multipart/form-data; boundary={BOUNDARY}"},
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,70 @@
+"""Tests that `import air` stays lean for production workers."""
+
+import subprocess
+import sys
+
+import pytest
+
+# Dev tooling and optional subsystems that must load on first use, never on `import air`.
+LAZY_MODULES = (
+    "jinja2",
+    "lxml",
+    "minify_html",
+    "nh3",
+    "pygments",
+    "rich",
+    "selectolax",
+    "staticware",
+    "webbrowser",
+)
+
+
+def _modules_loaded_after(code: str) -> set[str]:
+    """Run *code* in a fresh interpreter and return the top-level modules it loaded.
+
+    Returns:
+        The set of top-level module names present in ``sys.modules``.
+    """
+    script = f"{code}\nimport sys\nprint('\\n'.join(sorted({{m.split('.')[0] for m in sys.modules}})))"
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+def test_import_air_does_not_load_optional_subsystems() -> None:
+    loaded = _modules_loaded_after("import air")
+
+    assert "air" in loaded
+    assert loaded.isdisjoint(LAZY_MODULES), sorted(loaded.intersection(LAZY_MODULES))
+
+
+def test_creating_an_app_does_not_load_jinja() -> None:
+    loaded = _modules_loaded_after("import air\napp = air.Air()\napp.page(lambda: air.H1('hi'))")
+
+    assert "jinja2" not in loaded
+
+
+@pytest.mark.parametrize(
+    ("code", "module"),
+    [
+        ("import air; air.JinjaRenderer", "jinja2"),
+        ("import air; air.Air().jinja", "jinja2"),
+        ("import air; air.HashedStatic", "staticware"),
+        ("import air; air.Div('x').pretty_render()", "lxml"),
+        ("import air; air.Div('x').compact_render()", "minify_html"),
+        ("import air; air.Div.from_html('<div>x</div>')", "selectolax"),
+        ("import air; air.Div('x').to_pretty_dict()", "rich"),
+    ],
+)
+def test_optional_subsystems_load_on_first_use(code: str, module: str) -> None:
+    assert module in _modules_loaded_after(code)
+
+
+def test_lazy_attributes_resolve() -> None:
+    import air  # noqa: PLC0415
+    from air.templating import JinjaRenderer, Renderer  # noqa: PLC0415
+
+    assert air.JinjaRenderer is JinjaRenderer
+    assert air.Renderer is Renderer
+    assert isinstance(air.__version__, str)
+    with pytest.raises(AttributeError, match="no attribute 'DoesNotExist'"):
+        _ = air.DoesNotExist
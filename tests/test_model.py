@@ -8,15 +8,28 @@ in-memory model behavior.
 
 from __future__ import annotations
 
+import re
+import sqlite3
+from contextlib import aclosing, asynccontextmanager
 from datetime import datetime
+from operator import itemgetter
+from typing import TYPE_CHECKING
 from uuid import UUID
 
 import pytest
+from fastapi.testclient import TestClient
+from starlette.responses import StreamingResponse  # noqa: TC002 (FastAPI reads route annotations at runtime)
 
+import air
+from air import JinjaRenderer
 from air.field import AirField, PrimaryKey
-from air.model import AirDB, AirModel, MultipleObjectsReturned
+from air.model import AirDB, AirModel, InvalidCursor, MultipleObjectsReturned
 from air.model.main import _PY_TO_PG, _pg_type, _table_registry  # noqa: PLC2701
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, AsyncIterator, Iterable, Iterator
+    from pathlib import Path
+
 # ---------------------------------------------------------------------------
 # Helpers: define models used across tests
 # ---------------------------------------------------------------------------
@@ -1803,3 +1816,451 @@ class TestSaveUpdateFields:
                 await fruit.save(update_fields=[])
         finally:
             self._unwire_pool()
+
+
+# ---------------------------------------------------------------------------
+# Per-model metadata and statement cache
+# ---------------------------------------------------------------------------
+
+
+class TestStatementCache:
+    """SQL is built once per call shape and reused verbatim afterwards."""
+
+    def test_metadata_computed_at_class_creation(self) -> None:
+        meta = DragonFruit._air_meta
+        assert meta.table == "tests_dragon_fruit"
+        assert meta.pk == "id"
+        assert meta.non_pk == ("created_at", "name", "color", "sweetness", "origin")
+
+    async def test_same_shape_reuses_statement(self) -> None:
+        pool = CRUDPool(fetch_return=[_DRAGON_ROW])
+        _wire_pool(pool)
+        try:
+            await DragonFruit.filter(color="magenta", sweetness__isnull=False, order_by="-name")
+            first = pool.last_sql
+            await DragonFruit.filter(color="yellow", sweetness__isnull=False, order_by="-name")
+            assert pool.last_sql is first
+            assert pool.last_args == ("yellow",)
+
+            await DragonFruit.filter(color="yellow", sweetness__isnull=True, order_by="-name")
+            assert pool.last_sql is not first
+            assert pool.last_sql is not None
+            assert '"sweetness" IS NULL' in pool.last_sql
+        finally:
+            _unwire_pool()
+
+    async def test_limit_and_offset_are_bound_parameters(self) -> None:
+        pool = CRUDPool(fetch_return=[])
+        _wire_pool(pool)
+        try:
+            await DragonFruit.filter(color="magenta", order_by="name", limit=10, offset=20)
+            first = pool.last_sql
+            assert first == (
+                'SELECT * FROM "tests_dragon_fruit" WHERE "color" = $1 ORDER BY "name" ASC LIMIT $2 OFFSET $3'
+            )
+            assert pool.last_args == ("magenta", 10, 20)
+
+            await DragonFruit.filter(color="magenta", order_by="name", limit=10, offset=30)
+            assert pool.last_sql is first
+
+            await DragonFruit.all(offset=5)
+            assert pool.last_sql == 'SELECT * FROM "tests_dragon_fruit" OFFSET $1'
+            assert pool.last_args == (5,)
+        finally:
+            _unwire_pool()
+
+    async def test_cache_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("air.model.main.SQL_CACHE_SIZE", 2)
+        pool = CRUDPool(fetchval_return=0)
+        _wire_pool(pool)
+        try:
+            for column in ("name", "color", "origin"):
+                await UbePancake.count(**{column: "x"})
+            assert len(UbePancake._air_meta.statements) <= 2
+        finally:
+            _unwire_pool()
+            UbePancake._air_meta.statements.clear()
+
+
+# ---------------------------------------------------------------------------
+# Trusted row hydration
+# ---------------------------------------------------------------------------
+
+
+class TrustedKiln(AirModel):
+    trusted_rows = True
+
+    id: int | None = AirField(default=None, primary_key=True)
+    name: str
+    cone: int = 10
+    serviced: datetime = AirField(default_factory=datetime.now)
+
+
+class TestTrustedRows:
+    """trusted=True builds instances from rows without re-validating them."""
+
+    async def test_trusted_matches_validated(self) -> None:
+        pool = CRUDPool(fetch_return=[_DRAGON_ROW, _DRAGON_ROW_2])
+        _wire_pool(pool)
+        try:
+            validated = await DragonFruit.filter(color__in=["magenta", "yellow"])
+            trusted = await DragonFruit.filter(color__in=["magenta", "yellow"], trusted=True)
+        finally:
+            _unwire_pool()
+        assert trusted == validated
+        assert trusted[0].model_fields_set == validated[0].model_fields_set
+
+    async def test_trusted_skips_validation(self) -> None:
+        pool = CRUDPool(fetch_return=[{**_DRAGON_ROW, "name": 42}])
+        _wire_pool(pool)
+        try:
+            [fruit] = await DragonFruit.all(trusted=True)
+            with pytest.raises(ValueError, match="valid string"):
+                await DragonFruit.all()
+        finally:
+            _unwire_pool()
+        assert fruit.name == 42
+
+    async def test_model_default_and_per_query_override(self) -> None:
+        pool = CRUDPool(fetch_return=[{"id": 1, "name": "Anagama", "cone": "11"}])
+        _wire_pool(pool)
+        try:
+            trusted = await TrustedKiln.get(id=1)
+            validated = await TrustedKiln.get(id=1, trusted=False)
+        finally:
+            _unwire_pool()
+        assert trusted is not None
+        assert validated is not None
+        assert trusted.cone == "11"
+        assert validated.cone == 11
+
+    async def test_missing_columns_get_defaults_and_extra_columns_are_ignored(self) -> None:
+        pool = CRUDPool(
+            fetch_return=[{"id": 1, "legacy": "x", "name": "Noborigama"}, {"id": 2, "legacy": "y", "name": "Catenary"}]
+        )
+        _wire_pool(pool)
+        try:
+            first, second = await TrustedKiln.filter(name__icontains="a")
+        finally:
+            _unwire_pool()
+        assert (first.id, first.name, first.cone) == (1, "Noborigama", 10)
+        assert isinstance(first.serviced, datetime)
+        assert not hasattr(first, "legacy")
+        assert first.model_fields_set == {"id", "name"}
+        first.cone = 12
+        assert "cone" not in second.model_fields_set
+
+    async def test_bulk_create_trusted(self) -> None:
+        serviced = datetime(2026, 5, 1)
+        pool = CRUDPool(fetch_return=[{"id": 7, "name": "Train", "cone": 12, "serviced": serviced}])
+        _wire_pool(pool)
+        try:
+            [kiln] = await TrustedKiln.bulk_create([{"name": "Train", "cone": 12}])
+        finally:
+            _unwire_pool()
+        assert kiln == TrustedKiln(id=7, name="Train", cone=12, serviced=serviced)
+
+
+# ---------------------------------------------------------------------------
+# stream() -- server-side cursors
+# ---------------------------------------------------------------------------
+
+
+class CursorConnection(FakeConnection):
+    """FakeConnection whose cursor() yields rows and records how it was opened."""
+
+    def __init__(self, rows: list[dict[str, object]]) -> None:
+        super().__init__()
+        self.rows = rows
+        self.cursor_calls: list[tuple[str, tuple[object, ...], int]] = []
+        self.fetched = 0
+
+    async def _cursor(self) -> AsyncIterator[dict[str, object]]:
+        for row in self.rows:
+            self.fetched += 1
+            yield row
+
+    def cursor(self, sql: str, *args: object, prefetch: int) -> AsyncIterator[dict[str, object]]:
+        self.cursor_calls.append((sql, args, prefetch))
+        return self._cursor()
+
+
+class TestStream:
+    """Model.stream() iterates a cursor inside a transaction instead of fetching a list."""
+
+    async def test_stream_outside_transaction_uses_own_transaction(self) -> None:
+        conn = CursorConnection([_DRAGON_ROW, _DRAGON_ROW_2])
+        pool = TransactionPool(conn)
+        _wire_pool(pool)
+        try:
+            fruits = [fruit async for fruit in DragonFruit.stream(color__in=["magenta", "yellow"], order_by="id")]
+        finally:
+            _unwire_pool()
+        assert [fruit.name for fruit in fruits] == ["Pink Pitaya", "Yellow Dragon"]
+        assert conn.cursor_calls == [
+            (
+                'SELECT * FROM "tests_dragon_fruit" WHERE "color" = ANY($1) ORDER BY "id" ASC',
+                (["magenta", "yellow"],),
+                500,
+            )
+        ]
+        assert pool.acquire_called
+        assert conn.transaction().committed
+
+    async def test_stream_stopped_early_rolls_back(self) -> None:
+        conn = CursorConnection([_DRAGON_ROW, _DRAGON_ROW_2])
+        _wire_pool(TransactionPool(conn))
+        try:
+            async with aclosing(DragonFruit.stream(prefetch=1)) as fruits:
+                async for _ in fruits:
+                    break
+        finally:
+            _unwire_pool()
+        assert conn.fetched == 1
+        assert conn.cursor_calls[0][2] == 1
+        assert conn.transaction().rolled_back
+        assert not conn.transaction().committed
+
+    async def test_stream_inside_transaction_reuses_connection(self) -> None:
+        conn = CursorConnection([_DRAGON_ROW])
+        db = AirDB()
+        db.connect(TransactionPool(conn))
+        try:
+            async with db.transaction():
+                [fruit] = [fruit async for fruit in DragonFruit.stream(trusted=True)]
+        finally:
+            db.disconnect()
+        assert fruit == DragonFruit.model_validate(_DRAGON_ROW)
+        assert conn.transaction().committed
+
+    def test_stream_renders_through_jinja_stream(self, tmp_path: Path) -> None:
+        (tmp_path / "fruits.html").write_text("<ul>{% for fruit in fruits %}<li>{{ fruit.name }}</li>{% endfor %}</ul>")
+        jinja = JinjaRenderer(str(tmp_path))
+        app = air.Air()
+
+        @app.get("/fruits")
+        async def fruits(request: air.Request) -> StreamingResponse:
+            return jinja.stream(request, "fruits.html", fruits=DragonFruit.stream(order_by="name"))
+
+        conn = CursorConnection([_DRAGON_ROW, _DRAGON_ROW_2])
+        _wire_pool(TransactionPool(conn))
+        try:
+            response = TestClient(app).get("/fruits")
+        finally:
+            _unwire_pool()
+        assert response.text == "<ul><li>Pink Pitaya</li><li>Yellow Dragon</li></ul>"
+
+
+# ---------------------------------------------------------------------------
+# paginate() -- keyset pagination
+# ---------------------------------------------------------------------------
+
+
+class SqlitePool:
+    """Runs the generated SQL on an in-memory SQLite database.
+
+    SQLite understands the same quoted identifiers and row-value
+    comparisons, and ``?NNN`` stands in for asyncpg's ``$NNN``.
+    """
+
+    def __init__(self, create_sql: str, rows: list[tuple[object, ...]]) -> None:
+        self.db = sqlite3.connect(":memory:", isolation_level=None)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute(create_sql)
+        if rows:
+            placeholders = ", ".join("?" * len(rows[0]))
+            self.db.executemany(f"INSERT INTO tests_test_tile VALUES ({placeholders})", rows)
+        self.last_sql = ""
+        self.statements: list[tuple[str, int]] = []
+        self.transactions = 0
+
+    async def fetch(self, sql: str, *args: object) -> list[sqlite3.Row]:
+        self.last_sql = sql
+        self.statements.append((sql, len(args)))
+        return self.db.execute(re.sub(r"\$(\d+)", r"?\1", sql), args).fetchall()
+
+    async def copy_records_to_table(
+        self, table_name: str, *, records: Iterable[tuple[object, ...]], columns: list[str]
+    ) -> str:
+        sql = f'INSERT INTO "{table_name}" ({", ".join(columns)}) VALUES ({", ".join("?" * len(columns))})'
+        self.statements.append(("COPY", len(columns)))
+        return f"COPY {self.db.executemany(sql, records).rowcount}"
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncGenerator[SqlitePool]:
+        yield self
+
+    def transaction(self) -> SqliteTransaction:
+        self.transactions += 1
+        return SqliteTransaction(self.db)
+
+
+class SqliteTransaction:
+    def __init__(self, db: sqlite3.Connection) -> None:
+        self.db = db
+
+    async def start(self) -> None:
+        self.db.execute("BEGIN")
+
+    async def commit(self) -> None:
+        self.db.execute("COMMIT")
+
+    async def rollback(self) -> None:
+        self.db.execute("ROLLBACK")
+
+
+class TestTile(AirModel):
+    __test__ = False
+
+    id: int | None = AirField(default=None, primary_key=True)
+    glaze: str
+    cone: int
+
+
+_TILES = [(n, ("celadon", "shino", "tenmoku")[n % 3], n % 4) for n in range(1, 24)]
+
+
+class TestPaginate:
+    """paginate() seeks past the previous page instead of using OFFSET."""
+
+    @pytest.fixture
+    def pool(self) -> Iterator[SqlitePool]:
+        pool = SqlitePool("CREATE TABLE tests_test_tile (id INTEGER PRIMARY KEY, glaze TEXT, cone INTEGER)", _TILES)
+        _wire_pool(pool)
+        yield pool
+        _unwire_pool()
+        pool.db.close()
+
+    async def _all_pages(self, **options: object) -> list[list[int]]:
+        pages: list[list[int]] = []
+        cursor = None
+        while True:
+            page = await TestTile.paginate(after=cursor, page_size=5, **options)
+            pages.append([tile.id for tile in page.items])
+            if not page.has_next:
+                return pages
+            cursor = page.next_cursor
+
+    async def test_pages_cover_every_row_once_in_order(self, pool: SqlitePool) -> None:
+        pages = await self._all_pages(order_by="cone")
+
+        expected = [tile[0] for tile in sorted(_TILES, key=itemgetter(2, 0))]
+        assert [tile for page in pages for tile in page] == expected
+        assert [len(page) for page in pages] == [5, 5, 5, 5, 3]
+        assert "OFFSET" not in pool.last_sql
+        assert pool.last_sql == (
+            'SELECT * FROM "tests_test_tile" WHERE ("cone", "id") > ($1, $2) ORDER BY "cone" ASC, "id" ASC LIMIT $3'
+        )
+
+    async def test_mixed_directions_and_filters(self, pool: SqlitePool) -> None:
+        pages = await self._all_pages(order_by=["-cone", "glaze"], glaze__gt="celadon")
+
+        tiles = [tile for tile in _TILES if tile[1] in {"shino", "tenmoku"}]
+        expected = [tile[0] for tile in sorted(tiles, key=lambda tile: (-tile[2], tile[1], tile[0]))]
+        assert [tile for page in pages for tile in page] == expected
+        assert '("cone" < $2) OR ("cone" = $2 AND "glaze" > $3) OR' in pool.last_sql
+
+    async def test_cursor_is_url_safe(self, pool: SqlitePool) -> None:
+        page = await TestTile.paginate(order_by="-glaze", page_size=2)
+
+        assert page.next_cursor is not None
+        assert re.fullmatch(r"[A-Za-z0-9_-]+", page.next_cursor)
+
+    async def test_invalid_cursor_and_order(self, pool: SqlitePool) -> None:
+        with pytest.raises(InvalidCursor, match="Invalid pagination cursor"):
+            await TestTile.paginate(after="not a cursor!")
+        first = await TestTile.paginate(order_by="glaze", page_size=2)
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            await TestTile.paginate(after=first.next_cursor, order_by="cone")
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            await TestTile.paginate(after=first.next_cursor, order_by="-glaze")
+        with pytest.raises(ValueError, match="no field 'kiln'"):
+            await TestTile.paginate(order_by="kiln")
+
+    async def test_requires_primary_key(self) -> None:
+        with pytest.raises(ValueError, match="no primary_key field"):
+            await NoPKModel.paginate()
+
+    @pytest.mark.parametrize("page_size", [0, -1])
+    async def test_page_size_must_be_positive(self, pool: SqlitePool, page_size: int) -> None:
+        with pytest.raises(ValueError, match="page_size must be at least 1"):
+            await TestTile.paginate(page_size=page_size)
+
+
+class TestBulkCreateChunks:
+    """bulk_create() splits large and mixed inserts into statements that run as one transaction."""
+
+    @pytest.fixture
+    def pool(self) -> Iterator[SqlitePool]:
+        pool = SqlitePool(
+            "CREATE TABLE tests_test_tile"
+            " (id INTEGER PRIMARY KEY, glaze TEXT NOT NULL, cone INTEGER NOT NULL DEFAULT 6 CHECK (cone < 14))",
+            [],
+        )
+        _wire_pool(pool)
+        yield pool
+        _unwire_pool()
+        pool.db.close()
+
+    async def test_chunks_mixed_items_and_keeps_their_order(
+        self, pool: SqlitePool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("air.model.main.MAX_BIND_PARAMS", 4)
+        items = [{"glaze": f"tile {n}", "cone": n} if n < 3 or n > 4 else {"glaze": f"tile {n}"} for n in range(8)]
+
+        tiles = await TestTile.bulk_create(items)
+
+        assert [(tile.glaze, tile.cone) for tile in tiles] == [
+            (f"tile {n}", n if n < 3 or n > 4 else 6) for n in range(8)
+        ]
+        assert [args for _, args in pool.statements] == [4, 2, 2, 4, 2]
+        assert pool.transactions == 1
+        assert [tuple(row) for row in pool.db.execute("SELECT id, glaze FROM tests_test_tile ORDER BY id")] == [
+            (n + 1, f"tile {n}") for n in range(8)
+        ]
+
+    async def test_interleaved_columns_insert_in_input_order(self, pool: SqlitePool) -> None:
+        items = [{"glaze": f"tile {n}", "cone": n} if n % 2 else {"glaze": f"tile {n}"} for n in range(4)]
+
+        tiles = await TestTile.bulk_create(items)
+
+        assert [(tile.id, tile.glaze) for tile in tiles] == [(n + 1, f"tile {n}") for n in range(4)]
+        assert len(pool.statements) == 4
+
+    async def test_batch_size_caps_rows_per_statement(self, pool: SqlitePool) -> None:
+        tiles = await TestTile.bulk_create([{"glaze": "shino", "cone": 10}] * 5, batch_size=2)
+
+        assert [tile.id for tile in tiles] == [1, 2, 3, 4, 5]
+        assert [sql.count("), (") + 1 for sql, _ in pool.statements] == [2, 2, 1]
+
+    async def test_failing_chunk_rolls_back_every_chunk(self, pool: SqlitePool) -> None:
+        items = [{"glaze": "celadon", "cone": 10}] * 3 + [{"glaze": "too hot", "cone": 20}]
+
+        with pytest.raises(sqlite3.IntegrityError):
+            await TestTile.bulk_create(items, batch_size=2)
+
+        assert pool.db.execute("SELECT count(*) FROM tests_test_tile").fetchone()[0] == 0
+
+    async def test_returning_false_copies_records(self, pool: SqlitePool) -> None:
+        items = [{"glaze": "tenmoku", "cone": 9, "kiln": "anagama"}, {"cone": 4, "glaze": "oribe"}, {"glaze": "ash"}]
+
+        count = await TestTile.bulk_create(items, returning=False)
+
+        assert count == 3
+        assert pool.statements == [("COPY", 2), ("COPY", 1)]
+        assert [tuple(row) for row in pool.db.execute("SELECT glaze, cone FROM tests_test_tile ORDER BY id")] == [
+            ("tenmoku", 9),
+            ("oribe", 4),
+            ("ash", 6),
+        ]
+        assert await TestTile.bulk_create([], returning=False) == 0
+
+    async def test_single_statement_needs_no_transaction(self, pool: SqlitePool) -> None:
+        await TestTile.bulk_create([{"glaze": "shino", "cone": 10}])
+        await TestTile.bulk_create([{"glaze": "shino"}], returning=False)
+
+        assert pool.transactions == 0
+
+    async def test_item_without_columns(self, pool: SqlitePool) -> None:
+        with pytest.raises(ValueError, match="item 1 sets no columns"):
+            await TestTile.bulk_create([{"glaze": "shino"}, {"kiln": "anagama"}])
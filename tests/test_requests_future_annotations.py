@@ -6,9 +6,15 @@ to properly test the fix for string annotations.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from fastapi.testclient import TestClient
 
 import air
+import air.utils
+
+if TYPE_CHECKING:
+    import pytest
 
 
 def test_request_param_with_future_annotations() -> None:
@@ -71,3 +77,29 @@ def test_request_with_query_params() -> None:
     assert response.status_code == 200
     assert "Hello, Alice!" in response.text
     assert "no HTMX" in response.text
+
+
+def test_include_router_does_not_resolve_annotations_again(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Routes copied by include_router reuse the resolved signature of their endpoint."""
+    calls: list[object] = []
+    original_get_type_hints = air.utils.get_type_hints
+
+    def counting_get_type_hints(obj: object, **kwargs: object) -> dict[str, object]:
+        calls.append(obj)
+        return original_get_type_hints(obj, **kwargs)
+
+    monkeypatch.setattr(air.utils, "get_type_hints", counting_get_type_hints)
+
+    router = air.AirRouter()
+
+    @router.get("/greeting")
+    def greeting(request: air.Request, name: str = "World") -> air.P:
+        return air.P(f"Hello, {name}!")
+
+    app = air.Air()
+    app.include_router(router, prefix="/api")
+
+    assert len(calls) == 1
+    response = TestClient(app).get("/api/greeting?name=Alice")
+    assert response.status_code == 200
+    assert response.text == "<p>Hello, Alice!</p>"
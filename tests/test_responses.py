@@ -1,12 +1,15 @@
 from collections.abc import AsyncGenerator
-from typing import override
+from typing import Any, override
 
+import anyio
+import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
+from starlette.requests import ClientDisconnect
 
 import air
 from air import H1, AirResponse, Article, BaseTag, Div, Html, Main
-from air.responses import TagResponse
+from air.responses import SSE_PING, TagResponse, format_sse
 
 from .utils import clean_doc
 
@@ -287,6 +290,169 @@ def test_sse_response_bytes_content() -> None:
     assert response.text == "already encoded"
 
 
+async def _collect_sse(response: air.SSEResponse, *, write_delay: float = 0) -> list[bytes]:
+    """Drive an SSEResponse as an ASGI app and return the body of each send."""
+    bodies: list[bytes] = []
+
+    async def receive() -> dict[str, Any]:
+        await anyio.sleep_forever()
+        return {}
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.body" and message["body"]:
+            bodies.append(message["body"])
+            await anyio.sleep(write_delay)
+
+    scope = {"type": "http", "asgi": {"spec_version": "2.4"}}
+    await response(scope, receive, send)
+    return bodies
+
+
+def test_format_sse() -> None:
+    assert format_sse("a\nb") == b"event: message\ndata: a\ndata: b\n\n"
+    assert format_sse(air.P("x"), event=None, id="7", retry=500) == b"id: 7\nretry: 500\ndata: <p>x</p>\n\n"
+
+
+def test_sse_event_fields() -> None:
+    app = air.Air()
+
+    async def event_generator() -> AsyncGenerator[air.SSEEvent | str]:
+        yield air.SSEEvent(air.P("Hi"), event="greeting", id="1")
+        yield air.SSEEvent("Bye", id="2", retry=1000)
+        yield "plain"
+
+    @app.get("/sse-response")
+    async def sse_response() -> air.SSEResponse:
+        return air.SSEResponse(event_generator(), retry=3000)
+
+    client = TestClient(app)
+    response = client.get("/sse-response")
+
+    assert response.text == (
+        "retry: 3000\n\n"
+        "event: greeting\nid: 1\ndata: <p>Hi</p>\n\n"
+        "event: message\nid: 2\nretry: 1000\ndata: Bye\n\n"
+        "event: message\ndata: plain\n\n"
+    )
+
+
+def test_sse_response_custom_default_event() -> None:
+    app = air.Air()
+
+    async def event_generator() -> AsyncGenerator[str]:
+        yield "tick"
+
+    @app.get("/sse-response")
+    async def sse_response() -> air.SSEResponse:
+        return air.SSEResponse(event_generator(), event=None)
+
+    client = TestClient(app)
+
+    assert client.get("/sse-response").text == "data: tick\n\n"
+
+
+def test_sse_event_rejects_line_breaks() -> None:
+    with pytest.raises(ValueError, match="must not contain line breaks"):
+        air.SSEEvent("data", id="1\n2")
+
+
+def test_sse_response_rejects_empty_queue() -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        air.SSEResponse([], max_queue=0)
+
+
+@pytest.mark.asyncio
+async def test_sse_response_batches_queued_events() -> None:
+    async def event_generator() -> AsyncGenerator[str]:
+        for i in range(10):
+            yield str(i)
+
+    bodies = await _collect_sse(air.SSEResponse(event_generator()), write_delay=0.01)
+
+    assert len(bodies) < 10
+    assert b"".join(bodies) == b"".join(format_sse(i) for i in range(10))
+
+
+@pytest.mark.asyncio
+async def test_sse_response_max_batch() -> None:
+    async def event_generator() -> AsyncGenerator[str]:
+        for i in range(10):
+            yield str(i)
+
+    bodies = await _collect_sse(air.SSEResponse(event_generator(), max_batch=1), write_delay=0.01)
+
+    assert len(bodies) == 10
+
+
+@pytest.mark.asyncio
+async def test_sse_response_sends_heartbeats_when_idle() -> None:
+    async def event_generator() -> AsyncGenerator[str]:
+        yield "first"
+        await anyio.sleep(0.1)
+        yield "second"
+
+    bodies = await _collect_sse(air.SSEResponse(event_generator(), ping=0.02))
+
+    assert bodies[0] == format_sse("first")
+    assert bodies[-1] == format_sse("second")
+    assert SSE_PING in bodies
+
+
+@pytest.mark.asyncio
+async def test_sse_response_drop_policy() -> None:
+    async def event_generator() -> AsyncGenerator[str]:
+        for i in range(20):
+            yield str(i)
+
+    response = air.SSEResponse(event_generator(), max_queue=2, overflow="drop", max_batch=1)
+    bodies = await _collect_sse(response, write_delay=0.01)
+
+    assert response.dropped > 0
+    assert len(bodies) + response.dropped == 20
+
+
+@pytest.mark.asyncio
+async def test_sse_response_close_policy() -> None:
+    async def event_generator() -> AsyncGenerator[str]:
+        for i in range(20):
+            yield str(i)
+
+    response = air.SSEResponse(event_generator(), max_queue=2, overflow="close", max_batch=1)
+    bodies = await _collect_sse(response, write_delay=0.01)
+
+    assert 0 < len(bodies) < 20
+    assert response.dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_sse_response_propagates_generator_errors() -> None:
+    async def event_generator() -> AsyncGenerator[str]:
+        yield "ok"
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await _collect_sse(air.SSEResponse(event_generator()))
+
+
+@pytest.mark.asyncio
+async def test_sse_response_propagates_send_errors() -> None:
+    async def event_generator() -> AsyncGenerator[str]:
+        while True:
+            yield "tick"
+
+    async def receive() -> dict[str, Any]:
+        return {}
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.body":
+            raise OSError
+
+    scope = {"type": "http", "asgi": {"spec_version": "2.4"}}
+    with pytest.raises(ClientDisconnect):
+        await air.SSEResponse(event_generator())(scope, receive, send)
+
+
 def test_redirect_response() -> None:
     """Test the RedirectResponse class."""
     app = air.Air()
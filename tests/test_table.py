@@ -0,0 +1,262 @@
+"""Tests for air.table: AirTable columns, query push-down, and htmx fragments.
+
+A fake pool stands in for PostgreSQL; it records the SQL it receives
+and answers keyset-paginated queries by slicing an in-memory list.
+"""
+
+import re
+from datetime import datetime
+from html import unescape
+from typing import Annotated
+
+import pytest
+from fastapi.testclient import TestClient
+
+import air
+from air import AirField, AirTable
+from air.field import (
+    ColumnAlign,
+    ColumnWidth,
+    Compact,
+    DisplayFormat,
+    Filterable,
+    Grouped,
+    Hidden,
+    Priority,
+    Sortable,
+)
+from air.model import AirDB, AirModel
+
+
+class SeekingPool:
+    """Test double that serves pages of rows kept in primary-key order.
+
+    A keyset query resumes after the row whose id is bound last in the
+    seek condition; filters and sort direction are only recorded.
+    """
+
+    def __init__(self, rows: list[dict[str, object]]) -> None:
+        self.rows = rows
+        self.queries: list[tuple[str, tuple[object, ...]]] = []
+
+    async def fetch(self, sql: str, *args: object) -> list[dict[str, object]]:
+        self.queries.append((sql, args))
+        start = 0
+        seek = re.search(r'"id"\) [<>] \((?:\$\d+, )*\$(\d+)\)', sql)
+        if seek:
+            after_id = args[int(seek.group(1)) - 1]
+            start = next(i for i, row in enumerate(self.rows) if row["id"] == after_id) + 1
+        limit = args[-1]
+        assert isinstance(limit, int)
+        return self.rows[start : start + limit]
+
+
+class Kiln(AirModel):
+    id: int | None = AirField(default=None, primary_key=True)
+    name: Annotated[str, Sortable(default=True), Filterable("contains"), Grouped("Kiln")]
+    fuel: Annotated[str, Filterable("multi_select"), Grouped("Kiln")] = AirField(
+        choices=[("gas", "Gas"), ("wood", "Wood"), ("electric", "Electric")]
+    )
+    max_cone: Annotated[int, Sortable(descending=True), Filterable("range"), ColumnAlign("right")]
+    price: Annotated[float, DisplayFormat("currency"), ColumnWidth(weight=2), Priority(5)]
+    notes: Annotated[str, Compact(max_length=12)] = ""
+    serviced: Annotated[datetime, DisplayFormat("%Y-%m-%d")]
+    secret_code: Annotated[str, Hidden("table")] = ""
+
+
+class KilnTable(AirTable[Kiln]):
+    page_size = 2
+
+
+ROWS: list[dict[str, object]] = [
+    {
+        "id": n,
+        "name": f"Kiln {n}",
+        "fuel": ("gas", "wood", "electric")[n % 3],
+        "max_cone": n % 12,
+        "price": 1000.5 * n,
+        "notes": "Fires evenly from top to bottom" if n == 1 else "",
+        "serviced": datetime(2026, 1, n),
+        "secret_code": "xyzzy",
+    }
+    for n in range(1, 6)
+]
+
+
+@pytest.fixture
+def pool() -> object:
+    db = AirDB()
+    fake = SeekingPool(ROWS)
+    db.connect(fake)
+    yield fake
+    db.disconnect()
+
+
+def test_model_and_id_from_generic_parameter() -> None:
+    assert KilnTable.model is Kiln
+    assert KilnTable.table_id == "kiln-table"
+
+
+async def test_load_pushes_sort_filter_and_page_into_sql(pool: SeekingPool) -> None:
+    filters = {"name": ["kiln"], "max_cone__gte": ["3"], "fuel": ["gas", "wood"]}
+    first = await KilnTable.load(sort="-max_cone", filters=filters)
+
+    sql, args = pool.queries[-1]
+    assert sql.endswith('ORDER BY "max_cone" DESC, "id" DESC LIMIT $4')
+    assert args == ("kiln", ["gas", "wood"], 3, 3)
+    assert len(first.rows) == 2
+    assert first.next_cursor is not None
+
+    second = await KilnTable.load(after=first.next_cursor, sort="-max_cone", filters=filters)
+
+    sql, args = pool.queries[-1]
+    assert '("max_cone", "id") < ($4, $5)' in sql
+    assert "OFFSET" not in sql
+    assert args == ("kiln", ["gas", "wood"], 3, 2, 2, 3)
+    assert second.after == first.next_cursor
+
+
+async def test_load_ignores_unknown_sort_and_bad_filters(pool: SeekingPool) -> None:
+    table = await KilnTable.load(sort="secret_code", filters={"max_cone__lte": ["hot"], "secret_code": ["x"]})
+
+    sql, args = pool.queries[-1]
+    assert table.sort == "name"
+    assert 'ORDER BY "name" ASC' in sql
+    assert "WHERE" not in sql
+    assert args == (3,)
+
+
+async def test_last_page_has_no_loader(pool: SeekingPool) -> None:
+    pages = [await KilnTable.load()]
+    while pages[-1].next_cursor is not None:
+        pages.append(await KilnTable.load(after=pages[-1].next_cursor))
+
+    assert [[row.id for row in page.rows] for page in pages] == [[1, 2], [3, 4], [5]]
+    assert "kiln-table-more" not in pages[-1].render()
+
+
+async def test_mismatched_cursor_loads_first_page(pool: SeekingPool) -> None:
+    first = await KilnTable.load(sort="name")
+    table = await KilnTable.load(after=first.next_cursor, sort="max_cone")
+
+    assert table.after is None
+    assert [row.id for row in table.rows] == [1, 2]
+
+
+async def test_mismatched_cursor_loads_no_rows_for_the_loader(pool: SeekingPool) -> None:
+    first = await KilnTable.load(sort="name")
+    table = await KilnTable.load(after=first.next_cursor, sort="max_cone", fragment="rows")
+
+    assert table.rows == []
+    assert table.next_cursor is None
+    assert not table.render()
+
+
+async def test_other_pagination_errors_are_not_swallowed(pool: SeekingPool, monkeypatch: pytest.MonkeyPatch) -> None:
+    first = await KilnTable.load()
+
+    async def fail(**kwargs: object) -> None:
+        msg = "Cannot paginate past a NULL 'name'"
+        raise ValueError(msg)
+
+    monkeypatch.setattr(Kiln, "paginate", fail)
+    with pytest.raises(ValueError, match="NULL"):
+        await KilnTable.load(after=first.next_cursor, fragment="rows")
+
+
+def test_sortable_nullable_field_is_rejected() -> None:
+    class Firing(AirModel):
+        id: int | None = AirField(default=None, primary_key=True)
+        glazed: Annotated[datetime | None, Sortable()] = None
+
+    with pytest.raises(TypeError, match="Sortable field 'glazed' is nullable"):
+
+        class FiringTable(AirTable[Firing]):
+            pass
+
+
+async def test_render_columns_from_metadata(pool: SeekingPool) -> None:
+    html = (await KilnTable.load()).render()
+
+    headers = re.findall(r'<th scope="col"[^>]*>(?:<a [^>]*>)?([^<]+)', html)
+    assert headers == ["Price", "Id", "Name ▲", "Fuel", "Max Cone", "Notes", "Serviced"]
+    assert "Secret Code" not in html
+    assert "xyzzy" not in html
+    assert (
+        '<tr class="air-table-groups"><th colspan="2" scope="colgroup"></th><th colspan="2" scope="colgroup">Kiln</th>'
+        in html
+    )
+    assert '<col style="width: 25.0%">' in html
+    assert '<td style="text-align: right">1</td>' in html
+    assert "<td>$1,000.50</td>" in html
+    assert "<td>Wood</td>" in html
+    assert '<span title="Fires evenly from top to bottom">Fires evenl…</span>' in html
+    assert "<td>2026-01-01</td>" in html
+    assert '<tr id="kiln-table-row-1">' in html
+
+
+async def test_render_sort_links_and_filters_keep_state(pool: SeekingPool) -> None:
+    table = await KilnTable.load(sort="name", filters={"fuel": ["wood"], "name": ["k"]}, url="/kilns")
+    html = table.render()
+
+    assert 'aria-sort="ascending"' in html
+    assert 'href="/kilns?fuel=wood&amp;name=k&amp;sort=-name"' in html
+    assert 'href="/kilns?fuel=wood&amp;name=k&amp;sort=max_cone"' in html
+    assert '<option value="wood" selected>Wood</option>' in html
+    assert '<select name="fuel" aria-label="Fuel" multiple' in html
+    assert '<input type="search" name="name" value="k"' in html
+    assert '<input type="number" name="max_cone__gte" value=""' in html
+    assert '<input type="hidden" name="sort" value="name">' in html
+    assert 'hx-target="#kiln-table-body"' in html
+
+
+async def test_render_loader_row_requests_next_page(pool: SeekingPool) -> None:
+    html = (await KilnTable.load(filters={"name": ["kiln"]}, url="/kilns")).render_rows()
+
+    assert html.count("<tr id=") == 3
+    assert re.search(
+        r'<tr id="kiln-table-more" class="air-table-more" hx-get="/kilns\?name=kiln&amp;sort=name&amp;after=[\w-]+" '
+        r'hx-trigger="revealed" hx-swap="outerHTML">',
+        html,
+    )
+
+
+async def test_render_row(pool: SeekingPool) -> None:
+    table = await KilnTable.load()
+    row = table.render_row(table.rows[0])
+
+    assert row.startswith('<tr id="kiln-table-row-1"><td>$1,000.50</td><td>1</td><td>Kiln 1</td>')
+
+
+def test_from_request_returns_fragment_for_htmx(pool: SeekingPool) -> None:
+    app = air.Air()
+
+    @app.get("/kilns")
+    async def kilns(request: air.Request) -> KilnTable:
+        return await KilnTable.from_request(request)
+
+    client = TestClient(app)
+
+    full = client.get("/kilns?sort=-max_cone")
+    assert full.text.startswith('<table id="kiln-table" class="air-table">')
+    assert 'aria-sort="descending"' in full.text
+
+    loader = re.search(r'id="kiln-table-more" class="air-table-more" hx-get="([^"]+)"', client.get("/kilns").text)
+    assert loader
+    more = client.get(unescape(loader.group(1)), headers={"HX-Request": "true", "HX-Trigger": "kiln-table-more"})
+    assert more.text.startswith('<tr id="kiln-table-row-3">')
+    assert pool.queries[-1][1] == ("Kiln 2", 2, 3)
+
+    body = client.get("/kilns?name=3", headers={"HX-Request": "true", "HX-Target": "kiln-table-body"})
+    assert body.text.startswith('<tbody id="kiln-table-body">')
+    assert pool.queries[-1][1] == ("3", 3)
+
+    # A loader row can't be answered from page 1; those rows are already on screen
+    tampered = client.get("/kilns?after=garbage", headers={"HX-Request": "true", "HX-Trigger": "kiln-table-more"})
+    assert tampered.status_code == 200
+    assert not tampered.text
+
+
+def test_table_requires_model() -> None:
+    with pytest.raises(NotImplementedError):
+        AirTable([])
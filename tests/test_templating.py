@@ -1,8 +1,12 @@
+import copy
+import importlib
 import sys
 import types
 from pathlib import Path
+from typing import Any
 from unittest.mock import Mock
 
+import anyio
 import jinja2
 import pytest
 from fastapi import FastAPI
@@ -10,10 +14,16 @@ from fastapi.testclient import TestClient
 from full_match import match as full_match
 from jinja2 import FileSystemLoader
 from starlette.datastructures import URL
-from starlette.responses import HTMLResponse
+from starlette.responses import HTMLResponse, StreamingResponse
 
 import air
 from air import Air, JinjaRenderer, Request
+from air.templating import (
+    _jinja_context_item,  # noqa: PLC2701
+    compile_templates,
+    compiled_environment,
+    make_bytecode_cache,
+)
 
 from .components import index as index_callable
 from .utils import clean_doc, clean_doc_with_broken_lines
@@ -557,3 +567,351 @@ def test_air_jinja_exists_without_templates_directory(tmp_path: Path, monkeypatc
     app = Air()
 
     assert isinstance(app.jinja, JinjaRenderer)
+
+
+def test_air_jinja_bytecode_cache_is_opt_in(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    app = Air()
+
+    assert app.jinja.templates.env.bytecode_cache is None
+
+    app.jinja = JinjaRenderer("templates", bytecode_cache=tmp_path / "cache")
+    assert isinstance(app.jinja.templates.env.bytecode_cache, jinja2.FileSystemBytecodeCache)
+
+
+def test_renderer_requires_directory_or_env() -> None:
+    with pytest.raises(ValueError, match=r"template directory or a jinja2\.Environment"):
+        JinjaRenderer()
+
+
+def test_make_bytecode_cache_options(tmp_path: Path) -> None:
+    custom = jinja2.FileSystemBytecodeCache(str(tmp_path))
+
+    assert make_bytecode_cache(None) is None
+    assert make_bytecode_cache(option=False) is None
+    assert isinstance(make_bytecode_cache(option=True), jinja2.FileSystemBytecodeCache)
+    assert make_bytecode_cache(custom) is custom
+    cache = make_bytecode_cache(tmp_path / "nested" / "cache")
+    assert isinstance(cache, jinja2.FileSystemBytecodeCache)
+    assert (tmp_path / "nested" / "cache").is_dir()
+
+
+@pytest.mark.parametrize("renderer_class", [JinjaRenderer, air.Renderer])
+def test_renderer_bytecode_cache_is_reused(renderer_class: type, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    first = renderer_class("tests/templates", bytecode_cache=cache_dir)
+    first.templates.get_template("home.html")
+    cached_files = list(cache_dir.iterdir())
+
+    second = renderer_class("tests/templates", bytecode_cache=cache_dir)
+    template = second.templates.get_template("home.html")
+
+    assert len(cached_files) == 1
+    assert list(cache_dir.iterdir()) == cached_files
+    assert template.render(title="T", content="C") == "<html>\n  <title>T</title>\n  <h1>C</h1>\n</html>"
+
+
+@pytest.mark.parametrize("zip_output", [True, False])
+def test_compiled_templates_render_like_source(tmp_path: Path, *, zip_output: bool) -> None:
+    target = tmp_path / ("compiled.zip" if zip_output else "compiled")
+
+    names = compile_templates("tests/templates", target, zip=zip_output)
+    jinja = JinjaRenderer(env=compiled_environment(target))
+    source = JinjaRenderer("tests/templates")
+    request = Mock(spec=Request)
+
+    assert sorted(names) == ["home.html", "jinja_airtags.html", "lists_and_dicts.html"]
+    assert jinja(request, "home.html", title="<T>", content=air.P("C"), as_string=True) == source(
+        request, "home.html", title="<T>", content=air.P("C"), as_string=True
+    )
+
+
+def test_jinja_renderer_stream_matches_render() -> None:
+    app = Air()
+    jinja = JinjaRenderer(directory="tests/templates")
+
+    @app.page
+    def index(request: Request) -> HTMLResponse:
+        return jinja(request, "jinja_airtags.html", title="<T>", content=air.P("C"))
+
+    @app.get("/stream")
+    def stream(request: Request) -> StreamingResponse:
+        return jinja.stream(request, "jinja_airtags.html", title="<T>", content=air.P("C"))
+
+    client = TestClient(app)
+    expected = client.get("/")
+    response = client.get("/stream")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/html; charset=utf-8"
+    assert response.text == expected.text
+
+
+def test_jinja_renderer_stream_awaits_async_context() -> None:
+    env = jinja2.Environment(
+        loader=jinja2.DictLoader({"page.html": "{{ greeting }}|{{ card(who) }}|{{ value }}|{{ extra }}"}),
+        autoescape=True,
+    )
+    jinja = JinjaRenderer(env=env, context_processors=[lambda request: {"extra": "processed"}])
+
+    async def greeting() -> air.H1:
+        return air.H1("Hi")
+
+    async def card(name: str) -> air.P:
+        return air.P(name)
+
+    app = Air()
+
+    @app.get("/")
+    def index(request: Request) -> StreamingResponse:
+        return jinja.stream(request, "page.html", greeting=greeting(), card=card, who="<Ann>", value=1)
+
+    response = TestClient(app).get("/")
+
+    assert response.text == "<h1>Hi</h1>|<p>&lt;Ann&gt;</p>|1|processed"
+
+
+def test_jinja_renderer_stream_sends_output_before_slow_parts() -> None:
+    env = jinja2.Environment(loader=jinja2.DictLoader({"page.html": "<head></head>{{ slow() }}"}), autoescape=True)
+    jinja = JinjaRenderer(env=env)
+    release = anyio.Event()
+    chunks: list[bytes] = []
+
+    async def slow() -> air.Main:
+        await release.wait()
+        return air.Main("Done")
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.body" and message["body"]:
+            chunks.append(message["body"])
+            release.set()
+
+    async def main() -> None:
+        response = jinja.stream(Mock(spec=Request), "page.html", slow=slow)
+        await response.stream_response(send)
+
+    anyio.run(main)
+
+    assert chunks == [b"<head></head>", b"<main>Done</main>"]
+
+
+def test_jinja_renderer_stream_does_not_share_bytecode_cache(tmp_path: Path) -> None:
+    jinja = JinjaRenderer("tests/templates", bytecode_cache=tmp_path)
+
+    assert jinja.templates.env.bytecode_cache is not None
+    assert jinja.async_env.bytecode_cache is None
+    assert jinja.async_env.is_async
+    assert jinja.async_env is jinja.async_env
+
+
+def test_jinja_renderer_render_to_string_matches_response_body() -> None:
+    jinja = JinjaRenderer(directory="tests/templates", context_processors=[lambda request: {"title": "From processor"}])
+    request = Mock(spec=Request)
+
+    result = jinja.render_to_string(request, "jinja_airtags.html", content=air.P("Body"))
+    response = jinja(request, "jinja_airtags.html", content=air.P("Body"))
+
+    assert isinstance(result, air.SafeStr)
+    assert result == response.body.decode()
+    assert "<h1>From processor</h1>" in result
+    assert jinja(request, "jinja_airtags.html", content=air.P("Body"), as_string=True) == result
+
+
+def test_jinja_renderer_as_string_skips_template_response(monkeypatch: pytest.MonkeyPatch) -> None:
+    jinja = JinjaRenderer(directory="tests/templates")
+    monkeypatch.setattr(jinja.templates, "TemplateResponse", Mock(side_effect=AssertionError))
+
+    result = jinja(Mock(spec=Request), "home.html", title="T", content="C", as_string=True)
+
+    assert result == "<html>\n  <title>T</title>\n  <h1>C</h1>\n</html>"
+
+
+class CountingDiv(air.Div):
+    renders = 0
+
+    def __str__(self) -> str:
+        CountingDiv.renders += 1
+        return super().__str__()
+
+
+def test_jinja_renderer_renders_tags_lazily() -> None:
+    CountingDiv.renders = 0
+    env = jinja2.Environment(
+        loader=jinja2.DictLoader({"page.html": "{% if show %}{{ extra }}{% endif %}{{ shown }}{{ shown|safe }}"}),
+        autoescape=True,
+    )
+    jinja = JinjaRenderer(env=env)
+
+    result = jinja.render_to_string(
+        Mock(spec=Request), "page.html", show=False, extra=CountingDiv("Hidden"), shown=CountingDiv("Seen")
+    )
+
+    assert result == "<countingdiv>Seen</countingdiv>" * 2
+    assert CountingDiv.renders == 1
+
+
+def test_renderer_renders_tags_lazily() -> None:
+    CountingDiv.renders = 0
+    env = jinja2.Environment(loader=jinja2.DictLoader({"page.html": "{% if show %}{{ extra }}{% endif %}"}))
+    render = air.Renderer(env=env)
+
+    response = render("page.html", context={"show": False, "extra": CountingDiv("Hidden")})
+
+    assert response.body == b""
+    assert CountingDiv.renders == 0
+
+
+@pytest.mark.parametrize(
+    ("source", "expected"),
+    [
+        ("{{ 'Kiln' in tag }}", "True"),
+        ("{{ tag[:5] }}", "&lt;div&gt;"),
+        ("{{ tag|upper }}", "&lt;DIV&gt;KILN&lt;/DIV&gt;"),
+        ("{{ tag|replace('Kiln', 'Glaze') }}", "&lt;div&gt;Glaze&lt;/div&gt;"),
+        ("{{ tag|length }}", "15"),
+        ("{{ tag.startswith('<div>') }}", "True"),
+        ("{{ tag == '<div>Kiln</div>' }}", "True"),
+        ("{{ tag ~ '!' }}", "&lt;div&gt;Kiln&lt;/div&gt;!"),
+        ("{% if tag %}yes{% endif %}", "yes"),
+        ("{{ tag|list|first }}", "&lt;"),
+    ],
+)
+def test_lazy_tags_behave_like_strings(source: str, expected: str) -> None:
+    env = jinja2.Environment(loader=jinja2.DictLoader({"page.html": source}), autoescape=True)
+    jinja = JinjaRenderer(env=env)
+
+    assert jinja.render_to_string(Mock(spec=Request), "page.html", tag=air.Div("Kiln")) == expected
+
+
+def test_lazy_tag_is_hashable_like_its_html() -> None:
+    lazy = _jinja_context_item(air.P("x"))
+
+    assert {lazy: 1}["<p>x</p>"] == 1
+    assert lazy + "!" == "<p>x</p>!"
+    assert "!" + lazy == "!<p>x</p>"
+    assert lazy < "<q>"
+    assert copy.copy(lazy) == "<p>x</p>"
+
+
+def test_renderer_caches_resolved_tag_callables(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = types.ModuleType("tests.cached_components")
+    module.card = lambda title: f"<p>{title}</p>"
+    monkeypatch.setitem(sys.modules, "tests.cached_components", module)
+    render = air.Renderer(directory="tests/templates", package="tests")
+
+    assert render("cached_components.card", title="One") == "<p>One</p>"
+    monkeypatch.setattr(importlib, "import_module", Mock(side_effect=AssertionError("imported again")))
+
+    assert render("cached_components.card", title="Two") == "<p>Two</p>"
+    assert air.Renderer(package="tests", env=jinja2.Environment())("cached_components.card", title="3") == "<p>3</p>"
+
+
+def test_renderer_callable_cache_follows_reloads(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = types.ModuleType("tests.reloaded_components")
+    module.card = lambda title: f"<p>{title}</p>"
+    monkeypatch.setitem(sys.modules, "tests.reloaded_components", module)
+    render = air.Renderer(directory="tests/templates", package="tests")
+    assert render("reloaded_components.card", title="Old") == "<p>Old</p>"
+
+    module.card = lambda title: f"<h2>{title}</h2>"
+    assert render("reloaded_components.card", title="Rebound") == "<h2>Rebound</h2>"
+
+    replacement = types.ModuleType("tests.reloaded_components")
+    replacement.card = lambda title: f"<h3>{title}</h3>"
+    monkeypatch.setitem(sys.modules, "tests.reloaded_components", replacement)
+    assert render("reloaded_components.card", title="Replaced") == "<h3>Replaced</h3>"
+
+
+FRAGMENT_TEMPLATES = {
+    "base.html": "<html><nav>{{ nav() }}</nav>{% block content %}{% endblock %}</html>",
+    "page.html": (
+        '{% extends "base.html" %}{% block content %}<main id="content">{{ title }}'
+        '{% block sidebar %}<aside id="sidebar">{{ user }}</aside>{% endblock %}</main>{% endblock %}'
+    ),
+}
+
+
+def _fragment_app(**render_kwargs: Any) -> tuple[TestClient, Mock]:
+    nav = Mock(return_value="Menu")
+    jinja = JinjaRenderer(
+        env=jinja2.Environment(loader=jinja2.DictLoader(FRAGMENT_TEMPLATES), autoescape=True),
+        context_processors=[lambda request: {"user": "Ann"}],
+    )
+    app = Air()
+
+    @app.page
+    def index(request: Request) -> HTMLResponse:
+        return jinja(request, "page.html", title="Title", nav=nav, **render_kwargs)
+
+    return TestClient(app), nav
+
+
+def test_jinja_renderer_block_renders_full_page_without_htmx() -> None:
+    client, nav = _fragment_app(block="content")
+
+    response = client.get("/")
+
+    assert response.text == '<html><nav>Menu</nav><main id="content">Title<aside id="sidebar">Ann</aside></main></html>'
+    assert response.headers["vary"] == "HX-Request, HX-Boosted, HX-Target, HX-History-Restore-Request"
+    nav.assert_called_once()
+
+
+def test_jinja_renderer_block_renders_only_the_block_for_htmx() -> None:
+    client, nav = _fragment_app(block="content")
+
+    response = client.get("/", headers={"HX-Request": "true"})
+
+    assert response.text == '<main id="content">Title<aside id="sidebar">Ann</aside></main>'
+    assert response.headers["vary"] == "HX-Request, HX-Boosted, HX-Target, HX-History-Restore-Request"
+    nav.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({"HX-Request": "true", "HX-Target": "sidebar"}, '<aside id="sidebar">Ann</aside>'),
+        (
+            {"HX-Request": "true", "HX-Target": "content"},
+            '<main id="content">Title<aside id="sidebar">Ann</aside></main>',
+        ),
+        ({"HX-Request": "true", "HX-Target": "missing"}, "<html><nav>Menu</nav>"),
+        ({"HX-Request": "true"}, "<html><nav>Menu</nav>"),
+        ({"HX-Request": "true", "HX-Boosted": "true", "HX-Target": "sidebar"}, "<html><nav>Menu</nav>"),
+        (
+            {"HX-Request": "true", "HX-History-Restore-Request": "true", "HX-Target": "sidebar"},
+            "<html><nav>Menu</nav>",
+        ),
+    ],
+)
+def test_jinja_renderer_block_from_hx_target(headers: dict[str, str], expected: str) -> None:
+    client, _ = _fragment_app(block=True)
+
+    response = client.get("/", headers=headers)
+
+    assert response.text.startswith(expected)
+
+
+def test_jinja_renderer_block_history_restore_gets_full_page() -> None:
+    client, nav = _fragment_app(block="content")
+
+    response = client.get("/", headers={"HX-Request": "true", "HX-History-Restore-Request": "true"})
+
+    assert response.text.startswith("<html><nav>Menu</nav>")
+    nav.assert_called_once()
+
+
+def test_jinja_renderer_block_as_string() -> None:
+    jinja = JinjaRenderer(env=jinja2.Environment(loader=jinja2.DictLoader(FRAGMENT_TEMPLATES), autoescape=True))
+    request = Request({"type": "http", "method": "GET", "path": "/", "headers": [(b"hx-request", b"true")]})
+
+    result = jinja(request, "page.html", title="T", user="U", nav=str, block="sidebar", as_string=True)
+
+    assert result == '<aside id="sidebar">U</aside>'
+
+
+def test_jinja_renderer_unknown_block_raises() -> None:
+    jinja = JinjaRenderer(env=jinja2.Environment(loader=jinja2.DictLoader(FRAGMENT_TEMPLATES)))
+    request = Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+
+    with pytest.raises(ValueError, match=full_match("Template 'page.html' has no block named 'footer'.")):
+        jinja(request, "page.html", block="footer")
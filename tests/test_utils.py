@@ -3,7 +3,7 @@ from collections.abc import Callable
 from functools import wraps
 from typing import Any
 
-from air.utils import cached_signature, cached_unwrap, compute_page_path
+from air.utils import cached_signature, cached_unwrap, compute_page_path, resolved_signature
 
 
 def test_compute_page_path_returns_root_for_index_endpoint() -> None:
@@ -131,3 +131,26 @@ def test_cached_unwrap_multiple_decorators() -> None:
     # Should unwrap all layers to get to the original function
     assert unwrapped.__name__ == "multi_decorated"
     assert unwrapped() == "result"
+
+
+def test_resolved_signature_resolves_string_annotations() -> None:
+    """Test resolved_signature turns string annotations into real types."""
+
+    def stringly_typed(a: "int", b: "str" = "x") -> "bool":
+        return bool(a)
+
+    sig = resolved_signature(stringly_typed)
+
+    assert sig.parameters["a"].annotation is int
+    assert sig.parameters["b"].annotation is str
+    assert sig.parameters["b"].default == "x"
+    assert sig.return_annotation is bool
+
+
+def test_resolved_signature_is_cached() -> None:
+    """Test resolved_signature returns the same object on repeated calls."""
+
+    def sample_func(a: int) -> None:
+        pass
+
+    assert resolved_signature(sample_func) is resolved_signature(sample_func)
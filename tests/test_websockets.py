@@ -0,0 +1,170 @@
+from collections.abc import AsyncGenerator
+from typing import Annotated
+
+import pytest
+from fastapi import Depends
+from fastapi.testclient import TestClient
+
+import air
+
+
+def test_websocket_sends_tags() -> None:
+    app = air.Air()
+
+    @app.websocket("/ws")
+    async def ws(websocket: air.WebSocket) -> None:
+        assert isinstance(websocket, air.AirWebSocket)
+        await websocket.accept()
+        message = await websocket.receive_json()
+        await websocket.send_tag(air.Div(message["text"], id="echo"))
+        await websocket.close()
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws") as connection:
+        connection.send_json({"text": "hi", "HEADERS": {"HX-Request": "true"}})
+
+        assert connection.receive_text() == '<div id="echo">hi</div>'
+
+
+def test_websocket_queue_and_flush_send_one_frame() -> None:
+    app = air.Air()
+
+    @app.websocket("/ws")
+    async def ws(websocket: air.WebSocket) -> None:
+        await websocket.accept()
+        websocket.queue(air.Div("a", id="a"), air.Div("b", id="b"))
+        assert websocket.buffered == 2
+        await websocket.flush()
+        assert websocket.buffered == 0
+        await websocket.flush()  # Nothing queued, nothing sent
+        await websocket.send_tag("done")
+        await websocket.close()
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws") as connection:
+        assert connection.receive_text() == '<div id="a">a</div><div id="b">b</div>'
+        assert connection.receive_text() == "done"
+
+
+def test_websocket_stream_tags_batches_sync_iterables() -> None:
+    app = air.Air()
+
+    @app.websocket("/ws")
+    async def ws(websocket: air.WebSocket) -> None:
+        await websocket.accept()
+        await websocket.stream_tags((air.Li(i) for i in range(5)), max_batch=2)
+        await websocket.close()
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws") as connection:
+        frames = [connection.receive_text() for _ in range(3)]
+
+    assert frames == ["<li>0</li><li>1</li>", "<li>2</li><li>3</li>", "<li>4</li>"]
+
+
+def test_websocket_stream_tags_async_iterables() -> None:
+    app = air.Air()
+
+    async def fragments() -> AsyncGenerator[air.Li]:
+        for i in range(5):
+            yield air.Li(i)
+
+    @app.websocket("/ws")
+    async def ws(websocket: air.WebSocket) -> None:
+        await websocket.accept()
+        await websocket.stream_tags(fragments(), max_batch=2)
+        await websocket.send_text("end")
+        await websocket.close()
+
+    client = TestClient(app)
+    received = ""
+    with client.websocket_connect("/ws") as connection:
+        while (frame := connection.receive_text()) != "end":
+            assert frame.count("<li>") <= 2
+            received += frame
+
+    assert received == "".join(f"<li>{i}</li>" for i in range(5))
+
+
+@pytest.mark.asyncio
+async def test_websocket_stream_tags_propagates_errors() -> None:
+    async def fragments() -> AsyncGenerator[str]:
+        yield "ok"
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    sent: list[str] = []
+
+    async def receive() -> dict[str, str]:
+        return {"type": "websocket.connect"}
+
+    async def send(message: dict[str, str]) -> None:
+        sent.append(message.get("text", ""))
+
+    websocket = air.WebSocket({"type": "websocket"}, receive, send)
+    await websocket.accept()
+    with pytest.raises(RuntimeError, match="boom"):
+        await websocket.stream_tags(fragments())
+
+
+def test_router_websocket_with_path_params_and_dependencies() -> None:
+    app = air.Air()
+    router = air.AirRouter()
+
+    def get_greeting() -> str:
+        return "Hello"
+
+    @router.websocket("/rooms/{room}", dependencies=[Depends(get_greeting)])
+    async def room(websocket: air.WebSocket, room: str, greeting: str = Depends(get_greeting)) -> None:
+        await websocket.accept()
+        await websocket.send_tag(air.P(f"{greeting}, {room}"))
+        await websocket.close()
+
+    app.include_router(router)
+    client = TestClient(app)
+    with client.websocket_connect(room.url(room="lobby")) as connection:
+        assert connection.receive_text() == "<p>Hello, lobby</p>"
+
+    assert room.url(room="lobby") == "/rooms/lobby"
+
+
+def test_websocket_accepted_by_dependency_keeps_its_state() -> None:
+    app = air.Air()
+    seen: list[object] = []
+
+    async def accepted(websocket: air.WebSocket) -> air.WebSocket:
+        await websocket.accept()
+        seen.append(websocket)
+        return websocket
+
+    @app.websocket("/ws")
+    async def ws(websocket: air.WebSocket, connection: Annotated[air.WebSocket, Depends(accepted)]) -> None:
+        await websocket.send_tag(air.P("hello", id="greeting"))
+        await websocket.send_text("bye")
+        await websocket.close()
+        assert websocket is connection is seen[0]
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws") as connection:
+        assert connection.receive_text() == '<p id="greeting">hello</p>'
+        assert connection.receive_text() == "bye"
+
+
+def test_websocket_disconnect_is_exported() -> None:
+    app = air.Air()
+    disconnected: list[int] = []
+
+    @app.websocket("/ws", name="socket")
+    async def ws(websocket: air.WebSocket) -> None:
+        await websocket.accept()
+        try:
+            await websocket.receive_text()
+        except air.WebSocketDisconnect as exc:
+            disconnected.append(exc.code)
+
+    client = TestClient(app)
+    with client.websocket_connect(ws.url()):
+        pass
+
+    assert disconnected == [1000]
+    assert app.url_path_for("socket") == "/ws"